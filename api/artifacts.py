@@ -0,0 +1,76 @@
+# Standard Libraries
+import os
+import json
+import time
+import pickle
+import hashlib
+import resource
+from pathlib import Path
+
+# Third-Party Libraries
+import joblib
+
+# Loading a Pickle or Joblib artifact
+# Joblib files are memory-mapped when mmap_mode is set, so their arrays are shared through the page cache
+def load_artifact(path, mmap_mode=None):
+    path = Path(path)
+    if path.suffix == ".joblib":
+        return joblib.load(path, mmap_mode=mmap_mode)
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+# Loading Pipeline and Model Frequency, timing how long it takes
+def load_models(pipe_path, model_freq_path, mmap_mode=None):
+    start = time.perf_counter()
+    pipe = load_artifact(pipe_path, mmap_mode=mmap_mode)
+    model_freq = load_artifact(model_freq_path)
+    return pipe, model_freq, time.perf_counter() - start
+
+# Identifying a set of artifact files and the Model Frequency, so cached predictions never outlive their model
+# Built from file paths, modification times and content (no per-process hash seed), so every worker reports the same version
+def artifact_version(paths, model_freq) -> str:
+    paths = [Path(path).resolve() for path in paths]
+    files = [(str(path), path.stat().st_mtime_ns if path.exists() else None) for path in paths]
+    content = json.dumps({"files": files, "model_freq": sorted(model_freq.items())}, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+# Every model artifact of one version (tiers, compiled engines, price index, drift baseline) with its load and warm-up times
+# Swapped as a single object, so a request never mixes the Pipeline of one version with the Model Frequency of another
+class ModelSet:
+    def __init__(self, pipe=None, model_freq=None, fast_pipe=None):
+        self.pipe = pipe
+        self.model_freq = model_freq
+        self.fast_pipe = fast_pipe
+        self.engine = None
+        self.fast_engine = None
+        self.price_index = None
+        self.brand_models = None
+        self.metadata = None
+        self.drift_baseline = None
+        self.version = None
+        self.loaded_at = None
+        self.load_seconds = None
+        self.warmup_seconds = None
+
+    def info(self) -> dict:
+        return {
+            "version": self.version,
+            "loaded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.loaded_at)) if self.loaded_at else None,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds
+        }
+
+# Resident (RSS) and Proportional (PSS) memory of the current process in MB
+# PSS splits shared pages between the processes using them, so it shows what preloading saves per worker
+def process_memory() -> dict:
+    memory = {"pid": os.getpid(), "rss_mb": None, "pss_mb": None}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                if key in ("Rss", "Pss"):
+                    memory[f"{key.lower()}_mb"] = round(int(value.split()[0]) / 1024, 1)
+    except OSError:
+        # Peak RSS is the best available figure without /proc
+        memory["rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return memory
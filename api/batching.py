@@ -0,0 +1,104 @@
+# Standard Libraries
+import time
+import asyncio
+import logging
+
+# Local Modules
+from api.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Coalescing concurrent single-row predictions into one batched call
+# Requests arriving within max_wait_ms of the first one (or up to max_batch_size) share a single predict_fn call.
+# Each row is submitted with the models it must be predicted by (the request's ModelSet), and rows are only batched
+# with rows of the same models, so a reload landing between submit and flush never answers with another version.
+class MicroBatcher:
+    def __init__(self, predict_fn, max_batch_size: int = 32, max_wait_ms: float = 3.0):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batch_size = Histogram([1, 2, 4, 8, 16, 32, 64, 128])
+        self.queue_wait = Histogram([0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1])
+        self._queue = None
+        self._loop = None
+        self._task = None
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Micro-batching enabled (max_batch_size={self.max_batch_size}, max_wait={self.max_wait*1000:g}ms)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # Queueing one row (a mapping of column → single-value list) and waiting for its prediction by models
+    async def submit(self, models, columns):
+        future = self._loop.create_future()
+        self._queue.put_nowait((models, columns, future, time.perf_counter()))
+        return await future
+
+    # Blocking entry point for sync endpoints running on the threadpool
+    def predict(self, models, columns, timeout: float = 30):
+        return asyncio.run_coroutine_threadsafe(self.submit(models, columns), self._loop).result(timeout)
+
+    async def _collect(self):
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            dispatched_at = time.perf_counter()
+            for _, _, _, queued_at in batch:
+                self.queue_wait.observe(dispatched_at - queued_at)
+
+            # One predict_fn call per version of the models (a single one unless a reload happened meanwhile)
+            groups = {}
+            for item in batch:
+                groups.setdefault(id(item[0]), []).append(item)
+            for group in groups.values():
+                await self._predict(group)
+
+    async def _predict(self, batch):
+        self.batch_size.observe(len(batch))
+        columns = {col: [] for col in batch[0][1]}
+        for _, row, _, _ in batch:
+            for col, values in row.items():
+                columns[col].extend(values)
+
+        try:
+            # Predicting off the event loop, so new requests keep queueing meanwhile
+            predictions = await asyncio.to_thread(self.predict_fn, batch[0][0], columns)
+        except Exception as e:
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future, _), prediction in zip(batch, predictions):
+            if not future.done():
+                future.set_result(prediction)
+
+    def stats(self) -> dict:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batch_size": self.batch_size.snapshot(),
+            "queue_wait_seconds": self.queue_wait.snapshot()
+        }
@@ -0,0 +1,74 @@
+# Standard Libraries
+import time
+import threading
+from collections import OrderedDict
+
+# Bounded LRU Cache with Time-To-Live for Prediction Results
+class PredictionCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    # Building a hashable key from the model tier and the validated Input fields
+    @staticmethod
+    def make_key(data, tier: str = "full") -> tuple:
+        return (tier, *data.model_dump(mode="json").values())
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    # A result computed with another model version (swapped while the request ran) is not stored
+    def set(self, key, value, version=None):
+        if not self.enabled:
+            return
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    # Dropping every cached result when a different Pipeline or Model Frequency is loaded
+    def set_version(self, version):
+        with self._lock:
+            if version != self.version:
+                self._data.clear()
+                self.version = version
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._data),
+                "max_size": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -1,7 +1,7 @@
 # Importing Libraries
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Literal, Optional
 from pydantic_settings import BaseSettings
 
 # Loading and Validating Environment Variables
@@ -11,6 +11,44 @@ class Settings(BaseSettings):
     PIPE_PATH: Path
     MODEL_FREQ_PATH: Path
     ALLOWED_ORIGINS: str
+    FAST_PIPE_PATH: Optional[Path] = None
+    FAST_MAE: Optional[int] = None
+    DEFAULT_TIER: Literal["full", "fast"] = "full"
+    PRICE_INDEX_PATH: Optional[Path] = None
+    PRICE_INDEX_ATOL: float = 1.0
+    BRAND_MODELS_PATH: Optional[Path] = None
+    DRIFT_BASELINE_PATH: Optional[Path] = None
+    DRIFT_MONITORING: bool = True
+    DRIFT_MIN_OBSERVATIONS: int = 500
+    DRIFT_UNSEEN_CAPACITY: int = 20
+    FRONTEND_DIR: Optional[Path] = Path(__file__).resolve().parent.parent
+    BATCH_MAX_SIZE: int = 500
+    BATCH_RATE_LIMIT: str = "2/minute"
+    SWEEP_MAX_POINTS: int = 500
+    SWEEP_RATE_LIMIT: str = "10/minute"
+    PREDICTION_CACHE_SIZE: int = 1024
+    PREDICTION_CACHE_TTL: int = 3600
+    COMPILED_INFERENCE: bool = True
+    COMPILED_INFERENCE_ATOL: float = 1e-3
+    MICRO_BATCHING: bool = False
+    MICRO_BATCH_MAX_SIZE: int = 32
+    MICRO_BATCH_WAIT_MS: float = 3.0
+    PRELOAD_MODELS: bool = False
+    ARTIFACT_MMAP: bool = True
+    MODEL_RELOAD_INTERVAL: float = 30.0
+    MODEL_WARMUP_ROUNDS: int = 3
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    RATE_LIMIT_STRATEGY: str = "fixed-window"
+
+    # brand_models.json is written next to model_freq.pkl by the training pipeline
+    @property
+    def brand_models_path(self) -> Path:
+        return self.BRAND_MODELS_PATH or self.MODEL_FREQ_PATH.parent / "brand_models.json"
+
+    # drift_baseline.json is written next to model_freq.pkl by the training pipeline
+    @property
+    def drift_baseline_path(self) -> Path:
+        return self.DRIFT_BASELINE_PATH or self.MODEL_FREQ_PATH.parent / "drift_baseline.json"
 
     @property
     def cors_origins(self) -> List[str]:
@@ -0,0 +1,166 @@
+# Standard Libraries
+import math
+import time
+import bisect
+import threading
+
+# Population Stability Index levels, the usual rule of thumb for model inputs
+PSI_MODERATE = 0.1
+PSI_MAJOR = 0.25
+
+# Share given to a bin or value without any car, so the PSI stays finite
+PSI_EPSILON = 1e-4
+
+# Most common baseline values scored on their own, the rest share one bin
+# Sampling noise alone gives a PSI of about bins / observations, so a field with 124 models would look drifted for weeks
+PSI_MAX_CATEGORIES = 20
+
+# Population Stability Index between the baseline and live shares of the same bins
+def psi(expected, actual) -> float:
+    total = 0.0
+    for expected_share, actual_share in zip(expected, actual):
+        expected_share = max(expected_share, PSI_EPSILON)
+        actual_share = max(actual_share, PSI_EPSILON)
+        total += (actual_share - expected_share) * math.log(actual_share / expected_share)
+    return total
+
+# Most counted values of a counter dict
+def top_counts(counts, n) -> list:
+    return sorted(counts.items(), key=lambda item: item[1], reverse=True)[:n]
+
+def drift_level(score) -> str:
+    if score >= PSI_MAJOR:
+        return "major"
+    return "moderate" if score >= PSI_MODERATE else "stable"
+
+# Numeric Field Sketch : one counter per bin of the baseline's quantile edges, plus the live min and max
+# Memory is fixed by the baseline (no values are kept) and an update is one bisect over the edges.
+class NumericSketch:
+    def __init__(self, edges):
+        self.edges = list(edges)
+        self.counts = [0] * (len(self.edges) + 1)
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value):
+        self.counts[bisect.bisect_right(self.edges, value)] += 1
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    # Approximate quantile, interpolated inside its bin (the outer bins end at the live min and max)
+    def quantile(self, q):
+        if not self.count:
+            return None
+        target = q * self.count
+        running = 0
+        for idx, count in enumerate(self.counts):
+            if count and running + count >= target:
+                low = max(self.edges[idx - 1] if idx > 0 else self.min, self.min)
+                high = min(self.edges[idx] if idx < len(self.edges) else self.max, self.max)
+                return low + (high - low) * (target - running) / count
+            running += count
+        return self.max
+
+# Categorical Field Sketch : exact counters for the baseline's values, and a Space-Saving heavy-hitter summary
+# of at most capacity unseen values (new models, brands the OneHotEncoder ignores). When the summary is full,
+# a new value replaces the least counted one and inherits its count, so counts are upper bounds.
+class CategorySketch:
+    def __init__(self, categories, capacity: int = 20):
+        self.counts = dict.fromkeys(categories, 0)
+        self.capacity = capacity
+        self.unseen = {}
+        self.unseen_count = 0
+        self.count = 0
+
+    def update(self, value):
+        self.count += 1
+        if value in self.counts:
+            self.counts[value] += 1
+            return
+        self.unseen_count += 1
+        if value in self.unseen:
+            self.unseen[value] += 1
+        elif len(self.unseen) < self.capacity:
+            self.unseen[value] = 1
+        else:
+            evicted = min(self.unseen, key=self.unseen.get)
+            self.unseen[value] = self.unseen.pop(evicted) + 1
+
+# Input Drift Monitor : one sketch per Input field, compared with the training baseline (drift_baseline.json)
+# Sketches are per process, like the prediction cache, and start empty whenever a new baseline is loaded.
+class DriftMonitor:
+    def __init__(self, baseline: dict, capacity: int = 20, min_observations: int = 500):
+        self.baseline = baseline
+        self.min_observations = min_observations
+        self.numeric = {name: NumericSketch(field["edges"]) for name, field in baseline["numeric"].items()}
+        self.categorical = {name: CategorySketch(shares, capacity) for name, shares in baseline["categorical"].items()}
+        self.observed = 0
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    # Counting validated Input Cars (enum fields are counted by value)
+    def observe(self, cars):
+        with self._lock:
+            for car in cars:
+                self.observed += 1
+                for name, sketch in self.numeric.items():
+                    sketch.update(getattr(car, name))
+                for name, sketch in self.categorical.items():
+                    value = getattr(car, name)
+                    sketch.update(getattr(value, "value", value))
+
+    def _numeric_report(self, name, sketch) -> dict:
+        baseline = self.baseline["numeric"][name]
+        report = {
+            "type": "numeric",
+            "psi": None,
+            "baseline": {**baseline["quantiles"], "min": baseline["min"], "max": baseline["max"]},
+            "live": None
+        }
+        if sketch.count:
+            report["psi"] = round(psi(baseline["proportions"], [count / sketch.count for count in sketch.counts]), 4)
+            report["live"] = {f"p{q}": round(sketch.quantile(q / 100), 1) for q in (10, 50, 90)}
+            report["live"].update({"min": sketch.min, "max": sketch.max})
+        return report
+
+    def _categorical_report(self, name, sketch, top_n=5) -> dict:
+        shares = self.baseline["categorical"][name]
+        report = {"type": "categorical", "psi": None, "unseen_share": None, "top": [], "top_unseen": []}
+        if sketch.count:
+            # Bins : the most common baseline values, the other baseline values, and the unseen values (absent from the baseline)
+            common = [value for value, _ in top_counts(shares, PSI_MAX_CATEGORIES)]
+            common_counts = [sketch.counts[value] for value in common]
+            expected = [shares[value] for value in common] + [max(1 - sum(shares[value] for value in common), 0.0), 0.0]
+            actual = [count / sketch.count for count in common_counts]
+            actual += [(sketch.count - sketch.unseen_count - sum(common_counts)) / sketch.count, sketch.unseen_count / sketch.count]
+            report["psi"] = round(psi(expected, actual), 4)
+            report["unseen_share"] = round(sketch.unseen_count / sketch.count, 4)
+            report["top"] = [{"value": value, "share": round(count / sketch.count, 4), "baseline_share": shares[value]}
+                             for value, count in top_counts(sketch.counts, top_n) if count]
+            report["top_unseen"] = [{"value": value, "count": count} for value, count in top_counts(sketch.unseen, top_n)]
+        return report
+
+    # Drift score of every field, the overall level is the one of the most drifted field
+    def report(self) -> dict:
+        with self._lock:
+            features = {name: self._numeric_report(name, sketch) for name, sketch in self.numeric.items()}
+            features.update({name: self._categorical_report(name, sketch) for name, sketch in self.categorical.items()})
+            observed = self.observed
+
+        scored = {name: feature["psi"] for name, feature in features.items() if feature["psi"] is not None}
+        worst = max(scored, key=scored.get) if scored else None
+        for feature in features.values():
+            feature["drift"] = drift_level(feature["psi"]) if observed >= self.min_observations else "insufficient_data"
+        return {
+            "observed": observed,
+            "since": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started_at)),
+            "baseline_rows": self.baseline["rows"],
+            "min_observations": self.min_observations,
+            "drift": drift_level(scored[worst]) if worst and observed >= self.min_observations else "insufficient_data",
+            "max_psi": {"feature": worst, "psi": scored[worst]} if worst else None,
+            "features": features
+        }
@@ -0,0 +1,175 @@
+# Standard Libraries
+import argparse
+
+# Third-Party Libraries
+import numpy as np
+import pandas as pd
+from sklearn.base import is_regressor
+from sklearn.pipeline import Pipeline
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import StackingRegressor
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, RobustScaler, StandardScaler, FunctionTransformer
+
+# Local Modules
+from api.artifacts import load_artifact
+
+# Pandas-free Inference Engine for the saved Preprocessing + StackingRegressor Pipeline
+# The fitted encoders and scalers are flattened into plain NumPy lookup tables at load time,
+# so a prediction only builds the feature matrix and walks the base estimators and meta-model.
+# A single regressor (like the fast tier's XGBRegressor) is compiled as a stack without base estimators.
+class CompiledPipeline:
+    def __init__(self, pipe):
+        if not isinstance(pipe, Pipeline) or len(pipe.steps) != 2:
+            raise TypeError("Expected a Pipeline with a preprocessor and a model step")
+        preprocessor, model = pipe.steps[0][1], pipe.steps[1][1]
+        if not isinstance(preprocessor, ColumnTransformer):
+            raise TypeError("Preprocessor must be a ColumnTransformer")
+        if not isinstance(model, StackingRegressor) and not is_regressor(model):
+            raise TypeError("Model must be a StackingRegressor or a single regressor")
+
+        self.features = list(preprocessor.feature_names_in_)
+        self._ops = []
+        self.n_features_out = 0
+        for name, trf, columns in preprocessor.transformers_:
+            if trf == "drop" or len(columns) == 0:
+                continue
+            for op in self._compile_transformer(name, trf, list(columns)):
+                self._ops.append(op)
+                self.n_features_out += op[3]
+
+        if not isinstance(model, StackingRegressor):
+            self.estimators, self.final_estimator, self.passthrough = [], model, False
+            return
+        # estimators_ holds only the fitted estimators, while stack_method_ keeps "drop" for the dropped ones
+        methods = [meth for meth in model.stack_method_ if meth != "drop"]
+        if any(meth != "predict" for meth in methods):
+            raise TypeError("Only 'predict' stack method is supported")
+        self.estimators = list(model.estimators_)
+        if len(self.estimators) != len(methods):
+            raise TypeError("Fitted estimators do not match their stack methods")
+        self.final_estimator = model.final_estimator_
+        self.passthrough = model.passthrough
+
+    # Flattening one fitted ColumnTransformer entry into per-column operations
+    # Each operation is a tuple of (kind, column, params, width)
+    def _compile_transformer(self, name, trf, columns):
+        if isinstance(trf, Pipeline):
+            steps = [step for _, step in trf.steps if step not in (None, "passthrough")]
+        else:
+            steps = [trf]
+        if len(steps) > 1:
+            raise TypeError(f"Transformer '{name}' chains more than one step")
+        step = steps[0] if steps else "passthrough"
+
+        if step == "passthrough" or (isinstance(step, FunctionTransformer) and step.func is None):
+            return [("identity", col, None, 1) for col in columns]
+
+        if isinstance(step, OneHotEncoder):
+            if step.drop_idx_ is not None or getattr(step, "infrequent_categories_", None) is not None and any(
+                    cats is not None for cats in step.infrequent_categories_):
+                raise TypeError(f"Transformer '{name}' uses dropped or infrequent categories")
+            ops = []
+            for col, cats in zip(columns, step.categories_):
+                lookup = {cat: idx for idx, cat in enumerate(cats.tolist())}
+                ops.append(("onehot", col, (lookup, step.handle_unknown != "error"), len(cats)))
+            return ops
+
+        if isinstance(step, OrdinalEncoder):
+            unknown_value = step.unknown_value if step.handle_unknown == "use_encoded_value" else None
+            ops = []
+            for col, cats in zip(columns, step.categories_):
+                lookup = {cat: float(idx) for idx, cat in enumerate(cats.tolist())}
+                ops.append(("ordinal", col, (lookup, unknown_value), 1))
+            return ops
+
+        if isinstance(step, (RobustScaler, StandardScaler)):
+            n = len(columns)
+            if isinstance(step, RobustScaler):
+                center = step.center_ if step.center_ is not None else np.zeros(n)
+            else:
+                center = step.mean_ if step.mean_ is not None else np.zeros(n)
+            scale = step.scale_ if step.scale_ is not None else np.ones(n)
+            return [("scale", col, (float(c), float(s)), 1) for col, c, s in zip(columns, center, scale)]
+
+        raise TypeError(f"Transformer '{name}' ({type(step).__name__}) is not supported")
+
+    # Building the model's feature matrix from a mapping of column name → values
+    def transform(self, columns) -> np.ndarray:
+        n_rows = len(columns[self.features[0]])
+        X = np.zeros((n_rows, self.n_features_out), dtype=np.float64)
+        rows = np.arange(n_rows)
+        offset = 0
+        for kind, col, params, width in self._ops:
+            values = columns[col]
+            if kind == "onehot":
+                lookup, ignore_unknown = params
+                idx = np.fromiter((lookup.get(v, -1) for v in values), dtype=np.int64, count=n_rows)
+                known = idx >= 0
+                if not ignore_unknown and not known.all():
+                    raise ValueError(f"Found unknown categories in column '{col}'")
+                X[rows[known], offset + idx[known]] = 1.0
+            elif kind == "ordinal":
+                lookup, unknown_value = params
+                codes = [lookup.get(v, unknown_value) for v in values]
+                if any(code is None for code in codes):
+                    raise ValueError(f"Found unknown categories in column '{col}'")
+                X[:, offset] = codes
+            elif kind == "scale":
+                center, scale = params
+                X[:, offset] = (np.asarray(values, dtype=np.float64) - center) / scale
+            else:
+                X[:, offset] = np.asarray(values, dtype=np.float64)
+            offset += width
+        return X
+
+    def predict(self, columns) -> np.ndarray:
+        X = self.transform(columns)
+        if not self.estimators:
+            return self.final_estimator.predict(X)
+        stacked = np.column_stack([est.predict(X) for est in self.estimators])
+        if self.passthrough:
+            stacked = np.hstack([stacked, X])
+        return self.final_estimator.predict(stacked)
+
+    # Synthetic rows covering every known category, used to check the engine against the Pipeline
+    def probe_columns(self, n_rows: int = 32) -> dict:
+        rng = np.random.default_rng(42)
+        columns = {}
+        for kind, col, params, _ in self._ops:
+            if kind in ("onehot", "ordinal"):
+                cats = list(params[0])
+                columns[col] = [cats[i % len(cats)] for i in range(n_rows)]
+            elif kind == "scale":
+                center, scale = params
+                columns[col] = (center + scale * rng.uniform(-1, 1, n_rows)).round().tolist()
+            else:
+                columns[col] = rng.uniform(0, 0.05, n_rows).tolist()
+        return columns
+
+    # Maximum absolute difference between this engine and pipe.predict on the same rows
+    def max_deviation(self, pipe, columns) -> float:
+        expected = pipe.predict(pd.DataFrame({col: columns[col] for col in self.features}))
+        return float(np.max(np.abs(self.predict(columns) - expected)))
+
+# Verifying the compiled engine against pipe.predict on a training parquet
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the compiled inference engine with pipe.predict")
+    parser.add_argument("--pipe", required=True, help="Path to pipe.pkl or pipe.joblib")
+    parser.add_argument("--model-freq", required=True, help="Path to model_freq.pkl")
+    parser.add_argument("--data", default="clean_data/clean_data_after_eda.parquet", help="Parquet file with training data")
+    parser.add_argument("--atol", type=float, default=1e-6, help="Maximum allowed absolute difference")
+    args = parser.parse_args()
+
+    pipe = load_artifact(args.pipe)
+    model_freq = load_artifact(args.model_freq)
+
+    cars = pd.read_parquet(args.data, engine="pyarrow")
+    cars["model_freq"] = cars["model"].astype(str).map(model_freq)
+    cars = cars.dropna(subset=["model_freq"])
+
+    engine = CompiledPipeline(pipe)
+    deviation = engine.max_deviation(pipe, cars)
+    print(f"Rows compared : {len(cars)}")
+    print(f"Max absolute difference : {deviation:.3e}")
+    if deviation > args.atol:
+        raise SystemExit(f"Compiled engine deviates from pipe.predict by more than {args.atol}")
@@ -1,15 +1,19 @@
 # Standard Libraries
-import pickle
+import json
+import time
 import logging
+import itertools
+from typing import Annotated, Any, Dict, List, Optional
 
 # Third-Party Libraries
 import pandas as pd
 from sigfig import round
 from fastapi import FastAPI, Request
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, model_validator
 from enum import Enum
 from babel.numbers import format_currency
 from contextlib import asynccontextmanager
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # Rate Limiting Libraries
@@ -20,33 +24,247 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 
 # Local Modules
 from api.config import settings
+from api.schemas import FuelType, Transmission, OwnerType, Input
+from api import ratelimit  # noqa: F401 (registers the "sqlite://" rate limit storage)
+from api.cache import PredictionCache
+from api.engine import CompiledPipeline
+from api.batching import MicroBatcher
+from api.price_index import PriceIndex
+from api.reload import ArtifactWatcher, artifact_signature
+from api.static import REVALIDATE_CACHE, StaticAsset, StaticSite
+from api.drift import DriftMonitor
+from api.artifacts import ModelSet, artifact_version, load_artifact, load_models, process_memory
+from api.metrics import CONTENT_TYPE, MODEL_LOAD_SECONDS, RATE_LIMITED, REQUESTS, STAGE_LATENCY, render_histogram, render_metrics
 
 # Logging the Output
 logging.basicConfig(level=logging.INFO, format="%(levelname)s:    %(message)s")
 logger = logging.getLogger(__name__)
 
+# Memory-mapping Joblib artifacts, so workers share their arrays through the page cache
+ARTIFACT_MMAP_MODE = "r" if settings.ARTIFACT_MMAP else None
+
+# Preloading Pipeline and Model Frequency at import time, before a process manager forks workers
+# Forked workers then share the loaded model (and imported libraries) via copy-on-write pages
+preloaded = None
+if settings.PRELOAD_MODELS:
+    try:
+        preloaded = load_models(settings.PIPE_PATH, settings.MODEL_FREQ_PATH, mmap_mode=ARTIFACT_MMAP_MODE)
+        logger.info(f"Models preloaded in {preloaded[2]:.3f}s before forking workers")
+    except Exception:
+        logger.exception("Model preloading failed")
+
+# Loading the fast tier's Pipeline, only served when both FAST_PIPE_PATH and FAST_MAE are set
+def load_fast_pipe():
+    if settings.FAST_PIPE_PATH is None:
+        return None
+    if settings.FAST_MAE is None:
+        logger.error("FAST_MAE is not set, fast tier disabled")
+        return None
+    try:
+        return load_artifact(settings.FAST_PIPE_PATH, mmap_mode=ARTIFACT_MMAP_MODE)
+    except Exception:
+        logger.exception("Fast tier loading failed")
+        return None
+
+preloaded_fast = load_fast_pipe() if settings.PRELOAD_MODELS else None
+
+# Compiling a Pipeline into the pandas-free engine, None when it is unsupported or deviates from the Pipeline
+def compile_pipeline(pipe, tier):
+    try:
+        engine = CompiledPipeline(pipe)
+        deviation = engine.max_deviation(pipe, engine.probe_columns())
+        if deviation > settings.COMPILED_INFERENCE_ATOL:
+            logger.warning(f"Compiled inference disabled for the {tier} tier, deviation from pipeline is {deviation:.3e}")
+            return None
+        logger.info(f"Compiled inference engine loaded successfully ({tier} tier)")
+        return engine
+    except Exception:
+        logger.exception(f"Compiled inference engine is not available for the {tier} tier, using pipeline")
+        return None
+
+# Loading the precomputed price index of the full tier
+# Its grid points are checked against the loaded Pipeline, so an index built from another model is never served
+def load_price_index(models):
+    try:
+        index = PriceIndex.load(settings.PRICE_INDEX_PATH)
+        deviation = index.max_deviation(lambda columns: predict_prices(models, columns), models.model_freq)
+        if deviation > settings.PRICE_INDEX_ATOL:
+            logger.warning(f"Price index disabled, deviation from pipeline is {deviation:.3e} (built from another model?)")
+            return None
+        logger.info(f"Price index loaded successfully ({index.cells} cells, km_driven served every {index.stats()['km_step']:g} km)")
+        return index
+    except Exception:
+        logger.exception("Price index is not available, using pipeline")
+        return None
+
+# Running synthetic predictions through every tier (single row and batch), so the first real request is not a cold one
+def warm_up(models, rounds):
+    for tier in (Tier.FULL, Tier.FAST):
+        pipe, engine, _ = tier_models(models, tier)
+        if pipe is None:
+            continue
+        try:
+            columns = (engine or CompiledPipeline(pipe)).probe_columns()
+        except TypeError:
+            logger.warning(f"No synthetic rows for the {tier.value} tier, skipping its warm-up")
+            continue
+        single_row = {column: values[:1] for column, values in columns.items()}
+        for _ in range(rounds):
+            predict_prices(models, single_row, tier)
+            predict_prices(models, columns, tier)
+
+# Loading the Brand → Models map of the form, only the models known to model_freq are kept
+def load_brand_models(model_freq):
+    try:
+        brand_models = json.loads(settings.brand_models_path.read_text())
+    except Exception:
+        logger.warning(f"Brand models not available ({settings.brand_models_path}), /metadata lists models without brands")
+        return None
+    return {brand: [model for model in names if model in model_freq] for brand, names in brand_models.items()}
+
+# Loading the input distribution of the training data, the reference of the drift monitor
+def load_drift_baseline():
+    try:
+        return json.loads(settings.drift_baseline_path.read_text())
+    except Exception:
+        logger.warning(f"Drift baseline not available ({settings.drift_baseline_path}), input drift is not monitored")
+        return None
+
+# Form choices and valid ranges of the loaded model, built once per model version from model_freq and the Input schema
+def build_metadata(models):
+    properties = Input.model_json_schema()["properties"]
+    metadata = {
+        "version": models.version,
+        "brands": {brand: names for brand, names in sorted((models.brand_models or {}).items()) if names},
+        "models": sorted(models.model_freq),
+        "fuel_types": [fuel_type.value for fuel_type in FuelType],
+        "transmissions": [transmission.value for transmission in Transmission],
+        "owners": [owner.value for owner in OwnerType],
+        "ranges": {name: {"min": prop["minimum"], "max": prop["maximum"]} for name, prop in properties.items() if "minimum" in prop},
+        "tiers": [tier.value for tier in Tier if tier_models(models, tier)[0] is not None]
+    }
+    # Revalidated on every use (ETag, 304 when unchanged), so a hot reload reaches browsers and proxies at once
+    body = json.dumps(metadata, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return StaticAsset(body, "application/json", REVALIDATE_CACHE)
+
+# Artifact files the models are loaded from, watched for hot reloads
+ARTIFACT_PATHS = [path for path in (settings.PIPE_PATH, settings.MODEL_FREQ_PATH, settings.FAST_PIPE_PATH,
+                                    settings.PRICE_INDEX_PATH, settings.brand_models_path, settings.drift_baseline_path) if path is not None]
+
+# Loading, compiling and warming up one version of the models
+# Raises when the Pipeline or Model Frequency cannot be loaded, the optional artifacts are only logged
+def load_model_set(preloaded=None, preloaded_fast=None):
+    if preloaded is not None:
+        pipe, model_freq, load_seconds = preloaded
+    else:
+        pipe, model_freq, load_seconds = load_models(settings.PIPE_PATH, settings.MODEL_FREQ_PATH, mmap_mode=ARTIFACT_MMAP_MODE)
+    logger.info("Pipeline and model frequency loaded successfully")
+    models = ModelSet(pipe, model_freq, preloaded_fast if preloaded_fast is not None else load_fast_pipe())
+    if models.fast_pipe is not None:
+        logger.info("Fast tier pipeline loaded successfully")
+    models.version = artifact_version(ARTIFACT_PATHS, model_freq)
+    models.loaded_at = time.time()
+    models.load_seconds = load_seconds
+
+    if settings.COMPILED_INFERENCE:
+        models.engine = compile_pipeline(models.pipe, "full")
+        if models.fast_pipe is not None:
+            models.fast_engine = compile_pipeline(models.fast_pipe, "fast")
+    if settings.PRICE_INDEX_PATH is not None:
+        models.price_index = load_price_index(models)
+    models.brand_models = load_brand_models(model_freq)
+    models.metadata = build_metadata(models)
+    if settings.DRIFT_MONITORING:
+        models.drift_baseline = load_drift_baseline()
+
+    start = time.perf_counter()
+    warm_up(models, settings.MODEL_WARMUP_ROUNDS)
+    models.warmup_seconds = time.perf_counter() - start
+    return models
+
+# Publishing a new version of the models with one reference swap
+# In-flight requests finish with the models they started with, and the cache drops results of the previous version
+def swap_models(models):
+    app.state.models = models
+    app.state.prediction_cache.set_version(models.version)
+    # Live sketches are only comparable with the baseline they started from, a new baseline starts them over
+    current = app.state.drift.baseline if app.state.drift is not None else None
+    if models.drift_baseline != current:
+        app.state.drift = None if models.drift_baseline is None else DriftMonitor(
+            models.drift_baseline, capacity=settings.DRIFT_UNSEEN_CAPACITY, min_observations=settings.DRIFT_MIN_OBSERVATIONS
+        )
+    MODEL_LOAD_SECONDS.set(models.load_seconds)
+    logger.info(f"Serving model version {models.version} (loaded in {models.load_seconds:.3f}s, warmed up in {models.warmup_seconds:.3f}s)")
+
 # Loading Pipeline and Model Frequency
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    signature = artifact_signature(ARTIFACT_PATHS)
+    loaded = False
     try:
-        with open(settings.PIPE_PATH, "rb") as f:
-            app.state.pipe = pickle.load(f)
-            logger.info("Pipeline loaded successfully")
-        with open(settings.MODEL_FREQ_PATH, "rb") as f:
-            app.state.model_freq = pickle.load(f)
-            logger.info("Model frequency loaded successfully")
+        swap_models(load_model_set(preloaded, preloaded_fast))
+        loaded = True
     except Exception:
         logger.exception("Model loading failed")
+
+    app.state.batcher = None
+    if settings.MICRO_BATCHING:
+        app.state.batcher = MicroBatcher(
+            predict_prices,
+            max_batch_size=settings.MICRO_BATCH_MAX_SIZE,
+            max_wait_ms=settings.MICRO_BATCH_WAIT_MS
+        )
+        await app.state.batcher.start()
+
+    # Reloading the models in a background thread when their files change (also retries a failed startup load)
+    app.state.watcher = None
+    if settings.MODEL_RELOAD_INTERVAL > 0:
+        app.state.watcher = ArtifactWatcher(ARTIFACT_PATHS, load_model_set, swap_models, interval=settings.MODEL_RELOAD_INTERVAL)
+        app.state.watcher.start(signature, loaded)
+
+    memory = process_memory()
+    logger.info(
+        f"Worker {memory['pid']} ready: models loaded in {app.state.models.load_seconds or 0:.3f}s "
+        f"(preloaded={preloaded is not None}), RSS {memory['rss_mb']} MB, PSS {memory['pss_mb']} MB"
+    )
     
     yield
 
+    if app.state.watcher is not None:
+        app.state.watcher.stop()
+    if app.state.batcher is not None:
+        await app.state.batcher.stop()
+
 # Creating FastAPI App Instance
 app = FastAPI(title="AutoIQ by Motor.co", lifespan=lifespan)
+app.state.models = ModelSet()
+app.state.batcher = None
+app.state.watcher = None
+app.state.drift = None
+
+# Loading and compressing the static frontend once
+app.state.frontend = None
+if settings.FRONTEND_DIR is not None:
+    try:
+        app.state.frontend = StaticSite(settings.FRONTEND_DIR)
+        logger.info(f"Frontend loaded ({len(app.state.frontend.assets)} files)")
+    except Exception:
+        logger.exception("Frontend is not available")
 
 # Setting up Rate Limiter
-limiter = Limiter(key_func=get_remote_address)
+# Counters are per process with "memory://", with several workers use a shared storage such as "sqlite://"
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.RATE_LIMIT_STORAGE_URI, strategy=settings.RATE_LIMIT_STRATEGY)
 app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+# Counting rate-limit rejections before returning the usual 429 response
+def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    RATE_LIMITED.inc(request.url.path)
+    return _rate_limit_exceeded_handler(request, exc)
+
+app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+
+# Setting up Prediction Cache
+app.state.prediction_cache = PredictionCache(maxsize=settings.PREDICTION_CACHE_SIZE, ttl=settings.PREDICTION_CACHE_TTL)
 
 # Enable CORS so frontend apps from different origins can access this API
 app.add_middleware(
@@ -67,81 +285,367 @@ def root():
 @app.get("/health", tags=["Utility"])
 def health():
     logger.info("Health endpoint accessed")
+    models = app.state.models
     return {
         "status": "ok",
-        "pipeline_loaded": app.state.pipe is not None,
-        "model_frequency_loaded": app.state.model_freq is not None
+        "pipeline_loaded": models.pipe is not None,
+        "model_frequency_loaded": models.model_freq is not None,
+        "compiled_inference": models.engine is not None,
+        "model": models.info(),
+        "model_reload": app.state.watcher.stats() if app.state.watcher is not None else None,
+        "model_tiers": {
+            "default": settings.DEFAULT_TIER,
+            "full": {"loaded": models.pipe is not None, "compiled": models.engine is not None, "mae": settings.MAE},
+            "fast": {"loaded": models.fast_pipe is not None, "compiled": models.fast_engine is not None, "mae": settings.FAST_MAE}
+        },
+        "prediction_cache": app.state.prediction_cache.stats(),
+        "price_index": models.price_index.stats() if models.price_index is not None else None,
+        "drift_monitoring": {"observed": app.state.drift.observed} if app.state.drift is not None else None,
+        "micro_batching": app.state.batcher.stats() if app.state.batcher is not None else None,
+        "rate_limit": {"storage": settings.RATE_LIMIT_STORAGE_URI.split("://")[0], "strategy": settings.RATE_LIMIT_STRATEGY},
+        "worker": {"load_seconds": models.load_seconds, "preloaded": preloaded is not None, **process_memory()}
     }
 
-# Input validation for fuel_type
-class FuelType(str, Enum):
-    PETROL = "Petrol"
-    DIESEL = "Diesel"
-    CNG = "CNG"
-
-# Input validation for transmission
-class Transmission(str, Enum):
-    MANUAL = "Manual"
-    AUTOMATIC = "Automatic"
-
-# Input validation for owner
-class OwnerType(str, Enum):
-    FIRST = "1st owner"
-    SECOND = "2nd owner"
-    THIRD = "3rd owner"
-    OTHERS = "Others"
-
-# Define Input Data Schema using Pydantic
-class Input(BaseModel):
-    brand: str = Field(..., description="Brand Name of your Car", example="MG")
-    model: str = Field(..., description="Model Name of your Car", example="HECTOR")  
-    km_driven: int = Field(..., ge=1000, le=200000, description="KM Driven of your Car", example=80000)
-    engine_capacity: int = Field(..., ge=700, le=3000, description="Engine Capacity (in cc) of your Car", example=1498)
-    fuel_type: FuelType = Field(..., description="Fuel Type of your Car", example="Petrol")
-    transmission: Transmission = Field(..., description="Transmission of your Car", example="Manual")
-    year: int = Field(..., ge=2010, le=2024, description="Manufacture Year of your Car", example=2022)
-    owner: OwnerType = Field(..., description="Owner Type of your Car", example="1st owner")
+# Metadata Endpoint (Brand → Model choices, enum values and valid ranges of the loaded model)
+# Served with an ETag, so clients revalidate with a 304 until a reload changes the model
+@app.get("/metadata", tags=["Utility"])
+def metadata(request: Request):
+    models = request.app.state.models
+    if models.metadata is None:
+        logger.error("Metadata is not available")
+        return {"error": "Metadata is not available"}
+    return models.metadata.response(request)
 
-# Prediction Endpoint
-@app.post("/predict", tags=["Prediction"])
-@limiter.limit("5/minute")
-def predict(data: Input, request: Request):
-    pipe = request.app.state.pipe
-    model_freq = request.app.state.model_freq
+# Input Drift Endpoint (live traffic of this worker compared with the training data, one PSI score per Input field)
+@app.get("/drift", tags=["Utility"])
+def drift(request: Request):
+    monitor = request.app.state.drift
+    if monitor is None:
+        logger.error("Drift monitoring is not available")
+        return {"error": "Drift monitoring is not available"}
+    return monitor.report()
+
+# Frontend Endpoints (index.html and its assets, pre-compressed)
+@app.get("/app", include_in_schema=False)
+def frontend_root():
+    return RedirectResponse("/app/")
+
+@app.get("/app/{path:path}", include_in_schema=False)
+def frontend(path: str, request: Request):
+    response = app.state.frontend.response(path, request) if app.state.frontend is not None else None
+    if response is None:
+        return JSONResponse({"error": "Not found"}, status_code=404)
+    return response
+
+# Metrics Endpoint (Prometheus text format)
+@app.get("/metrics", tags=["Utility"], response_class=PlainTextResponse)
+def metrics():
+    extra_lines = []
+    if app.state.batcher is not None:
+        extra_lines += render_histogram("autoiq_micro_batch_size", "Rows per micro-batch", app.state.batcher.batch_size)
+        extra_lines += render_histogram("autoiq_micro_batch_queue_wait_seconds", "Time a request waits before its micro-batch runs", app.state.batcher.queue_wait)
+    return PlainTextResponse(render_metrics(extra_lines), media_type=CONTENT_TYPE)
 
-    # Check if Models are Loaded
+# Model tier serving a prediction : "full" is the stacked ensemble, "fast" the compact single model
+class Tier(str, Enum):
+    FULL = "full"
+    FAST = "fast"
+
+# Looking up the frequency of each Car model (None for unseen models)
+def lookup_model_freq(items, model_freq):
+    return [model_freq.get(d.model) for d in items]
+
+# Building model features column by column for one or many Cars
+def build_input_columns(items, model_freqs):
+    return {
+        "brand":[d.brand for d in items],
+        "model_freq":model_freqs,
+        "km_driven":[d.km_driven for d in items],
+        "engine_capacity":[d.engine_capacity for d in items],
+        "fuel_type":[d.fuel_type.value for d in items],
+        "transmission":[d.transmission.value for d in items],
+        "year":[d.year for d in items],
+        "owner":[d.owner.value for d in items]
+        }
+
+# Requested tier (default from settings), falling back to the full tier when the fast tier is not loaded
+def resolve_tier(models, tier):
+    tier = tier or Tier(settings.DEFAULT_TIER)
+    if tier == Tier.FAST and models.fast_pipe is None:
+        logger.warning("Fast tier is not available, using the full tier")
+        return Tier.FULL
+    return tier
+
+# Pipeline, compiled engine and MAE of a tier
+def tier_models(models, tier):
+    if tier == Tier.FAST:
+        return models.fast_pipe, models.fast_engine, settings.FAST_MAE
+    return models.pipe, models.engine, settings.MAE
+
+# Running the tier's compiled engine when available, otherwise its Pipeline on a DataFrame
+def predict_prices(models, columns, tier=Tier.FULL):
+    pipe, engine, _ = tier_models(models, tier)
+    if engine is not None:
+        return engine.predict(columns)
+    return pipe.predict(pd.DataFrame(columns))
+
+# Looking up a Car in the precomputed price index (full tier only), None on a miss
+def index_lookup(models, tier, data):
+    if tier != Tier.FULL or models.price_index is None:
+        return None
+    return models.price_index.lookup(**data.model_dump(mode="json"))
+
+# Rounding a raw prediction and its ± MAE range (the full tier's by default) to significant figures
+def price_limits(prediction, mae=None):
+    prediction = round(prediction)
+    mae = settings.MAE if mae is None else mae
+
+    lower_limit = prediction - mae
+    upper_limit = prediction + mae
+
+    return round(lower_limit,3), round(upper_limit,3)
+
+# Formatting a rounded price range in INR
+def format_limits(lower_limit, upper_limit):
+    format_lower = format_currency(lower_limit, "INR", locale="en_IN")
+    format_upper = format_currency(upper_limit, "INR", locale="en_IN")
+
+    return f"{format_lower.split('.')[0]} to {format_upper.split('.')[0]}"
+
+# Formatting a raw prediction as an INR price range (± MAE)
+def format_price_range(prediction, mae=None):
+    return format_limits(*price_limits(prediction, mae))
+
+# Latency stage of the model call for each tier
+PREDICT_STAGES = {Tier.FULL: "predict", Tier.FAST: "predict_fast"}
+
+# Counting validated Cars in the input drift sketches (skipped while no baseline is loaded)
+def observe_inputs(request, endpoint, cars):
+    drift = request.app.state.drift
+    if drift is not None:
+        with STAGE_LATENCY.labels(endpoint, "drift_observe").time():
+            drift.observe(cars)
+
+# Checking that a Car can be predicted : the tier's Pipeline and Model Frequency are loaded, and its model is known to model_freq
+# Returns the outcome label and error response of the first failed check, (None, None) when the Car can be predicted
+def check_prediction(pipe, model_freq, car=None):
     if pipe is None:
         logger.error("Pipeline is not loaded")
-        return {"error": "Pipeline is not available"}
+        return "unavailable", {"error": "Pipeline is not available"}
     if model_freq is None:
         logger.error("Model frequency is not loaded")
-        return {"error": "Model frequency is not available"}
+        return "unavailable", {"error": "Model frequency is not available"}
+    if car is not None and car.model not in model_freq:
+        logger.info(f"Model '{car.model}' is not supported")
+        return "unsupported", {"error": f"Model '{car.model}' is not supported"}
+    return None, None
+
+# Prediction Endpoint
+@app.post("/predict", tags=["Prediction"])
+@limiter.limit("5/minute")
+def predict(data: Input, request: Request, tier: Optional[Tier] = None):
+    # Every model used by this request comes from the same version, even if a reload swaps them meanwhile
+    models = request.app.state.models
+    tier = resolve_tier(models, tier)
+    pipe, _, mae = tier_models(models, tier)
+    model_freq = models.model_freq
+
+    # Every validated request is counted, including cache hits and models unknown to model_freq
+    observe_inputs(request, "/predict", [data])
+
+    # Check if Models are Loaded and the Car Model is Supported
+    outcome, error = check_prediction(pipe, model_freq, data)
+    if error is not None:
+        REQUESTS.inc("/predict", outcome)
+        return error
+
+    cache = request.app.state.prediction_cache
+    cache_key = cache.make_key(data, tier.value)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        logger.info("Prediction served from cache")
+        REQUESTS.inc("/predict", "cache_hit")
+        return {"output": cached, "tier": tier.value}
 
     try:
-        input_data = pd.DataFrame({
-                        "brand":[data.brand],
-                        "model_freq":[model_freq.get(data.model)],
-                        "km_driven":[data.km_driven],
-                        "engine_capacity":[data.engine_capacity],
-                        "fuel_type":[data.fuel_type],
-                        "transmission":[data.transmission],
-                        "year":[data.year],
-                        "owner":[data.owner]
-                        })
-        logger.info("Input data prepared for prediction")
-        
-        prediction = round(pipe.predict(input_data)[0])
-        logger.info("Prediction made successfully")
-
-        lower_limit = prediction - settings.MAE
-        upper_limit = prediction + settings.MAE
-
-        format_lower = format_currency(round(lower_limit,3), "INR", locale="en_IN")
-        format_upper = format_currency(round(upper_limit,3), "INR", locale="en_IN")
-
-        result = f"{format_lower.split('.')[0]} to {format_upper.split('.')[0]}"
+        with STAGE_LATENCY.labels("/predict", "index_lookup").time():
+            prediction = index_lookup(models, tier, data)
+        if prediction is not None:
+            logger.info("Prediction served from price index")
+        else:
+            with STAGE_LATENCY.labels("/predict", "model_freq_lookup").time():
+                model_freqs = lookup_model_freq([data], model_freq)
+            with STAGE_LATENCY.labels("/predict", "input_build").time():
+                input_data = build_input_columns([data], model_freqs)
+            logger.info("Input data prepared for prediction")
+
+            # The fast tier skips micro-batching, waiting for a batch would cost more than its model call
+            with STAGE_LATENCY.labels("/predict", PREDICT_STAGES[tier]).time():
+                if tier == Tier.FULL and request.app.state.batcher is not None:
+                    prediction = request.app.state.batcher.predict(models, input_data)
+                else:
+                    prediction = predict_prices(models, input_data, tier)[0]
+            logger.info("Prediction made successfully")
+
+        with STAGE_LATENCY.labels("/predict", "rounding").time():
+            lower_limit, upper_limit = price_limits(prediction, mae)
+        with STAGE_LATENCY.labels("/predict", "formatting").time():
+            result = format_limits(lower_limit, upper_limit)
         logger.info("Prediction formatted successfully")
-        return {"output": result}
+        cache.set(cache_key, result, models.version)
+        REQUESTS.inc("/predict", "success")
+        return {"output": result, "tier": tier.value}
     except Exception:
         logger.exception("Prediction failed due to an exception")
+        REQUESTS.inc("/predict", "error")
+        return {"error": "An unexpected error occurred during prediction"}
+
+# Define Batch Input Data Schema using Pydantic
+# Items are validated one by one, so a single invalid car doesn't reject the whole batch
+class BatchInput(BaseModel):
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=settings.BATCH_MAX_SIZE, description="List of Cars in the same format as /predict")
+
+# Batch Prediction Endpoint
+@app.post("/predict/batch", tags=["Prediction"])
+@limiter.limit(settings.BATCH_RATE_LIMIT)
+def predict_batch(data: BatchInput, request: Request, tier: Optional[Tier] = None):
+    # Every model used by this request comes from the same version, even if a reload swaps them meanwhile
+    models = request.app.state.models
+    tier = resolve_tier(models, tier)
+    pipe, _, mae = tier_models(models, tier)
+    model_freq = models.model_freq
+
+    # Check if Models are Loaded (Car models are checked item by item)
+    outcome, error = check_prediction(pipe, model_freq)
+    if error is not None:
+        REQUESTS.inc("/predict/batch", outcome)
+        return error
+
+    cache = request.app.state.prediction_cache
+    outputs: List[Dict[str, Any]] = [{} for _ in data.items]
+    valid_idx, valid_items, valid_keys, observed = [], [], [], []
+    for idx, item in enumerate(data.items):
+        try:
+            car = Input.model_validate(item)
+        except ValidationError as e:
+            outputs[idx] = {"error": "Invalid input", "details": e.errors(include_url=False, include_context=False)}
+            continue
+        observed.append(car)
+        _, error = check_prediction(pipe, model_freq, car)
+        if error is not None:
+            outputs[idx] = error
+            continue
+        cache_key = cache.make_key(car, tier.value)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            outputs[idx] = {"output": cached}
+            continue
+        valid_idx.append(idx)
+        valid_items.append(car)
+        valid_keys.append(cache_key)
+    observe_inputs(request, "/predict/batch", observed)
+    logger.info(f"Batch validated: {len(valid_items)} of {len(data.items)} items need prediction")
+
+    if valid_items:
+        try:
+            with STAGE_LATENCY.labels("/predict/batch", "index_lookup").time():
+                predictions = [index_lookup(models, tier, car) for car in valid_items]
+            missing = [i for i, prediction in enumerate(predictions) if prediction is None]
+            if missing:
+                missing_items = [valid_items[i] for i in missing]
+                with STAGE_LATENCY.labels("/predict/batch", "model_freq_lookup").time():
+                    model_freqs = lookup_model_freq(missing_items, model_freq)
+                with STAGE_LATENCY.labels("/predict/batch", "input_build").time():
+                    input_data = build_input_columns(missing_items, model_freqs)
+                with STAGE_LATENCY.labels("/predict/batch", PREDICT_STAGES[tier]).time():
+                    for i, prediction in zip(missing, predict_prices(models, input_data, tier)):
+                        predictions[i] = prediction
+            logger.info(f"Batch prediction made successfully ({len(valid_items) - len(missing)} served from price index)")
+        except Exception:
+            logger.exception("Batch prediction failed due to an exception")
+            REQUESTS.inc("/predict/batch", "error")
+            return {"error": "An unexpected error occurred during prediction"}
+
+        for idx, cache_key, prediction in zip(valid_idx, valid_keys, predictions):
+            try:
+                result = format_price_range(prediction, mae)
+                cache.set(cache_key, result, models.version)
+                outputs[idx] = {"output": result}
+            except Exception:
+                logger.exception("Formatting failed due to an exception")
+                outputs[idx] = {"error": "An unexpected error occurred during prediction"}
+
+    REQUESTS.inc("/predict/batch", "success")
+    return {"outputs": outputs, "tier": tier.value}
+
+# Define Sweep Input Data Schema using Pydantic
+# One Car plus the values to sweep, every combination of km_driven × year × owner becomes one grid point
+class SweepInput(BaseModel):
+    car: Input = Field(..., description="Car in the same format as /predict")
+    km_driven: Optional[List[Annotated[int, Field(ge=1000, le=200000)]]] = Field(None, min_length=1, description="KM Driven values to sweep", example=[20000, 60000, 100000])
+    year: Optional[List[Annotated[int, Field(ge=2010, le=2024)]]] = Field(None, min_length=1, description="Manufacture Years to sweep", example=[2016, 2018, 2020])
+    owner: Optional[List[OwnerType]] = Field(None, min_length=1, description="Owner Types to sweep (default the Car's owner)")
+
+    @model_validator(mode="after")
+    def check_grid(self):
+        if self.km_driven is None and self.year is None:
+            raise ValueError("Sweep km_driven, year or both")
+        if len(self.grid()) > settings.SWEEP_MAX_POINTS:
+            raise ValueError(f"Sweep grid has {len(self.grid())} points, the limit is {settings.SWEEP_MAX_POINTS}")
+        return self
+
+    # Swept values of each field, the Car's own value for the fields that are not swept
+    def axes(self) -> dict:
+        return {
+            "owner": self.owner or [self.car.owner],
+            "year": self.year or [self.car.year],
+            "km_driven": self.km_driven or [self.car.km_driven]
+        }
+
+    def grid(self) -> list:
+        return list(itertools.product(*self.axes().values()))
+
+# What-if Sweep Endpoint (price curve of one Car over km_driven and/or year)
+# The whole grid is predicted with a single model call, each point gets the same ± MAE range as /predict
+@app.post("/predict/sweep", tags=["Prediction"])
+@limiter.limit(settings.SWEEP_RATE_LIMIT)
+def predict_sweep(data: SweepInput, request: Request, tier: Optional[Tier] = None):
+    models = request.app.state.models
+    tier = resolve_tier(models, tier)
+    pipe, _, mae = tier_models(models, tier)
+    model_freq = models.model_freq
+
+    # Check if Models are Loaded and the Car Model is Supported
+    outcome, error = check_prediction(pipe, model_freq, data.car)
+    if error is not None:
+        REQUESTS.inc("/predict/sweep", outcome)
+        return error
+
+    try:
+        with STAGE_LATENCY.labels("/predict/sweep", "input_build").time():
+            grid = data.grid()
+            cars = [data.car.model_copy(update={"owner": owner, "year": year, "km_driven": km_driven}) for owner, year, km_driven in grid]
+            input_data = build_input_columns(cars, lookup_model_freq(cars, model_freq))
+        with STAGE_LATENCY.labels("/predict/sweep", PREDICT_STAGES[tier]).time():
+            predictions = predict_prices(models, input_data, tier)
+        logger.info(f"Sweep prediction made successfully ({len(grid)} points)")
+
+        with STAGE_LATENCY.labels("/predict/sweep", "formatting").time():
+            points = []
+            for (owner, year, km_driven), prediction in zip(grid, predictions):
+                lower_limit, upper_limit = price_limits(prediction, mae)
+                points.append({
+                    "km_driven": km_driven,
+                    "year": year,
+                    "owner": owner.value,
+                    "lower": int(lower_limit),
+                    "upper": int(upper_limit),
+                    "output": format_limits(lower_limit, upper_limit)
+                })
+        REQUESTS.inc("/predict/sweep", "success")
+        axes = data.axes()
+        return {"points": points, "axes": {**axes, "owner": [owner.value for owner in axes["owner"]]}, "tier": tier.value}
+    except Exception:
+        logger.exception("Sweep prediction failed due to an exception")
+        REQUESTS.inc("/predict/sweep", "error")
         return {"error": "An unexpected error occurred during prediction"}
@@ -0,0 +1,166 @@
+# Standard Libraries
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default latency buckets (in seconds), from 50µs to 1s
+LATENCY_BUCKETS = [0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0]
+
+# Every labelled metric created below, in the order it is rendered
+REGISTRY = []
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+# Fixed-bucket Histogram (cumulative buckets, like Prometheus)
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative, running = {}, 0
+        for bound, count in zip(self.buckets + [float("inf")], counts):
+            running += count
+            cumulative["+Inf" if bound == float("inf") else f"{bound:g}"] = running
+        return {"buckets": cumulative, "count": running, "sum": total}
+
+    def samples(self, name: str, labels: dict = None) -> list:
+        labels = labels or {}
+        snapshot = self.snapshot()
+        lines = [f"{name}_bucket{_format_labels({**labels, 'le': le})} {count}" for le, count in snapshot["buckets"].items()]
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(snapshot['sum'])}")
+        lines.append(f"{name}_count{_format_labels(labels)} {snapshot['count']}")
+        return lines
+
+# Base class for a named metric family with optional labels
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), register: bool = True):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        if register:
+            REGISTRY.append(self)
+
+    def _child(self, labelvalues):
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"Metric '{self.name}' expects labels {self.labelnames}")
+        with self._lock:
+            child = self._children.get(labelvalues)
+            if child is None:
+                child = self._children[labelvalues] = self._new_child()
+            return child
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = list(self._children.items())
+        for labelvalues, child in children:
+            lines.extend(self._render_child(dict(zip(self.labelnames, labelvalues)), child))
+        return lines
+
+# Monotonically increasing Counter
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return [0]
+
+    def inc(self, *labelvalues, amount: float = 1):
+        child = self._child(labelvalues)
+        with self._lock:
+            child[0] += amount
+
+    def value(self, *labelvalues) -> float:
+        return self._child(labelvalues)[0]
+
+    def _render_child(self, labels, child):
+        return [f"{self.name}_total{_format_labels(labels)} {_format_value(child[0])}"]
+
+# Gauge holding the last value that was set
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return [0]
+
+    def set(self, value: float, *labelvalues):
+        child = self._child(labelvalues)
+        with self._lock:
+            child[0] = value
+
+    def _render_child(self, labels, child):
+        return [f"{self.name}{_format_labels(labels)} {_format_value(child[0])}"]
+
+# Histogram family with one fixed-bucket Histogram per label combination
+class LabeledHistogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS, register: bool = True):
+        self.buckets = buckets
+        super().__init__(name, documentation, labelnames, register)
+
+    def _new_child(self):
+        return Histogram(self.buckets)
+
+    def labels(self, *labelvalues) -> Histogram:
+        return self._child(labelvalues)
+
+    def _render_child(self, labels, child):
+        return child.samples(self.name, labels)
+
+# Rendering a standalone Histogram (e.g. owned by the micro-batcher) as its own metric family
+def render_histogram(name: str, documentation: str, histogram: Histogram) -> list:
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} histogram", *histogram.samples(name)]
+
+# Rendering every registered metric in Prometheus text format
+def render_metrics(extra_lines=()) -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    lines.extend(extra_lines)
+    return "\n".join(lines) + "\n"
+
+# Metrics of the prediction path
+STAGE_LATENCY = LabeledHistogram("autoiq_stage_latency_seconds", "Latency of each stage of the prediction path", ("endpoint", "stage"))
+REQUESTS = Counter("autoiq_requests", "Prediction requests by endpoint and outcome", ("endpoint", "outcome"))
+RATE_LIMITED = Counter("autoiq_rate_limited_requests", "Requests rejected by the rate limiter", ("endpoint",))
+MODEL_LOAD_SECONDS = Gauge("autoiq_model_load_seconds", "Time taken to load Pipeline and Model Frequency")
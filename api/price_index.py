@@ -0,0 +1,176 @@
+# Standard Libraries
+import json
+import time
+import argparse
+import threading
+from pathlib import Path
+
+# Third-Party Libraries
+import numpy as np
+import pandas as pd
+
+# Local Modules
+from api.engine import CompiledPipeline
+from api.artifacts import load_artifact
+
+# Discrete Input fields identifying a car variant, the index is keyed by variant, year and owner
+VARIANT_COLUMNS = ["brand", "model", "engine_capacity", "fuel_type", "transmission"]
+
+# Precomputed Price Lookup Index over the discrete input space
+# Predictions are stored in one dense float32 array of shape (variants, years, owners, km grid points),
+# so a lookup is a dict access for the variant and index arithmetic for year, owner and km.
+# Only km_driven values on the grid are served : the Pipeline's trees split between grid points, so no interpolation
+# reproduces its price there, and any other km_driven is a miss answered by the Pipeline.
+class PriceIndex:
+    def __init__(self, variants, years, owners, km_grid, prices, meta=None):
+        self.variants = [tuple(variant) for variant in variants]
+        self.years = [int(year) for year in years]
+        self.owners = list(owners)
+        self.km_grid = np.asarray(km_grid, dtype=np.float64)
+        self.prices = np.asarray(prices, dtype=np.float32)
+        self.meta = meta or {}
+        if self.prices.shape != (len(self.variants), len(self.years), len(self.owners), len(self.km_grid)):
+            raise ValueError("Prices do not match the variants, years, owners and km grid")
+        if len(self.km_grid) < 2 or not np.allclose(np.diff(self.km_grid), self.km_grid[1] - self.km_grid[0]):
+            raise ValueError("km grid must have at least two evenly spaced points")
+        if self.years != list(range(self.years[0], self.years[0] + len(self.years))):
+            raise ValueError("Years must be consecutive")
+
+        self._variant_idx = {variant: idx for idx, variant in enumerate(self.variants)}
+        self._owner_idx = {owner: idx for idx, owner in enumerate(self.owners)}
+        self._km_start = float(self.km_grid[0])
+        self._km_step = float(self.km_grid[1] - self.km_grid[0])
+        self._km_end = float(self.km_grid[-1])
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    # Stored price of one car, None when it is outside the index or its km_driven is not a grid point
+    def lookup(self, brand, model, engine_capacity, fuel_type, transmission, year, owner, km_driven):
+        variant = self._variant_idx.get((brand, model, int(engine_capacity), fuel_type, transmission))
+        owner = self._owner_idx.get(owner)
+        year = int(year) - self.years[0]
+        km, offset = divmod(km_driven - self._km_start, self._km_step)
+        if variant is None or owner is None or not 0 <= year < len(self.years) or not 0 <= km < len(self.km_grid) or offset:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return float(self.prices[variant, year, owner, int(km)])
+
+    # Model features of grid cells, given as arrays of (variant, year, owner, km) positions
+    @staticmethod
+    def grid_columns(variants, years, owners, km_grid, model_freq, cells):
+        variant_idx, year_idx, owner_idx, km_idx = cells
+        variant_rows = [variants[idx] for idx in variant_idx]
+        return {
+            "brand": [variant[0] for variant in variant_rows],
+            "model_freq": [model_freq.get(variant[1]) for variant in variant_rows],
+            "km_driven": np.asarray(km_grid)[km_idx].tolist(),
+            "engine_capacity": [variant[2] for variant in variant_rows],
+            "fuel_type": [variant[3] for variant in variant_rows],
+            "transmission": [variant[4] for variant in variant_rows],
+            "year": np.asarray(years)[year_idx].tolist(),
+            "owner": [owners[idx] for idx in owner_idx]
+        }
+
+    # Predicting every grid cell with predict_fn (a mapping of column → values to an array of prices), chunk by chunk
+    @classmethod
+    def build(cls, predict_fn, model_freq, variants, years, owners, km_grid, chunk_size=200_000):
+        variants = [tuple(variant) for variant in variants if variant[1] in model_freq]
+        shape = (len(variants), len(years), len(owners), len(km_grid))
+        prices = np.empty(int(np.prod(shape)), dtype=np.float32)
+        for start in range(0, prices.size, chunk_size):
+            cells = np.unravel_index(np.arange(start, min(start + chunk_size, prices.size)), shape)
+            prices[start:start + chunk_size] = predict_fn(cls.grid_columns(variants, years, owners, km_grid, model_freq, cells))
+        return cls(variants, years, owners, km_grid, prices.reshape(shape))
+
+    # Maximum absolute difference between stored and live predictions on random grid cells
+    # A stale index (built from another Pipeline or Model Frequency) shows up as a large deviation
+    def max_deviation(self, predict_fn, model_freq, n_rows=32):
+        rng = np.random.default_rng(42)
+        cells = tuple(rng.integers(0, size, n_rows) for size in self.prices.shape)
+        columns = self.grid_columns(self.variants, self.years, self.owners, self.km_grid, model_freq, cells)
+        return float(np.max(np.abs(self.prices[cells].astype(np.float64) - predict_fn(columns))))
+
+    @property
+    def cells(self) -> int:
+        return int(self.prices.size)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        return {
+            "variants": len(self.variants),
+            "cells": self.cells,
+            "km_step": self._km_step,
+            "size_mb": round(self.prices.nbytes / 1024**2, 2),
+            "hits": hits,
+            "misses": misses
+        }
+
+    # Saving as a NumPy .npz archive (plain arrays, no pickle)
+    def save(self, path):
+        variants = np.array(self.variants, dtype=object)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                brand=variants[:, 0].astype(str), model=variants[:, 1].astype(str),
+                engine_capacity=variants[:, 2].astype(np.int16),
+                fuel_type=variants[:, 3].astype(str), transmission=variants[:, 4].astype(str),
+                years=np.array(self.years, dtype=np.int16), owners=np.array(self.owners, dtype=str),
+                km_grid=self.km_grid, prices=self.prices, meta=np.array(json.dumps(self.meta))
+            )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            variants = zip(data["brand"].tolist(), data["model"].tolist(), data["engine_capacity"].tolist(),
+                           data["fuel_type"].tolist(), data["transmission"].tolist())
+            return cls(list(variants), data["years"].tolist(), data["owners"].tolist(), data["km_grid"],
+                       data["prices"], json.loads(str(data["meta"])))
+
+# Building the index from the saved Pipeline over every variant seen in the training data
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute the price lookup index used by /predict")
+    parser.add_argument("--pipe", required=True, help="Path to the pipeline artifact (.pkl or .joblib)")
+    parser.add_argument("--model-freq", required=True, help="Path to the model frequency artifact (.pkl or .joblib)")
+    parser.add_argument("--data", default="clean_data/clean_data_after_eda.parquet", help="Parquet file with training data")
+    parser.add_argument("--output", default="models/price_index.npz", help="Where the index is written")
+    parser.add_argument("--years", type=int, nargs=2, default=[2010, 2024], metavar=("FIRST", "LAST"), help="Years covered (the API's range)")
+    parser.add_argument("--km-min", type=int, default=1000, help="First km_driven grid point")
+    parser.add_argument("--km-max", type=int, default=200000, help="Last km_driven grid point")
+    parser.add_argument("--km-step", type=int, default=1000, help="Spacing of the km_driven grid (only grid values are served)")
+    args = parser.parse_args()
+
+    pipe = load_artifact(args.pipe)
+    model_freq = load_artifact(args.model_freq)
+
+    try:
+        predict_fn = CompiledPipeline(pipe).predict
+    except TypeError:
+        predict_fn = lambda columns: pipe.predict(pd.DataFrame(columns))
+
+    cars = pd.read_parquet(args.data, engine="pyarrow")
+    cars = cars.astype({column: str for column in ["brand", "model", "fuel_type", "transmission", "owner"]})
+    variants = cars[VARIANT_COLUMNS].drop_duplicates().sort_values(VARIANT_COLUMNS).itertuples(index=False, name=None)
+    owners = sorted(cars["owner"].unique().tolist())
+    km_grid = np.arange(args.km_min, args.km_max + args.km_step, args.km_step)
+    km_grid = km_grid[km_grid <= args.km_max]
+
+    start = time.perf_counter()
+    index = PriceIndex.build(predict_fn, model_freq, list(variants), range(args.years[0], args.years[1] + 1), owners, km_grid)
+    build_seconds = time.perf_counter() - start
+
+    # Exactness check on random grid cells, the same one the API runs before serving the index
+    deviation = index.max_deviation(lambda columns: pipe.predict(pd.DataFrame(columns)), model_freq, n_rows=256)
+    index.meta = {"km_step": args.km_step, "build_seconds": round(build_seconds, 2), "max_deviation": deviation}
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    index.save(output)
+    print(f"Cells : {index.cells} ({len(index.variants)} variants × {len(index.years)} years × {len(owners)} owners × {len(km_grid)} km points)")
+    print(f"Built in {build_seconds:.1f}s, {index.prices.nbytes / 1024**2:.2f} MB written to {output}")
+    print(f"Max deviation from pipe.predict on 256 grid cells : {deviation:.3e}")
+    print(f"km_driven values off the {args.km_step} km grid are answered by the pipeline")
@@ -0,0 +1,96 @@
+# Standard Libraries
+import os
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Signature of the artifact files, it changes whenever a file is rewritten or replaced (None for a missing file)
+def artifact_signature(paths) -> tuple:
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        except OSError:
+            signature.append((str(path), None))
+    return tuple(signature)
+
+# Background Watcher reloading the models when their artifact files change
+# Every interval seconds the files are checked. A new signature must stay the same for two checks in a row
+# (so a file still being written is never loaded), then load_fn builds the new models in the watcher thread
+# and swap_fn publishes them. Requests keep using the current models until the swap, and a failed load
+# keeps them in place (the same files are not retried until they change again).
+class ArtifactWatcher:
+    def __init__(self, paths, load_fn, swap_fn, interval: float = 30.0):
+        self.paths = list(paths)
+        self.load_fn = load_fn
+        self.swap_fn = swap_fn
+        self.interval = interval
+        self.signature = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload = None
+        self._pending = None
+        self._failed = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    # signature identifies the loaded artifacts, loaded tells whether loading them succeeded
+    def start(self, signature, loaded: bool = True):
+        if loaded:
+            self.signature = signature
+        else:
+            self._failed = signature
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="artifact-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {len(self.paths)} model artifacts for changes every {self.interval:g}s")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Model artifact check failed")
+
+    # Returns True when new models were loaded and swapped in
+    def check(self) -> bool:
+        signature = artifact_signature(self.paths)
+        if signature in (self.signature, self._failed):
+            self._pending = None
+            return False
+        if signature != self._pending:
+            self._pending = signature
+            return False
+        self._pending = None
+
+        logger.info("Model artifacts changed, loading new models in the background")
+        try:
+            models = self.load_fn()
+        except Exception:
+            logger.exception("Model reload failed, keeping the current models")
+            self._failed = signature
+            self.failures += 1
+            return False
+        self.swap_fn(models)
+        self.signature = signature
+        self._failed = None
+        self.reloads += 1
+        self.last_reload = time.time()
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "interval": self.interval,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_reload": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.last_reload)) if self.last_reload else None
+        }
@@ -0,0 +1,34 @@
+# Standard Libraries
+from enum import Enum
+
+# Third-Party Libraries
+from pydantic import BaseModel, Field
+
+# Input validation for fuel_type
+class FuelType(str, Enum):
+    PETROL = "Petrol"
+    DIESEL = "Diesel"
+    CNG = "CNG"
+
+# Input validation for transmission
+class Transmission(str, Enum):
+    MANUAL = "Manual"
+    AUTOMATIC = "Automatic"
+
+# Input validation for owner
+class OwnerType(str, Enum):
+    FIRST = "1st owner"
+    SECOND = "2nd owner"
+    THIRD = "3rd owner"
+    OTHERS = "Others"
+
+# Define Input Data Schema using Pydantic
+class Input(BaseModel):
+    brand: str = Field(..., description="Brand Name of your Car", example="MG")
+    model: str = Field(..., description="Model Name of your Car", example="HECTOR")  
+    km_driven: int = Field(..., ge=1000, le=200000, description="KM Driven of your Car", example=80000)
+    engine_capacity: int = Field(..., ge=700, le=3000, description="Engine Capacity (in cc) of your Car", example=1498)
+    fuel_type: FuelType = Field(..., description="Fuel Type of your Car", example="Petrol")
+    transmission: Transmission = Field(..., description="Transmission of your Car", example="Manual")
+    year: int = Field(..., ge=2010, le=2024, description="Manufacture Year of your Car", example=2022)
+    owner: OwnerType = Field(..., description="Owner Type of your Car", example="1st owner")
@@ -0,0 +1,106 @@
+# Standard Libraries
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+
+# Third-Party Libraries
+import brotli
+from fastapi import Request
+from fastapi.responses import Response
+
+# Content types worth compressing (images are already compressed)
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "image/svg+xml")
+
+# Fingerprinted assets never change under the same URL, so browsers may keep them for a year without asking
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+# Revalidating on every use, answered with a 304 while the ETag still matches
+REVALIDATE_CACHE = "no-cache"
+
+# A Static Response compressed once (gzip and brotli) with its ETag
+# Serving is a header check: a matching If-None-Match gets an empty 304, otherwise the smallest
+# representation the client accepts is sent as is, without compressing anything per request.
+class StaticAsset:
+    def __init__(self, body: bytes, media_type: str, cache_control: str = REVALIDATE_CACHE):
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.digest = hashlib.sha256(body).hexdigest()[:16]
+        # Weak ETag, shared by the identity and compressed representations of the same content
+        self.etag = f'W/"{self.digest}"'
+        self.encodings = {"identity": body}
+        if media_type.startswith(COMPRESSIBLE_TYPES):
+            for encoding, compressed in (("br", brotli.compress(body, quality=11)), ("gzip", gzip.compress(body, 9, mtime=0))):
+                if len(compressed) < len(body):
+                    self.encodings[encoding] = compressed
+
+    @staticmethod
+    def accepted_encodings(request: Request) -> set:
+        accepted = set()
+        for part in request.headers.get("accept-encoding", "").split(","):
+            encoding, _, params = part.strip().partition(";")
+            if encoding and params.replace(" ", "") not in ("q=0", "q=0.0"):
+                accepted.add(encoding.lower())
+        return accepted
+
+    def not_modified(self, request: Request) -> bool:
+        tags = [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]
+        return "*" in tags or self.etag in tags or self.etag[2:] in tags
+
+    def response(self, request: Request, cache_control: str = None) -> Response:
+        headers = {"ETag": self.etag, "Cache-Control": cache_control or self.cache_control, "Vary": "Accept-Encoding"}
+        if self.not_modified(request):
+            return Response(status_code=304, headers=headers)
+        accepted = self.accepted_encodings(request)
+        for encoding in ("br", "gzip"):
+            if encoding in self.encodings and encoding in accepted:
+                return Response(self.encodings[encoding], media_type=self.media_type, headers={**headers, "Content-Encoding": encoding})
+        return Response(self.encodings["identity"], media_type=self.media_type, headers=headers)
+
+# Frontend (index.html, script.js, style.css and images/) loaded and compressed once
+# References between the files are rewritten to fingerprinted URLs ("style.css?v=<digest>"), so those URLs
+# are cached as immutable, while index.html is revalidated and costs only a 304 on repeat page loads.
+class StaticSite:
+    def __init__(self, folder, index: str = "index.html", files=("index.html", "script.js", "style.css"), asset_folders=("images",)):
+        folder = Path(folder)
+        self.index = index
+        self.assets = {}
+        names = [name for name in files if (folder / name).is_file()]
+        for asset_folder in asset_folders:
+            if (folder / asset_folder).is_dir():
+                names += sorted(path.relative_to(folder).as_posix() for path in (folder / asset_folder).iterdir() if path.is_file())
+        if index not in names:
+            raise FileNotFoundError(f"'{index}' not found in {folder}")
+
+        # Binary assets first, then the text files that reference them, the index page last
+        order = sorted(names, key=lambda name: (name == index, self._media_type(name).startswith(COMPRESSIBLE_TYPES)))
+        fingerprints = {}
+        for name in order:
+            body = (folder / name).read_bytes()
+            media_type = self._media_type(name)
+            if media_type.startswith(COMPRESSIBLE_TYPES):
+                body = self._rewrite(body.decode("utf-8"), fingerprints).encode("utf-8")
+            asset = StaticAsset(body, media_type)
+            self.assets[name] = asset
+            fingerprints[name] = f"{name}?v={asset.digest}"
+
+    @staticmethod
+    def _media_type(name) -> str:
+        media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        return f"{media_type}; charset=utf-8" if media_type.startswith(COMPRESSIBLE_TYPES) else media_type
+
+    @staticmethod
+    def _rewrite(text, fingerprints) -> str:
+        for name, url in fingerprints.items():
+            for quote in ('"', "'", "("):
+                closing = ")" if quote == "(" else quote
+                text = text.replace(f"{quote}{name}{closing}", f"{quote}{url}{closing}")
+        return text
+
+    # Fingerprinted URLs are immutable, anything else (the index page, stale fingerprints) is revalidated
+    def response(self, path: str, request: Request):
+        asset = self.assets.get(path or self.index)
+        if asset is None:
+            return None
+        immutable = request.query_params.get("v") == asset.digest
+        return asset.response(request, IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE)
@@ -0,0 +1,82 @@
+# Benchmark of the scalar versus vectorized cleaners in utils/helpers
+# Runs on a scaled-up copy of scrape_data/scrape_data.csv and checks both return identical results.
+# Run with : python -m benchmarks.cleaners --scale 100 --output benchmarks/results/cleaners.json
+
+# Standard Libraries
+import json
+import time
+import argparse
+from pathlib import Path
+
+# Third-Party Libraries
+import pandas as pd
+
+# Local Modules
+from utils.helpers import km_driven_cleaner, price_cleaner, km_driven_cleaner_vectorized, price_cleaner_vectorized, split_model_name
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_PATH = ROOT / "scrape_data" / "scrape_data.csv"
+
+# Same preparation as notebooks/step_1_data_preprocessing.ipynb, before the cleaners are applied
+def load_raw(data_path, scale):
+    cars = pd.read_csv(data_path)
+    cars = pd.concat([cars] * scale, ignore_index=True)
+    cars['km_driven'] = cars['km_driven'].str.split(' ').str.get(0)
+    cars = cars[(cars['km_driven'].str.endswith('k')) | (cars['km_driven'].str.endswith('L'))]
+    cars['price'] = cars['price'].str.replace('₹', '')
+    return cars
+
+# Row-wise apply and chained .str passes, as in the preprocessing notebook
+def scalar_path(cars):
+    names = cars['model_name'].str.strip()
+    return pd.DataFrame({
+        'year': names.str.split(' ', n=1).str.get(0).astype(int),
+        'brand': cars['model_name'].str.split(' ').str.get(1),
+        'model': names.str.split(' ', n=2).str.get(-1),
+        'km_driven': cars['km_driven'].apply(km_driven_cleaner).astype('int64'),
+        'price': cars['price'].apply(price_cleaner).astype('int64')
+    })
+
+def vectorized_path(cars):
+    return pd.concat([
+        split_model_name(cars['model_name']),
+        km_driven_cleaner_vectorized(cars['km_driven']),
+        price_cleaner_vectorized(cars['price'])
+    ], axis=1)
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scalar versus vectorized cleaners")
+    parser.add_argument("--data", default=str(DATA_PATH), help="Raw scraped CSV file")
+    parser.add_argument("--scale", type=int, default=100, help="Number of copies of the CSV to concatenate")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path (best time is kept)")
+    parser.add_argument("--output", default=None, help="Optional path to write JSON results")
+    args = parser.parse_args()
+
+    cars = load_raw(args.data, args.scale)
+    scalar, scalar_seconds = best_time(lambda: scalar_path(cars), args.repeat)
+    vectorized, vectorized_seconds = best_time(lambda: vectorized_path(cars), args.repeat)
+    pd.testing.assert_frame_equal(scalar, vectorized[scalar.columns], check_dtype=False)
+
+    results = {
+        "rows": len(cars),
+        "scalar_seconds": scalar_seconds,
+        "vectorized_seconds": vectorized_seconds,
+        "speedup": scalar_seconds / vectorized_seconds,
+        "identical": True
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
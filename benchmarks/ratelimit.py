@@ -0,0 +1,100 @@
+# Benchmark of the rate-limit storages used by the API Limiter
+# Measures the cost of one limiter check (what slowapi does per request) with several worker processes
+# and threads hitting the storage at once, and checks that a shared storage enforces the limit across processes.
+# Run with : python -m benchmarks.ratelimit --processes 4 --threads 8 --output benchmarks/results/ratelimit.json
+
+# Standard Libraries
+import os
+import json
+import time
+import argparse
+import tempfile
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-Party Libraries
+import numpy as np
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import STRATEGIES
+
+# Local Modules
+from api import ratelimit  # noqa: F401 (registers the "sqlite://" rate limit storage)
+
+# Hitting the limiter from several threads of one process
+# Returns per-check latencies (in seconds), accepted hits and the wall time of the hits
+def hammer(uri, strategy, limit, checks, threads, clients, seed):
+    limiter = STRATEGIES[strategy](storage_from_string(uri))
+    item = parse(limit)
+    rng = np.random.default_rng(seed)
+    keys = [f"10.0.{i // 256}.{i % 256}" for i in rng.integers(0, clients, checks)]
+
+    def run(chunk):
+        timings, accepted = [], 0
+        for key in chunk:
+            start = time.perf_counter()
+            accepted += limiter.hit(item, key, "/predict")
+            timings.append(time.perf_counter() - start)
+        return timings, accepted
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(run, [keys[i::threads] for i in range(threads)]))
+    wall = time.perf_counter() - start
+    return [t for timings, _ in results for t in timings], sum(accepted for _, accepted in results), wall
+
+def worker(args):
+    return hammer(*args)
+
+def run_processes(uri, strategy, limit, checks, processes, threads, clients):
+    context = multiprocessing.get_context("spawn")
+    jobs = [(uri, strategy, limit, checks, threads, clients, seed) for seed in range(processes)]
+    with context.Pool(processes) as pool:
+        results = pool.map(worker, jobs)
+    timings = np.array([t for timings, _, _ in results for t in timings])
+    # Processes run side by side, so the slowest one bounds the aggregate throughput
+    wall = max(wall for _, _, wall in results)
+    return timings, sum(accepted for _, accepted, _ in results), wall
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rate-limit storages under concurrency")
+    parser.add_argument("--processes", type=int, default=4, help="Worker processes hitting the storage")
+    parser.add_argument("--threads", type=int, default=8, help="Threads per process")
+    parser.add_argument("--checks", type=int, default=5000, help="Limiter checks per process")
+    parser.add_argument("--clients", type=int, default=10000, help="Distinct client addresses")
+    parser.add_argument("--output", default=None, help="Optional path to write JSON results")
+    args = parser.parse_args()
+
+    sqlite_path = os.path.join(tempfile.mkdtemp(), "ratelimit.sqlite")
+    storages = {
+        "memory_fixed_window": ("memory://", "fixed-window"),
+        "sqlite_fixed_window": (f"sqlite://{sqlite_path}", "fixed-window"),
+        "sqlite_sliding_window": (f"sqlite://{sqlite_path}", "sliding-window-counter")
+    }
+    results = {"processes": args.processes, "threads": args.threads, "checks_per_process": args.checks, "storages": {}}
+    for name, (uri, strategy) in storages.items():
+        # Cost per check, with a limit high enough that every check is accepted
+        timings, _, wall = run_processes(uri, strategy, "1000000/minute", args.checks, args.processes, args.threads, args.clients)
+        # Enforcement : every process hits the same client 20 times against the API's "5/minute"
+        _, accepted, _ = run_processes(uri, strategy, "5/minute", 20, args.processes, 1, 1)
+        storage_from_string(uri).reset()
+        results["storages"][name] = {
+            "p50_us": float(np.percentile(timings, 50) * 1e6),
+            "p99_us": float(np.percentile(timings, 99) * 1e6),
+            "mean_us": float(timings.mean() * 1e6),
+            "checks_per_second": len(timings) / wall,
+            "accepted_of_5_per_minute": accepted
+        }
+        stats = results["storages"][name]
+        print(f"{name:<22} : p50 {stats['p50_us']:7.1f}µs  p99 {stats['p99_us']:8.1f}µs  "
+              f"{stats['checks_per_second']:9.0f} checks/s  accepted {accepted} (limit 5)")
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# Reproducible Benchmark Suite for the API and the Model Pipeline
+# Runs offline against clean_data/*.parquet with a locally trained pipeline and writes JSON results.
+# Run with : python -m benchmarks.run --output benchmarks/results/latest.json
+
+# Standard Libraries
+import os
+import gc
+import sys
+import json
+import time
+import pickle
+import asyncio
+import argparse
+import platform
+import resource
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from pathlib import Path
+from datetime import datetime, timezone
+
+# Third-Party Libraries
+import numpy as np
+import pandas as pd
+import sklearn
+import xgboost
+
+# Local Modules
+from training.stages import prepare_features, train
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_PATH = ROOT / "clean_data" / "clean_data_after_eda.parquet"
+
+# Training the shipped pipeline (training.stages, the notebook's best parameters) with n_estimators trees per base estimator
+def train_pipeline(data_path, n_estimators):
+    cars = pd.read_parquet(data_path, engine="pyarrow")
+    params = {f"model__{name}__n_estimators": n_estimators for name in ("rf", "xgb", "gb")}
+    pipe, model_freq, metrics = train(cars, params=params)
+    X, _, _ = prepare_features(cars)
+    return pipe, model_freq, X, {"fit_seconds": metrics["fit_seconds"], "test_mae": metrics["test_mae"], "rows": metrics["rows"]}
+
+# Timing a callable and summarising the per-call latency
+def timeit(fn, repeat, warmup=3):
+    for _ in range(warmup):
+        fn()
+    timings = []
+    gc.collect()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "calls": repeat,
+        "mean_ms": statistics.fmean(timings) * 1000,
+        "p50_ms": timings[len(timings) // 2] * 1000,
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000,
+        "min_ms": timings[0] * 1000
+    }
+
+# Peak Python allocations (tracemalloc) of a single call, in MB
+def peak_allocations(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    finally:
+        tracemalloc.stop()
+
+# Single-row versus N-row predict throughput for the Pipeline and the compiled engine
+def bench_predict(pipe, X, batch_sizes, repeat):
+    from api.engine import CompiledPipeline
+    engine = CompiledPipeline(pipe)
+    results = {}
+    for size in batch_sizes:
+        frame = X.sample(n=size, replace=size > len(X), random_state=42).reset_index(drop=True)
+        columns = {col: frame[col].astype(object).tolist() for col in frame.columns}
+        calls = max(3, repeat // size) if size > 1 else repeat
+        pipe_stats = timeit(lambda: pipe.predict(frame), calls)
+        engine_stats = timeit(lambda: engine.predict(columns), calls)
+        results[str(size)] = {
+            "pipeline": {**pipe_stats, "rows_per_second": size / (pipe_stats["mean_ms"] / 1000),
+                         "peak_alloc_mb": peak_allocations(lambda: pipe.predict(frame))},
+            "compiled": {**engine_stats, "rows_per_second": size / (engine_stats["mean_ms"] / 1000),
+                         "peak_alloc_mb": peak_allocations(lambda: engine.predict(columns))}
+        }
+    return results
+
+# End-to-end /predict latency through an in-process ASGI client, plus lifespan load time
+async def bench_api(repeat):
+    import httpx
+    from api.main import app, limiter
+    limiter.enabled = False
+
+    start = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        lifespan_seconds = time.perf_counter() - start
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            car = {"brand": "MG", "model": "HECTOR", "km_driven": 80000, "engine_capacity": 1498,
+                   "fuel_type": "Petrol", "transmission": "Manual", "year": 2022, "owner": "1st owner"}
+
+            async def timed(payloads):
+                timings = []
+                for payload in payloads:
+                    begin = time.perf_counter()
+                    response = await client.post("/predict", json=payload)
+                    timings.append(time.perf_counter() - begin)
+                    if "output" not in response.json():
+                        raise RuntimeError(f"Unexpected response: {response.text}")
+                timings.sort()
+                return {
+                    "calls": len(timings),
+                    "mean_ms": statistics.fmean(timings) * 1000,
+                    "p50_ms": timings[len(timings) // 2] * 1000,
+                    "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000
+                }
+
+            await timed([car] * 3)
+            # Distinct km_driven values so every request misses the prediction cache
+            uncached = await timed([{**car, "km_driven": 1000 + i} for i in range(repeat)])
+            cached = await timed([car] * repeat)
+            batch_items = [{**car, "km_driven": 1000 + i} for i in range(100)]
+            begin = time.perf_counter()
+            await client.post("/predict/batch", json={"items": batch_items})
+            batch_ms = (time.perf_counter() - begin) * 1000
+
+        return {
+            "lifespan_seconds": lifespan_seconds,
+            "model_load_seconds": app.state.models.load_seconds,
+            "compiled_inference": app.state.models.engine is not None,
+            "predict_uncached": uncached,
+            "predict_cached": cached,
+            "predict_batch_100_ms": batch_ms
+        }
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the AutoIQ model pipeline and API")
+    parser.add_argument("--data", default=str(DATA_PATH), help="Parquet file used to train and sample inputs")
+    parser.add_argument("--output", default=str(ROOT / "benchmarks" / "results" / "latest.json"), help="Where to write the JSON results")
+    parser.add_argument("--n-estimators", type=int, default=200, help="Trees per base estimator of the trained pipeline")
+    parser.add_argument("--batch-sizes", default="1,10,100,1000", help="Comma-separated batch sizes for predict throughput")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per latency measurement")
+    parser.add_argument("--quick", action="store_true", help="Smaller model and fewer calls, for a smoke run")
+    args = parser.parse_args()
+    if args.quick:
+        args.n_estimators, args.repeat = 20, 30
+
+    batch_sizes = [int(size) for size in args.batch_sizes.split(",")]
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "versions": {"numpy": np.__version__, "pandas": pd.__version__, "scikit-learn": sklearn.__version__, "xgboost": xgboost.__version__},
+            "args": vars(args)
+        }
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("Training pipeline ...")
+        pipe, model_freq, X, training = train_pipeline(args.data, args.n_estimators)
+        results["training"] = training
+        pipe_path, model_freq_path = Path(tmp) / "pipe.pkl", Path(tmp) / "model_freq.pkl"
+        with open(pipe_path, "wb") as f:
+            pickle.dump(pipe, f)
+        with open(model_freq_path, "wb") as f:
+            pickle.dump(model_freq, f)
+        results["artifact_mb"] = pipe_path.stat().st_size / 1024 ** 2
+
+        print("Benchmarking predict throughput ...")
+        results["predict"] = bench_predict(pipe, X, batch_sizes, args.repeat)
+
+        print("Benchmarking API ...")
+        os.environ.update({
+            "MAE": str(round(training["test_mae"])),
+            "PIPE_PATH": str(pipe_path),
+            "MODEL_FREQ_PATH": str(model_freq_path),
+            "ALLOWED_ORIGINS": "http://localhost"
+        })
+        results["api"] = asyncio.run(bench_api(args.repeat))
+
+    results["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results written to {output}")
+
+if __name__ == "__main__":
+    main()
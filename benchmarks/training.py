@@ -0,0 +1,52 @@
+# Benchmark of the hyperparameter search of step_4_model_building
+# Compares the notebook setup (RandomizedSearchCV with n_jobs=-1 at every layer) against the same search
+# and a successive-halving search run with one shared core budget and cached preprocessors.
+# Run with : python -m benchmarks.training --output benchmarks/results/training.json
+
+# Standard Libraries
+import os
+import json
+import argparse
+from pathlib import Path
+
+# Third-Party Libraries
+import pandas as pd
+
+# Local Modules
+from training.stages import train
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_PATH = ROOT / "clean_data" / "clean_data_after_eda.parquet"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the notebook search against the core-budgeted searches")
+    parser.add_argument("--data", default=str(DATA_PATH), help="Parquet file with the EDA output")
+    parser.add_argument("--cores", type=int, default=os.cpu_count(), help="Core budget of the budgeted runs")
+    parser.add_argument("--n-iter", type=int, default=30, help="Candidates of each search")
+    parser.add_argument("--cv-splits", type=int, default=5, help="Folds of the search and the stacking")
+    parser.add_argument("--quick", action="store_true", help="6 candidates with 3 folds, for a smoke run")
+    parser.add_argument("--output", default=None, help="Optional path to write JSON results")
+    args = parser.parse_args()
+    if args.quick:
+        args.n_iter, args.cv_splits = 6, 3
+
+    cars = pd.read_parquet(args.data, engine="pyarrow")
+    runs = {
+        "notebook_random": {"search": "random", "n_cores": None},
+        "budget_random": {"search": "random", "n_cores": args.cores},
+        "budget_halving": {"search": "halving", "n_cores": args.cores}
+    }
+    results = {"cores": args.cores, "n_iter": args.n_iter, "cv_splits": args.cv_splits, "runs": {}}
+    for name, config in runs.items():
+        _, _, metrics = train(cars, {"cv_splits": args.cv_splits}, n_iter=args.n_iter, **config)
+        results["runs"][name] = {key: metrics[key] for key in ("fit_seconds", "best_cv_mae", "test_mae", "jobs", "params")}
+        print(f"{name:<16} : {metrics['fit_seconds']:8.1f}s  best CV MAE {metrics['best_cv_mae']:.0f}  test MAE {metrics['test_mae']:.0f}")
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
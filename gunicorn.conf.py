@@ -0,0 +1,24 @@
+# Multi-worker Serving Mode
+# Run with : gunicorn -c gunicorn.conf.py api.main:app
+
+# Standard Libraries
+import os
+
+# Loading models once in the master process, before workers are forked
+# PRELOAD_MODELS makes api.main load the Pipeline at import time, so every worker shares its pages
+os.environ.setdefault("PRELOAD_MODELS", "true")
+preload_app = True
+
+# Binding to the port provided by the platform (Render / Docker)
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+
+# Number of Uvicorn workers
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+
+# Sharing rate-limit counters between workers (SQLite on /dev/shm), so "5/minute" stays 5 per client, not 5 × workers
+os.environ.setdefault("RATE_LIMIT_STORAGE_URI", "sqlite://")
+os.environ.setdefault("RATE_LIMIT_STRATEGY", "sliding-window-counter")
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Giving workers enough time to compile and warm up the model on start
+timeout = 120
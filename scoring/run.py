@@ -0,0 +1,245 @@
+# Offline Bulk Scoring
+# Streams a Parquet/CSV file (or partitioned Parquet folder) of listings in record batches, validates every row
+# like the API's Input schema, scores valid rows across a process pool (each worker loads the Pipeline once)
+# and writes predictions with their ± MAE range to Parquet. Invalid rows go to a CSV reject file with the reason.
+# Run with : python -m scoring.run datasets/listings --output scored.parquet --pipe models/pipe.pkl --mae 80000
+
+# Standard Libraries
+import os
+import csv
+import time
+import argparse
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Third-Party Libraries
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# Local Modules
+from api.schemas import Input
+from api.engine import CompiledPipeline
+from api.artifacts import load_artifact
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Input fields in the API's order
+INPUT_FIELDS = list(Input.model_fields)
+
+# Validation rules derived from the Input JSON schema, so they always match /predict
+# field → ("enum", allowed values), ("int", minimum, maximum) or ("str",)
+def input_rules():
+    schema = Input.model_json_schema()
+    rules = {}
+    for field, prop in schema["properties"].items():
+        if "$ref" in prop:
+            rules[field] = ("enum", schema["$defs"][prop["$ref"].rsplit("/", 1)[-1]]["enum"])
+        elif prop.get("type") == "integer":
+            rules[field] = ("int", prop.get("minimum", -np.inf), prop.get("maximum", np.inf))
+        else:
+            rules[field] = ("str",)
+    return rules
+
+INPUT_RULES = input_rules()
+
+# Bringing a batch to the Input fields
+# Scraped listings (model_name "2016 Maruti Alto 800", km_driven "17.92k km", engine_capacity "796cc") are parsed
+# like the preprocessing notebook, values that cannot be parsed become missing and the row is rejected.
+def normalize_listings(frame):
+    if "model_name" not in frame.columns:
+        return frame.reindex(columns=INPUT_FIELDS)
+    title = frame["model_name"].astype("string").str.strip().str.split(" ", n=2, expand=True).reindex(columns=[0, 1, 2])
+    km = frame["km_driven"].astype("string").str.strip().str.split(" ").str.get(0)
+    multiplier = np.select([km.str.endswith("L").fillna(False), km.str.endswith("k").fillna(False)], [100000, 1000], np.nan)
+    km_driven = (pd.to_numeric(km.str.rstrip("kL"), errors="coerce") * multiplier).round()
+    return pd.DataFrame({
+        "brand": title[1],
+        "model": title[2],
+        "km_driven": km_driven,
+        "engine_capacity": pd.to_numeric(frame["engine_capacity"].astype("string").str.replace("cc", "").str.strip(), errors="coerce"),
+        "fuel_type": frame["fuel_type"].astype("string").str.strip(),
+        "transmission": frame["transmission"].astype("string").str.strip().replace({"Auto": "Automatic"}),
+        "year": pd.to_numeric(title[0], errors="coerce"),
+        "owner": frame["owner"].astype("string").str.strip()
+    }, index=frame.index)
+
+# Reason each row fails the Input rules or is an unseen model ("" for valid rows), the first failing field wins
+def validate_listings(cars, model_freq):
+    reasons = pd.Series("", index=cars.index, dtype=object)
+    for field, rule in INPUT_RULES.items():
+        values = cars[field]
+        if rule[0] == "enum":
+            invalid = ~values.astype("string").isin(rule[1]).fillna(False)
+            message = f"{field}: must be one of {', '.join(rule[1])}"
+        elif rule[0] == "int":
+            numbers = pd.to_numeric(values, errors="coerce")
+            invalid = (numbers.isna() | (numbers % 1 != 0) | (numbers < rule[1]) | (numbers > rule[2])).fillna(True)
+            message = f"{field}: must be an integer between {rule[1]} and {rule[2]}"
+        else:
+            invalid = (values.isna() | (values.astype("string").str.len() == 0)).fillna(True)
+            message = f"{field}: is required"
+        reasons = reasons.mask((reasons == "") & invalid.to_numpy(), message)
+    unsupported = ~cars["model"].astype("string").isin(list(model_freq)).fillna(False)
+    return reasons.mask((reasons == "") & unsupported.to_numpy(), "model: not supported")
+
+# Rounding to significant figures (half away from zero, like sigfig.round used by the API's price_limits)
+def round_sigfigs(values, sigfigs=3):
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.floor(np.log10(np.abs(np.where(values == 0, 1, values))))
+    scale = 10.0 ** (sigfigs - 1 - magnitude)
+    return np.sign(values) * np.floor(np.abs(values) * scale + 0.5) / scale
+
+# Models of each worker process, loaded once by init_worker
+_WORKER = {}
+
+def init_worker(pipe_path, model_freq_path):
+    pipe = load_artifact(pipe_path)
+    try:
+        predict = CompiledPipeline(pipe).predict
+    except TypeError:
+        predict = lambda columns: pipe.predict(pd.DataFrame(columns))
+    _WORKER.update(predict=predict, model_freq=load_artifact(model_freq_path))
+
+# Scoring one record batch : positions and predictions of the valid rows, positions and reasons of the rejected ones
+def score_batch(batch, mae):
+    frame = batch.to_pandas()
+    cars = normalize_listings(frame)
+    reasons = validate_listings(cars, _WORKER["model_freq"]).to_numpy()
+    valid = np.flatnonzero(reasons == "")
+    rejected = np.flatnonzero(reasons != "")
+
+    predictions = np.empty(0)
+    if len(valid):
+        cars = cars.iloc[valid]
+        columns = {
+            "brand": cars["brand"].astype(str).to_numpy(),
+            "model_freq": cars["model"].astype(str).map(_WORKER["model_freq"]).to_numpy(dtype=np.float64),
+            "km_driven": cars["km_driven"].astype(np.int64).to_numpy(),
+            "engine_capacity": cars["engine_capacity"].astype(np.int64).to_numpy(),
+            "fuel_type": cars["fuel_type"].astype(str).to_numpy(),
+            "transmission": cars["transmission"].astype(str).to_numpy(),
+            "year": cars["year"].astype(np.int64).to_numpy(),
+            "owner": cars["owner"].astype(str).to_numpy()
+        }
+        predictions = np.asarray(_WORKER["predict"](columns), dtype=np.float64)
+    return {
+        "valid": valid,
+        "prediction": predictions,
+        "lower": round_sigfigs(predictions - mae).astype(np.int64),
+        "upper": round_sigfigs(predictions + mae).astype(np.int64),
+        "rejected": rejected,
+        "reasons": reasons[rejected]
+    }
+
+# Streaming the source in record batches : a CSV file (every column read as text) or a Parquet file / partitioned folder
+def iter_batches(source, batch_size):
+    source = Path(source)
+    if source.suffix.lower() == ".csv":
+        with open(source, newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f))
+        reader = pa_csv.open_csv(source, read_options=pa_csv.ReadOptions(block_size=1 << 24),
+                                 convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in header}))
+        pending, pending_rows = [], 0
+        for batch in reader:
+            # CSV blocks are sized in bytes, re-slicing them keeps batches at batch_size rows
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= batch_size:
+                table = pa.Table.from_batches(pending)
+                yield from table.slice(0, batch_size).combine_chunks().to_batches()
+                rest = table.slice(batch_size)
+                pending, pending_rows = rest.combine_chunks().to_batches(), rest.num_rows
+        if pending_rows:
+            yield from pa.Table.from_batches(pending).combine_chunks().to_batches()
+    else:
+        partitioning = "hive" if source.is_dir() else None
+        yield from ds.dataset(source, format="parquet", partitioning=partitioning).to_batches(batch_size=batch_size)
+
+# Writing the scored rows and the rejects of one batch
+def write_results(batch, result, first_row, writers, paths):
+    if writers.get("scored") is None:
+        schema = batch.schema
+        for name, type_ in (("row", pa.int64()), ("prediction", pa.float64()), ("lower", pa.int64()), ("upper", pa.int64())):
+            schema = schema.append(pa.field(name, type_))
+        writers["scored"] = pq.ParquetWriter(paths["output"], schema, compression="zstd")
+    table = pa.Table.from_batches([batch.take(pa.array(result["valid"], type=pa.int64()))])
+    for name, values in (("row", result["valid"] + first_row), ("prediction", result["prediction"]),
+                         ("lower", result["lower"]), ("upper", result["upper"])):
+        table = table.append_column(name, pa.array(values))
+    writers["scored"].write_table(table)
+
+    if len(result["rejected"]):
+        rejects = batch.take(pa.array(result["rejected"], type=pa.int64())).to_pandas()
+        rejects.insert(0, "row", result["rejected"] + first_row)
+        rejects["reason"] = result["reasons"]
+        header = not writers.get("rejects_started")
+        rejects.to_csv(paths["rejects"], mode="w" if header else "a", header=header, index=False)
+        writers["rejects_started"] = True
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a file of listings offline, in batches across worker processes")
+    parser.add_argument("source", help="Parquet file, partitioned Parquet folder or CSV file of listings (scraped or API format)")
+    parser.add_argument("--output", required=True, help="Parquet file for the scored rows")
+    parser.add_argument("--rejects", default=None, help="CSV file for the invalid rows (default <output>.rejects.csv)")
+    parser.add_argument("--pipe", default=str(ROOT / "models" / "pipe.pkl"), help="Pipeline artifact (.pkl or .joblib)")
+    parser.add_argument("--model-freq", default=str(ROOT / "models" / "model_freq.pkl"), help="Model Frequency artifact")
+    parser.add_argument("--mae", type=int, default=int(os.environ["MAE"]) if os.getenv("MAE") else None,
+                        help="MAE of the Pipeline for the lower/upper range (default the MAE environment variable)")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per record batch")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Scoring processes (0 scores in this process)")
+    args = parser.parse_args()
+    if args.mae is None:
+        parser.error("--mae is required when the MAE environment variable is not set")
+
+    paths = {"output": Path(args.output), "rejects": Path(args.rejects or Path(args.output).with_suffix(".rejects.csv"))}
+    paths["output"].parent.mkdir(parents=True, exist_ok=True)
+    paths["rejects"].unlink(missing_ok=True)
+    writers, totals = {}, {"rows": 0, "scored": 0, "rejected": 0}
+    start = last_report = time.perf_counter()
+
+    def collect(batch, result, first_row):
+        nonlocal last_report
+        write_results(batch, result, first_row, writers, paths)
+        totals["rows"] += batch.num_rows
+        totals["scored"] += len(result["valid"])
+        totals["rejected"] += len(result["rejected"])
+        if time.perf_counter() - last_report >= 5:
+            last_report = time.perf_counter()
+            print(f"{totals['rows']:>12,} rows  {totals['rows'] / (last_report - start):10,.0f} rows/s")
+
+    try:
+        first_row = 0
+        if args.workers == 0:
+            init_worker(args.pipe, args.model_freq)
+            for batch in iter_batches(args.source, args.batch_size):
+                collect(batch, score_batch(batch, args.mae), first_row)
+                first_row += batch.num_rows
+        else:
+            # At most two batches per worker are in flight, so memory stays bounded and output keeps the source order
+            with ProcessPoolExecutor(args.workers, initializer=init_worker, initargs=(args.pipe, args.model_freq)) as pool:
+                pending = deque()
+                for batch in iter_batches(args.source, args.batch_size):
+                    pending.append((batch, pool.submit(score_batch, batch, args.mae), first_row))
+                    first_row += batch.num_rows
+                    if len(pending) >= 2 * args.workers:
+                        batch, future, row = pending.popleft()
+                        collect(batch, future.result(), row)
+                while pending:
+                    batch, future, row = pending.popleft()
+                    collect(batch, future.result(), row)
+    finally:
+        if writers.get("scored") is not None:
+            writers["scored"].close()
+
+    seconds = time.perf_counter() - start
+    print(f"Rows : {totals['rows']:,} read, {totals['scored']:,} scored, {totals['rejected']:,} rejected")
+    print(f"Time : {seconds:.1f}s ({totals['rows'] / seconds:,.0f} rows/s with {args.workers} workers)")
+    print(f"Scored rows written to {paths['output']}" + (f", rejects to {paths['rejects']}" if totals["rejected"] else ""))
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+// API Base URL (same origin when the page is served by the API under /app/)
+const API_URL = window.location.pathname.startsWith("/app/") ? window.location.origin : "https://autoiq.onrender.com";
+
 // Reset Button
 function resetForm() {
     document.querySelectorAll("input, select").forEach(el => {
@@ -19,7 +22,8 @@ function resetForm() {
 }
 
 // Filtering Models by Brand Names
-const brandModelMap = {
+// Fallback choices, replaced by the models the API actually serves once /metadata is loaded
+let brandModelMap = {
     'Maruti': ['Wagon R 1.0', 'Alto 800', 'Ertiga', 'New Wagon-R', 'S PRESSO', 'Alto K10', 'Baleno', 'Swift', 'Swift Dzire', 'Ciaz', 'Celerio', 'Grand Vitara', 'BREZZA', 'Alto', 'Eeco', 'Celerio X', 'Vitara Brezza', 'FRONX', 'S Cross', 'Ritz', 'Dzire', 'IGNIS', 'XL6'],
     'Tata': ['Tiago', 'Zest', 'NEXON', 'Harrier', 'PUNCH', 'TIGOR', 'ALTROZ', 'TIAGO NRG', 'Safari', 'Curvv', 'Bolt', 'Hexa'],
     'Nissan': ['MAGNITE', 'Micra Active', 'Micra', 'Kicks', 'Terrano'],
@@ -40,6 +44,35 @@ const brandModelMap = {
     'Mercedes': ['Benz C Class', 'Benz GLA Class', 'Benz CLA Class'],
 };
 
+// Loading Brand and Model choices of the deployed model (cached by the browser, revalidated with its ETag)
+async function loadMetadata() {
+    try {
+        const response = await fetch(`${API_URL}/metadata`);
+        const metadata = await response.json();
+        if (!metadata.brands || Object.keys(metadata.brands).length === 0) {
+            return;
+        }
+        brandModelMap = metadata.brands;
+
+        const brandSelect = document.getElementById('brand');
+        const selectedBrand = brandSelect.value;
+        brandSelect.innerHTML = '<option value="">Select Brand of your Car</option>';
+        Object.keys(brandModelMap).forEach(brand => {
+            const option = document.createElement('option');
+            option.value = brand;
+            option.textContent = brand;
+            brandSelect.appendChild(option);
+        });
+        if (selectedBrand in brandModelMap) {
+            brandSelect.value = selectedBrand;
+        }
+    } catch (error) {
+        console.warn("Metadata not available, using built-in Brand and Model choices", error);
+    }
+}
+
+loadMetadata();
+
 document.getElementById('brand').addEventListener('change', function () {
     const selectedBrand = this.value;
     const modelSelect = document.getElementById('model');
@@ -134,7 +167,7 @@ async function predict() {
 
     // API Request for Prediction
     try {
-        const fetchPromise = fetch("https://autoiq.onrender.com/predict", {
+        const fetchPromise = fetch(`${API_URL}/predict`, {
             method: "POST",
             headers: { "Content-Type": "application/json" },
             body: JSON.stringify(data),
@@ -0,0 +1,61 @@
+# Standard Libraries
+import pickle
+import socket
+import threading
+from pathlib import Path
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+# Third-Party Libraries
+import pytest
+
+# Local Modules
+from benchmarks.run import DATA_PATH, train_pipeline
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# Local HTTP stand-in for the listing site, serving the saved pages of tests/fixtures
+# Paths under /error/ answer 500, so retries and failed fetches can be exercised without the network.
+class SavedPageHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/error/"):
+            self.send_error(500)
+            return
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope="session")
+def page_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(SavedPageHandler, directory=str(FIXTURES)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+# URL on a local port nothing listens on (connection refused)
+@pytest.fixture
+def dead_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/listing.html"
+
+# Small Pipeline and Model Frequency trained once per session, with the settings api.main reads on its first import
+@pytest.fixture(scope="session")
+def model_artifacts(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("models")
+    pipe, model_freq, _, training = train_pipeline(DATA_PATH, n_estimators=5)
+    (folder / "pipe.pkl").write_bytes(pickle.dumps(pipe))
+    (folder / "model_freq.pkl").write_bytes(pickle.dumps(model_freq))
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("MAE", str(round(training["test_mae"])))
+        monkeypatch.setenv("PIPE_PATH", str(folder / "pipe.pkl"))
+        monkeypatch.setenv("MODEL_FREQ_PATH", str(folder / "model_freq.pkl"))
+        monkeypatch.setenv("ALLOWED_ORIGINS", "http://localhost")
+        monkeypatch.setenv("MODEL_RELOAD_INTERVAL", "0")
+        yield {"pipe": pipe, "model_freq": model_freq}
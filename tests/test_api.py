@@ -0,0 +1,39 @@
+# Third-Party Libraries
+import pytest
+from fastapi.testclient import TestClient
+
+# Local Modules
+from api.artifacts import ModelSet
+
+CAR = {"brand": "Maruti", "km_driven": 45000, "engine_capacity": 1197, "fuel_type": "Petrol",
+       "transmission": "Manual", "year": 2018, "owner": "1st owner"}
+
+# api.main is imported once the settings of model_artifacts are in the environment
+@pytest.fixture
+def client(model_artifacts, monkeypatch):
+    from api.main import app, limiter
+    monkeypatch.setattr(limiter, "enabled", False)
+    with TestClient(app) as client:
+        yield client
+
+def post_everywhere(client, car):
+    return [
+        client.post("/predict", json=car).json(),
+        client.post("/predict/batch", json={"items": [car]}).json()["outputs"][0],
+        client.post("/predict/sweep", json={"car": car, "year": [2016, 2018]}).json()
+    ]
+
+def test_endpoints_predict_a_known_model(client, model_artifacts):
+    known, batch, sweep = post_everywhere(client, {**CAR, "model": next(iter(model_artifacts["model_freq"]))})
+    assert known["output"] == batch["output"] == sweep["points"][1]["output"]
+
+def test_endpoints_reject_an_unknown_model_the_same_way(client):
+    responses = post_everywhere(client, {**CAR, "model": "NOT-A-MODEL"})
+    assert responses == [{"error": "Model 'NOT-A-MODEL' is not supported"}] * 3
+
+def test_endpoints_reject_requests_while_models_are_not_loaded(client, model_artifacts, monkeypatch):
+    monkeypatch.setattr(client.app.state, "models", ModelSet())
+    car = {**CAR, "model": next(iter(model_artifacts["model_freq"]))}
+    assert client.post("/predict", json=car).json() == {"error": "Pipeline is not available"}
+    assert client.post("/predict/batch", json={"items": [car]}).json() == {"error": "Pipeline is not available"}
+    assert client.post("/predict/sweep", json={"car": car, "year": [2016, 2018]}).json() == {"error": "Pipeline is not available"}
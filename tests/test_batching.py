@@ -0,0 +1,39 @@
+# Standard Libraries
+import asyncio
+
+# Local Modules
+from api.batching import MicroBatcher
+
+# Stand-in for a ModelSet, predicting its own price for every row
+class FakeModels:
+    def __init__(self, price):
+        self.price = price
+
+def predict_fn(models, columns):
+    return [models.price] * len(columns["km_driven"])
+
+async def predict_concurrently(batcher, submissions):
+    await batcher.start()
+    try:
+        return await asyncio.gather(*(batcher.submit(models, {"km_driven": [km]}) for models, km in submissions))
+    finally:
+        await batcher.stop()
+
+def test_rows_of_one_version_share_a_call():
+    calls = []
+    def recording_predict_fn(models, columns):
+        calls.append(columns)
+        return predict_fn(models, columns)
+
+    batcher = MicroBatcher(recording_predict_fn, max_wait_ms=50)
+    models = FakeModels(100)
+    assert asyncio.run(predict_concurrently(batcher, [(models, 1000), (models, 2000), (models, 3000)])) == [100, 100, 100]
+    assert calls == [{"km_driven": [1000, 2000, 3000]}]
+
+# A reload between submit and flush : every row is still predicted by the models it was submitted with
+def test_rows_are_predicted_by_their_own_version():
+    old, new = FakeModels(100), FakeModels(200)
+    batcher = MicroBatcher(predict_fn, max_wait_ms=50)
+    results = asyncio.run(predict_concurrently(batcher, [(old, 1000), (new, 2000), (old, 3000)]))
+    assert results == [100, 200, 100]
+    assert batcher.batch_size.snapshot()["count"] == 2
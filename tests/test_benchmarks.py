@@ -0,0 +1,12 @@
+# Standard Libraries
+import asyncio
+
+# Local Modules
+from benchmarks.run import bench_api
+
+# Smoke test of the API benchmark : it drives api.main end to end, so refactors of the app state break it here
+def test_bench_api_runs(model_artifacts):
+    results = asyncio.run(bench_api(repeat=3))
+    assert results["model_load_seconds"] > 0
+    assert results["compiled_inference"] is True
+    assert results["predict_uncached"]["calls"] == 3
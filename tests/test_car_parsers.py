@@ -0,0 +1,27 @@
+# Third-Party Libraries
+import pandas as pd
+from bs4 import BeautifulSoup
+
+# Local Modules
+from utils.web_scraping import get_car_details, parse_car_cards, stream_car_details, benchmark_car_parsers
+from tests.conftest import FIXTURES
+
+LISTING_PAGE = FIXTURES / "listing_pages" / "hyderabad.html"
+
+def test_parse_car_cards_matches_get_car_details():
+    page = LISTING_PAGE.read_bytes()
+    expected = get_car_details(BeautifulSoup(page, "lxml"))
+    parsed = pd.DataFrame(parse_car_cards(page))
+    assert len(parsed) == 8
+    pd.testing.assert_frame_equal(parsed, expected)
+
+def test_stream_car_details_reads_saved_pages():
+    rows = list(stream_car_details([LISTING_PAGE, LISTING_PAGE]))
+    assert len(rows) == 16
+    assert rows[0]["model_name"] == "2012 Maruti Wagon R 1.0"
+    assert rows[0]["km_driven"] == "88.76k km"
+
+def test_benchmark_car_parsers_on_fixture():
+    results = benchmark_car_parsers([str(LISTING_PAGE)], repeat=1)
+    assert results.loc[0, "rows_get_car_details"] == results.loc[0, "rows_parse_car_cards"] == 8
+    assert results.loc[0, "speedup"] > 0
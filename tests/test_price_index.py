@@ -0,0 +1,38 @@
+# Third-Party Libraries
+import numpy as np
+
+# Local Modules
+from api.price_index import PriceIndex
+
+VARIANT = ("Maruti", "BALENO", 1197, "Petrol", "Manual")
+
+def make_index():
+    km_grid = np.arange(1000, 6000, 1000)
+    prices = np.arange(2 * 2 * len(km_grid), dtype=np.float32).reshape(1, 2, 2, len(km_grid)) * 1000
+    return PriceIndex([VARIANT], [2018, 2019], ["1st owner", "2nd owner"], km_grid, prices)
+
+def test_lookup_serves_stored_price_on_grid_points():
+    index = make_index()
+    assert index.lookup(*VARIANT, 2019, "2nd owner", 3000) == float(index.prices[0, 1, 1, 2])
+    assert index.lookup(*VARIANT, 2018, "1st owner", 1000) == 0.0
+    assert index.lookup(*VARIANT, 2018, "1st owner", 5000) == float(index.prices[0, 0, 0, 4])
+    assert index.stats()["hits"] == 3
+
+# Between grid points the Pipeline answers, the index never interpolates
+def test_lookup_misses_off_grid_and_outside_the_index():
+    index = make_index()
+    assert index.lookup(*VARIANT, 2018, "1st owner", 3500) is None
+    assert index.lookup(*VARIANT, 2018, "1st owner", 6000) is None
+    assert index.lookup(*VARIANT, 2017, "1st owner", 3000) is None
+    assert index.lookup(*VARIANT, 2018, "Others", 3000) is None
+    assert index.lookup("Maruti", "SWIFT", 1197, "Petrol", "Manual", 2018, "1st owner", 3000) is None
+    stats = index.stats()
+    assert (stats["hits"], stats["misses"]) == (0, 5)
+
+def test_save_and_load_round_trip(tmp_path):
+    index = make_index()
+    index.save(tmp_path / "price_index.npz")
+    loaded = PriceIndex.load(tmp_path / "price_index.npz")
+    assert loaded.variants == index.variants
+    assert np.array_equal(loaded.prices, index.prices)
+    assert loaded.lookup(*VARIANT, 2019, "1st owner", 4000) == index.lookup(*VARIANT, 2019, "1st owner", 4000)
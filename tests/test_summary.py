@@ -0,0 +1,29 @@
+# Standard Libraries
+from pathlib import Path
+
+# Third-Party Libraries
+import pandas as pd
+import pytest
+
+# Local Modules
+from utils.summary import profile_source
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def null_counts(result):
+    return result.to_frame()["nulls"].astype(int).to_dict()
+
+@pytest.mark.parametrize("path", [ROOT / "scrape_data" / "scrape_data.csv", ROOT / "clean_data" / "clean_data.parquet"])
+def test_null_counts_match_pandas(path):
+    frame = pd.read_csv(path) if path.suffix == ".csv" else pd.read_parquet(path)
+    assert null_counts(profile_source(path, batch_size=500)) == frame.isna().sum().to_dict()
+
+def test_csv_empty_cells_are_nulls(tmp_path):
+    path = tmp_path / "listings.csv"
+    path.write_text("model_name,km_driven,engine_capacity,year\n"
+                    "2016 Maruti Alto 800,17.92k km,796cc,2016\n"
+                    "2024 Nissan MAGNITE,10.28k km,,\n"
+                    ",1.05k km,1199cc,2025\n")
+    result = profile_source(path)
+    assert null_counts(result) == pd.read_csv(path).isna().sum().to_dict()
+    assert result.to_frame().loc["engine_capacity", "min"] == "1199cc"
@@ -0,0 +1,25 @@
+# Third-Party Libraries
+import pytest
+
+# Local Modules
+from utils import helpers
+from training import stages
+from training.cache import StageCache, code_fingerprint
+
+def test_fingerprint_reaches_helpers_and_constants():
+    assert {"training.stages.build_pipeline", "training.stages.prepare_features", "training.stages.PARAM_DIST"} <= set(code_fingerprint(stages.train))
+    assert {"utils.helpers.km_driven_cleaner_vectorized", "utils.helpers._vectorized_cleaner"} <= set(code_fingerprint(stages.preprocess))
+    # Stages before a change keep their key
+    assert "training.stages.build_pipeline" not in code_fingerprint(stages.preprocess)
+
+@pytest.mark.parametrize("module, name, value, stage", [
+    (stages, "PARAM_DIST", {"model__rf__n_estimators": [50]}, stages.train),
+    (stages, "CATEGORY_COLUMNS", ["brand"], stages.preprocess),
+    (stages, "build_pipeline", stages.build_fast_pipeline, stages.train),
+    (helpers, "_vectorized_cleaner", helpers.split_model_name, stages.preprocess)
+])
+def test_key_changes_with_dependencies(monkeypatch, module, name, value, stage):
+    key = StageCache.make_key("stage", stage, "input", {"a": 1})
+    assert StageCache.make_key("stage", stage, "input", {"a": 1}) == key
+    monkeypatch.setattr(module, name, value)
+    assert StageCache.make_key("stage", stage, "input", {"a": 1}) != key
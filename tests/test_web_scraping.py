@@ -0,0 +1,124 @@
+# Standard Libraries
+import os
+from functools import partial
+
+# Third-Party Libraries
+import pytest
+import pandas as pd
+from selenium.common.exceptions import WebDriverException
+
+# Local Modules
+from tests.conftest import FIXTURES
+from utils import web_scraping
+from utils.page_cache import PageCache
+from utils.web_scraping import get_engine_capacity, get_engine_capacity_concurrent, get_engine_capacity_incremental
+
+DETAIL_PAGES = ["maruti-wagon-r-2012.html", "maruti-alto-800-2016.html", "hyundai-grand-i10-2014.html", "nissan-magnite-2024.html"]
+CAPACITIES = ["998cc", "796cc", "1197cc", None]
+
+def test_concurrent_engine_capacity_matches_serial(page_server):
+    urls = [f"{page_server}/detail_pages/{page}" for page in DETAIL_PAGES] * 3
+    concurrent = get_engine_capacity_concurrent(urls, max_workers=4, requests_per_second=0)
+    assert concurrent == get_engine_capacity(urls)
+    assert concurrent[:4] == CAPACITIES
+
+def test_concurrent_engine_capacity_failed_urls_are_nan(page_server, dead_url):
+    urls = [
+        f"{page_server}/detail_pages/{DETAIL_PAGES[0]}",
+        f"{page_server}/detail_pages/missing.html",
+        f"{page_server}/error/listing.html",
+        dead_url,
+        f"{page_server}/detail_pages/{DETAIL_PAGES[1]}"
+    ]
+    capacities = get_engine_capacity_concurrent(urls, max_workers=2, requests_per_second=0, retries=1, backoff_factor=0, timeout=2)
+    assert len(capacities) == len(urls)
+    assert pd.Series(capacities).isna().tolist() == [False, True, True, True, False]
+    assert capacities[0] == "998cc" and capacities[4] == "796cc"
+
+crawl = partial(get_engine_capacity_incremental, max_workers=2, requests_per_second=0, retries=1, backoff_factor=0, timeout=2)
+
+@pytest.fixture
+def page_cache(tmp_path):
+    cache = PageCache(str(tmp_path / "page_cache"))
+    yield cache
+    cache.close()
+
+def cached_blobs(cache):
+    return [name for _, _, names in os.walk(cache.blob_path) for name in names if name.endswith(".html")]
+
+# First crawl downloads every page, a second one within fresh_for_days sends no request,
+# and once they are stale every page is revalidated with If-Modified-Since (the server answers 304)
+def test_incremental_crawl_new_fresh_and_revalidated(page_server, page_cache):
+    urls = [f"{page_server}/detail_pages/{page}" for page in DETAIL_PAGES]
+    assert crawl(urls, page_cache) == CAPACITIES
+    assert page_cache.stats()["new"] == 4 and page_cache.stats()["hit_rate"] == 0.0
+    assert crawl(urls, page_cache) == CAPACITIES
+    assert page_cache.stats()["fresh"] == 4 and page_cache.stats()["hit_rate"] == 1.0
+    assert crawl(urls, page_cache, fresh_for_days=0) == CAPACITIES
+    assert page_cache.stats()["revalidated"] == 4 and page_cache.stats()["hit_rate"] == 1.0
+    assert len(cached_blobs(page_cache)) == 4
+
+# A page modified since it was cached is downloaded again, and its entry and body are replaced
+def test_incremental_crawl_changed_page(page_server, page_cache):
+    url = f"{page_server}/detail_pages/{DETAIL_PAGES[0]}"
+    page_cache.put(url, "<html></html>", parsed={"engine_capacity": "stale"}, last_modified="Mon, 01 Jan 2001 00:00:00 GMT")
+    assert crawl([url], page_cache, fresh_for_days=0) == ["998cc"]
+    assert page_cache.stats()["changed"] == 1
+    assert page_cache.get(url)["parsed"] == {"engine_capacity": "998cc"}
+    assert page_cache.read(url) == (FIXTURES / "detail_pages" / DETAIL_PAGES[0]).read_text(encoding="utf-8")
+
+# A failed fetch falls back to the cached value when there is one
+def test_incremental_crawl_failed_fetch(page_server, page_cache, dead_url):
+    error_url = f"{page_server}/error/listing.html"
+    page_cache.put(error_url, "<html></html>", parsed={"engine_capacity": "1197cc"})
+    assert crawl([error_url, dead_url], page_cache, fresh_for_days=0) == ["1197cc", None]
+    assert page_cache.stats()["failed"] == 2
+    assert page_cache.get(dead_url) is None
+
+# Entries older than max_age_days are evicted before the crawl, with the page bodies no entry refers to
+def test_incremental_crawl_evicts_old_entries(page_server, page_cache):
+    urls = [f"{page_server}/detail_pages/{page}" for page in DETAIL_PAGES]
+    crawl(urls, page_cache)
+    assert crawl(urls, page_cache, max_age_days=0) == CAPACITIES
+    assert page_cache.stats()["new"] == 4
+    assert page_cache.evict(0) == 4
+    assert page_cache.get(urls[0]) is None and cached_blobs(page_cache) == []
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_calls = 0
+
+    def quit(self):
+        self.quit_calls += 1
+
+def fake_pool(monkeypatch, size, create=FakeDriver):
+    monkeypatch.setattr(web_scraping, "ChromeDriverManager", lambda: type("Manager", (), {"install": lambda self: "chromedriver"})())
+    monkeypatch.setattr(web_scraping, "create_driver", lambda driver_path=None, headless=True: create())
+    return web_scraping.DriverPool(size=size)
+
+def test_driver_pool_replaces_crashed_driver(monkeypatch):
+    pool = fake_pool(monkeypatch, size=1)
+    crashed = pool.drivers[0]
+    with pytest.raises(WebDriverException):
+        with pool.driver():
+            raise WebDriverException("invalid session id")
+    assert crashed.quit_calls == 1
+    with pool.driver() as driver:
+        assert driver is not crashed
+    assert pool.drivers == [driver]
+
+def test_driver_pool_slot_fails_when_replacement_fails(monkeypatch):
+    pool = fake_pool(monkeypatch, size=1)
+    def broken_driver(driver_path=None, headless=True):
+        raise WebDriverException("chrome not reachable")
+    monkeypatch.setattr(web_scraping, "create_driver", broken_driver)
+    with pytest.raises(WebDriverException):
+        with pool.driver():
+            raise WebDriverException("invalid session id")
+    with pytest.raises(RuntimeError):
+        with pool.driver():
+            pass
+
+def test_scrape_cities_without_links():
+    soups, stats = web_scraping.scrape_cities({})
+    assert soups == {} and stats.empty
@@ -0,0 +1,117 @@
+# Standard Libraries
+import os
+import json
+import time
+import pickle
+import hashlib
+import inspect
+from pathlib import Path
+
+# Third-Party Libraries
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Types of module-level constants (parameters, distributions, column lists) hashed by value
+CONSTANT_TYPES = (dict, list, tuple, set, frozenset, str, int, float, bool)
+
+def _is_project(obj) -> bool:
+    try:
+        return Path(inspect.getsourcefile(obj)).resolve().is_relative_to(ROOT)
+    except TypeError:
+        return False
+
+# Global names read by a code object and by the functions nested in it (lambdas, closures)
+def _global_names(code) -> set:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _global_names(const)
+    return names
+
+# Source code of a function and of every project function, class and constant it reaches through global names
+# (like build_pipeline, PARAM_DIST or the cleaners of utils.helpers), so editing any of them changes the fingerprint
+def code_fingerprint(fn) -> dict:
+    fingerprint, stack = {}, [fn]
+    while stack:
+        obj = stack.pop()
+        name = f"{obj.__module__}.{obj.__qualname__}"
+        if name in fingerprint:
+            continue
+        fingerprint[name] = inspect.getsource(obj)
+        if inspect.isclass(obj):
+            functions = [member for member in vars(obj).values() if inspect.isfunction(member)]
+            module_globals = vars(inspect.getmodule(obj))
+        else:
+            functions = [obj]
+            module_globals = obj.__globals__
+        for function in functions:
+            for global_name in _global_names(function.__code__):
+                value = module_globals.get(global_name)
+                if (inspect.isfunction(value) or inspect.isclass(value)) and _is_project(value):
+                    stack.append(value)
+                elif isinstance(value, CONSTANT_TYPES):
+                    # Sets are sorted, their iteration order changes between processes
+                    fingerprint[f"{function.__module__}.{global_name}"] = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+    return fingerprint
+
+# Hashing a file's content in chunks
+def file_digest(path, chunk_size=1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# On-disk Cache of Training Stage Outputs
+# A stage output is stored under a key hashed from the stage name, the code fingerprint of the stage function
+# (its source and that of the helpers and constants it uses), the key (or file digest) of its input and its parameters. Keys chain from stage to stage,
+# so changing a parameter invalidates that stage and every stage after it, and nothing before it.
+class StageCache:
+    def __init__(self, folder_path):
+        self.folder_path = Path(folder_path)
+
+    @staticmethod
+    def make_key(stage, fn, input_key, params) -> str:
+        payload = json.dumps({
+            "stage": stage,
+            "code": code_fingerprint(fn),
+            "input": input_key,
+            "params": params
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _path(self, stage, key, suffix):
+        return self.folder_path / stage / f"{key}{suffix}"
+
+    def _write(self, path, write):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        write(tmp_path)
+        os.replace(tmp_path, path)
+
+    def load_frame(self, stage, key):
+        path = self._path(stage, key, ".parquet")
+        return pd.read_parquet(path, engine="pyarrow") if path.exists() else None
+
+    def save_frame(self, stage, key, frame, params=None):
+        self._write(self._path(stage, key, ".parquet"), lambda p: frame.to_parquet(p, engine="pyarrow", index=False))
+        self._save_meta(stage, key, {"rows": len(frame), "params": params})
+
+    def load_object(self, stage, key):
+        path = self._path(stage, key, ".pkl")
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def save_object(self, stage, key, obj, meta=None):
+        def write(p):
+            with open(p, "wb") as f:
+                pickle.dump(obj, f)
+        self._write(self._path(stage, key, ".pkl"), write)
+        self._save_meta(stage, key, meta or {})
+
+    def _save_meta(self, stage, key, meta):
+        meta = {"stage": stage, "key": key, "created_at": time.time(), **meta}
+        self._write(self._path(stage, key, ".json"), lambda p: p.write_text(json.dumps(meta, indent=2, default=str)))
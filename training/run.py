@@ -0,0 +1,194 @@
+# Notebook-free Training Pipeline
+# Runs preprocessing, outlier removal, EDA filtering and training (the four notebooks) end to end,
+# caching each stage's output under a hash of its inputs and parameters, then exports the model files.
+# Run with : python -m training.run --set model__rf__n_estimators=300
+
+# Standard Libraries
+import os
+import json
+import hashlib
+import time
+import pickle
+import argparse
+from pathlib import Path
+
+# Third-Party Libraries
+import joblib
+import pyarrow.parquet as pq
+
+# Local Modules
+from utils.dataset import load_dataset, open_dataset
+from training.cache import StageCache, file_digest
+from training.stages import OUTLIER_PARAMS, EDA_PARAMS, TRAIN_PARAMS, FAST_PARAMS, preprocess, remove_outliers, eda_filter, brand_models, drift_baseline, train, train_fast
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# File names used by the notebooks for each stage's output
+STAGE_FILES = {
+    "preprocess": "clean_data.parquet",
+    "outliers": "clean_data_with_no_outlier.parquet",
+    "eda": "clean_data_after_eda.parquet"
+}
+
+# Parsing "name=value" overrides, values are read as JSON when possible (numbers, lists, ...)
+def parse_overrides(pairs):
+    overrides = {}
+    for pair in pairs:
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise SystemExit(f"Invalid override '{pair}', expected name=value")
+        try:
+            overrides[name] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[name] = value
+    return overrides
+
+# Splitting overrides between the stages by parameter name
+def split_params(overrides):
+    params = {"outliers": dict(OUTLIER_PARAMS), "eda": dict(EDA_PARAMS), "train": dict(TRAIN_PARAMS), "fast": dict(FAST_PARAMS)}
+    for name, value in overrides.items():
+        stage, _, key = name.partition(".")
+        if stage in ("outliers", "eda") and key in params[stage]:
+            params[stage][key] = value
+        elif stage == "fast" and key.startswith("model__"):
+            params["fast"][key] = value
+        elif name in TRAIN_PARAMS or name.startswith("model__"):
+            params["train"][name] = value
+        else:
+            raise SystemExit(f"Unknown parameter '{name}' (use outliers.<name>, eda.<name>, fast.model__<name> or a training parameter)")
+    return params
+
+# Raw listings columns read from a partitioned dataset (see utils/dataset.py)
+RAW_COLUMNS = ["model_name", "km_driven", "fuel_type", "transmission", "owner", "price", "link", "engine_capacity", "scrape_date"]
+
+def dataset_filters(cities, since):
+    filters = []
+    if cities:
+        filters.append(("city", "in", cities.split(",")))
+    if since:
+        filters.append(("scrape_date", ">=", since))
+    return filters or None
+
+# The dataset is append-only, so the list of matching files (with sizes) identifies its content
+def dataset_digest(folder_name, filters):
+    expression = pq.filters_to_expression(filters) if filters else None
+    fragments = open_dataset(folder_name).get_fragments(filter=expression)
+    files = sorted((fragment.path, os.path.getsize(fragment.path)) for fragment in fragments)
+    return hashlib.sha256(json.dumps({"files": files, "filters": filters}).encode("utf-8")).hexdigest()
+
+# Latest scrape of every listing in the selected partitions
+def load_listings(folder_name, filters):
+    listings = load_dataset(folder_name, columns=RAW_COLUMNS, filters=filters)
+    listings = listings.sort_values("scrape_date", kind="stable").drop_duplicates(subset="link", keep="last")
+    return listings.drop("scrape_date", axis=1).reset_index(drop=True)
+
+# Loading a stage output from the cache, or computing (compute()) and caching it
+def run_frame_stage(cache, stage, fn, input_key, params, compute, force):
+    key = StageCache.make_key(stage, fn, input_key, params)
+    start = time.perf_counter()
+    frame = None if force else cache.load_frame(stage, key)
+    status = "cached"
+    if frame is None:
+        frame = compute()
+        cache.save_frame(stage, key, frame, params)
+        status = "ran"
+    print(f"{stage:<10} : {status:<6} {time.perf_counter() - start:7.2f}s  rows={len(frame)}  key={key}")
+    return frame, key
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the AutoIQ training pipeline with per-stage caching")
+    parser.add_argument("--data", default=str(ROOT / "scrape_data" / "scrape_data.csv"), help="Raw scraped CSV file")
+    parser.add_argument("--dataset", default=None, help="Partitioned listings dataset folder to train on instead of --data")
+    parser.add_argument("--cities", default=None, help="Comma-separated cities to read from --dataset (default all)")
+    parser.add_argument("--since", default=None, help="Earliest scrape date (YYYY-MM-DD) to read from --dataset")
+    parser.add_argument("--cache-dir", default=str(ROOT / "train_cache"), help="Folder for cached stage outputs")
+    parser.add_argument("--models-dir", default=str(ROOT / "models"), help="Where pipe.pkl, pipe.joblib, model_freq.pkl, brand_models.json and drift_baseline.json are written")
+    parser.add_argument("--export-data", default=None, help="Optional folder (e.g. clean_data) to also write each stage's parquet file")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="NAME=VALUE",
+                        help="Override a parameter, e.g. model__rf__max_depth=20 or outliers.min_model_count=3")
+    parser.add_argument("--params", default=None, help="JSON file with parameter overrides (same names as --set)")
+    parser.add_argument("--search", nargs="?", const="random", choices=["random", "halving"], default=None,
+                        help="Pick hyperparameters with the notebook's RandomizedSearchCV (random) or successive halving (halving)")
+    parser.add_argument("--n-iter", type=int, default=30, help="Candidates of the hyperparameter search")
+    parser.add_argument("--cores", type=int, default=None,
+                        help="Core budget shared by the search, stacking and estimators (default: n_jobs=-1 everywhere, like the notebook)")
+    parser.add_argument("--fast-tier", action="store_true",
+                        help="Also train the compact single-model fast tier and export pipe_fast.pkl / pipe_fast.joblib")
+    parser.add_argument("--force", action="store_true", help="Ignore cached outputs and re-run every stage")
+    args = parser.parse_args()
+
+    overrides = json.loads(Path(args.params).read_text()) if args.params else {}
+    overrides.update(parse_overrides(args.overrides))
+    params = split_params(overrides)
+    cache = StageCache(args.cache_dir)
+
+    if args.dataset:
+        filters = dataset_filters(args.cities, args.since)
+        source_key = dataset_digest(args.dataset, filters)
+        source = lambda: load_listings(args.dataset, filters)
+    else:
+        source_key = file_digest(args.data)
+        source = lambda: args.data
+    clean, clean_key = run_frame_stage(cache, "preprocess", preprocess, source_key, None,
+                                       lambda: preprocess(source()), args.force)
+    no_outlier, no_outlier_key = run_frame_stage(cache, "outliers", remove_outliers, clean_key, params["outliers"],
+                                                 lambda: remove_outliers(clean, params["outliers"]), args.force)
+    after_eda, eda_key = run_frame_stage(cache, "eda", eda_filter, no_outlier_key, params["eda"],
+                                         lambda: eda_filter(no_outlier, params["eda"]), args.force)
+
+    train_params = {**params["train"], "search": args.search, "n_iter": args.n_iter if args.search else None}
+    train_key = StageCache.make_key("train", train, eda_key, train_params)
+    start = time.perf_counter()
+    result = None if args.force else cache.load_object("train", train_key)
+    status = "cached"
+    if result is None:
+        result = train(after_eda, params["train"], search=args.search, n_iter=args.n_iter, n_cores=args.cores, cache_dir=args.cache_dir)
+        cache.save_object("train", train_key, result, {"params": train_params, "metrics": result[2]})
+        status = "ran"
+    pipe, model_freq, metrics = result
+    print(f"{'train':<10} : {status:<6} {time.perf_counter() - start:7.2f}s  rows={metrics['rows']}  key={train_key}")
+
+    fast = None
+    if args.fast_tier:
+        fast_params = {"test_size": params["train"]["test_size"], "random_state": params["train"]["random_state"], **params["fast"]}
+        fast_key = StageCache.make_key("train_fast", train_fast, eda_key, fast_params)
+        start = time.perf_counter()
+        fast = None if args.force else cache.load_object("train_fast", fast_key)
+        status = "cached"
+        if fast is None:
+            fast = train_fast(after_eda, params["train"], params["fast"])
+            cache.save_object("train_fast", fast_key, fast, {"params": fast_params, "metrics": fast[1]})
+            status = "ran"
+        print(f"{'train_fast':<10} : {status:<6} {time.perf_counter() - start:7.2f}s  rows={fast[1]['rows']}  key={fast_key}")
+
+    if args.export_data:
+        export_dir = Path(args.export_data)
+        export_dir.mkdir(parents=True, exist_ok=True)
+        for stage, frame in zip(STAGE_FILES, (clean, no_outlier, after_eda)):
+            frame.to_parquet(export_dir / STAGE_FILES[stage], engine="pyarrow", index=False)
+
+    models_dir = Path(args.models_dir)
+    models_dir.mkdir(parents=True, exist_ok=True)
+    with open(models_dir / "pipe.pkl", "wb") as f:
+        pickle.dump(pipe, f)
+    with open(models_dir / "model_freq.pkl", "wb") as f:
+        pickle.dump(model_freq, f)
+    joblib.dump(pipe, models_dir / "pipe.joblib", compress=0)
+    (models_dir / "brand_models.json").write_text(json.dumps(brand_models(after_eda), indent=2))
+    (models_dir / "drift_baseline.json").write_text(json.dumps(drift_baseline(after_eda), indent=2))
+    if fast is not None:
+        with open(models_dir / "pipe_fast.pkl", "wb") as f:
+            pickle.dump(fast[0], f)
+        joblib.dump(fast[0], models_dir / "pipe_fast.joblib", compress=0)
+
+    if metrics["best_cv_mae"] is not None:
+        print(f"Best CV MAE : {metrics['best_cv_mae']:.0f} ({args.search} search, fit in {metrics['fit_seconds']:.1f}s with n_jobs {metrics['jobs']})")
+    print(f"Test MAE : {metrics['test_mae']:.0f} (set MAE for the API to this value)")
+    print(f"Test R2-Score : {metrics['test_r2']:.4f}")
+    if fast is not None:
+        print(f"Fast tier test MAE : {fast[1]['test_mae']:.0f} (set FAST_MAE for the API to this value)")
+        print(f"Fast tier test R2-Score : {fast[1]['test_r2']:.4f}")
+    print(f"Exported pipe.pkl, pipe.joblib{', pipe_fast.pkl, pipe_fast.joblib' if fast is not None else ''}, model_freq.pkl, brand_models.json and drift_baseline.json to {models_dir}")
+
+if __name__ == "__main__":
+    main()
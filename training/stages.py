@@ -0,0 +1,345 @@
+# Training Stages of notebooks/step_1 to step_4 as importable functions
+# Every stage takes a DataFrame (or the raw CSV path) and optional parameters and returns its output,
+# with the same filtering and dtypes as the notebooks, so the results match clean_data/*.parquet and models/*.pkl.
+
+# Standard Libraries
+import os
+import time
+import tempfile
+
+# Third-Party Libraries
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import ElasticNet
+from sklearn.metrics import mean_absolute_error, r2_score
+from sklearn.model_selection import KFold, train_test_split, RandomizedSearchCV
+from sklearn.preprocessing import RobustScaler, OneHotEncoder, OrdinalEncoder
+from sklearn.ensemble import StackingRegressor, RandomForestRegressor, GradientBoostingRegressor
+from xgboost import XGBRegressor
+
+# Local Modules
+from utils.helpers import km_driven_cleaner_vectorized, price_cleaner_vectorized, split_model_name
+
+# Parameters of each stage (defaults are the values used in the notebooks)
+OUTLIER_PARAMS = {
+    "drop_years": [2007, 2025],
+    "owners": ["1st owner", "2nd owner", "3rd owner", "4th owner"],
+    "rename_owners": {"4th owner": "Others"},
+    "drop_fuel_types": ["Hybrid"],
+    "km_iqr_factor": 3,
+    "price_quantiles": [0.01, 0.99],
+    "price_iqr_factor": 3,
+    "min_engine_count": 4,
+    "min_brand_count": 11,
+    "min_model_count": 2
+}
+
+EDA_PARAMS = {
+    "drop_fuel_types": ["Electric"]
+}
+
+# Best parameters found by the RandomizedSearchCV of step_4_model_building
+TRAIN_PARAMS = {
+    "test_size": 0.25,
+    "random_state": 42,
+    "cv_splits": 5,
+    "model__xgb__subsample": 0.75,
+    "model__xgb__n_estimators": 300,
+    "model__xgb__max_depth": 4,
+    "model__xgb__learning_rate": 0.05,
+    "model__xgb__colsample_bytree": 0.75,
+    "model__rf__n_estimators": 200,
+    "model__rf__min_samples_split": 5,
+    "model__rf__min_samples_leaf": 5,
+    "model__rf__max_depth": 10,
+    "model__gb__subsample": 0.75,
+    "model__gb__n_estimators": 200,
+    "model__gb__max_depth": 4,
+    "model__gb__learning_rate": 0.1,
+    "model__final_estimator__l1_ratio": 1.0,
+    "model__final_estimator__alpha": 0.1
+}
+
+# Fast tier : one compact XGBoost model on the same features, for callers that need sub-millisecond answers
+# (the test MAE is reported with the same split as the stack, so the API can use each tier's own ± range)
+FAST_PARAMS = {
+    "model__n_estimators": 200,
+    "model__max_depth": 6,
+    "model__learning_rate": 0.1,
+    "model__subsample": 0.75,
+    "model__colsample_bytree": 0.75
+}
+
+# Parameter distribution of the RandomizedSearchCV in step_4_model_building
+PARAM_DIST = {
+    "model__rf__n_estimators": [200, 300],
+    "model__rf__max_depth": [10, 20],
+    "model__rf__min_samples_leaf": [3, 5],
+    "model__rf__min_samples_split": [5, 7],
+    "model__xgb__n_estimators": [200, 300],
+    "model__xgb__learning_rate": [0.05, 0.1],
+    "model__xgb__max_depth": [2, 4],
+    "model__xgb__subsample": [0.5, 0.75],
+    "model__xgb__colsample_bytree": [0.5, 0.75],
+    "model__gb__n_estimators": [100, 200],
+    "model__gb__learning_rate": [0.05, 0.1],
+    "model__gb__max_depth": [2, 4],
+    "model__gb__subsample": [0.5, 0.75],
+    "model__final_estimator__alpha": [0.1, 10.0],
+    "model__final_estimator__l1_ratio": [0.0, 1.0]
+}
+
+CATEGORY_COLUMNS = ["fuel_type", "transmission", "owner", "model", "brand"]
+
+def _remove_unused_categories(cars):
+    for column in cars.select_dtypes(include="category").columns:
+        cars[column] = cars[column].cat.remove_unused_categories()
+    return cars
+
+def _iqr_limits(series, factor):
+    q1, q3 = series.quantile(0.25), series.quantile(0.75)
+    iqr = q3 - q1
+    return q1 - factor * iqr, q3 + factor * iqr
+
+# Step 1 : Cleaning the raw scraped listings (notebooks/step_1_data_preprocessing.ipynb)
+# data is the path of the scraped CSV or a DataFrame with the same columns (e.g. read from utils.dataset)
+def preprocess(data):
+    cars = data.copy() if isinstance(data, pd.DataFrame) else pd.read_csv(data)
+    cars = cars.drop("link", axis=1)
+    cars = pd.concat([cars.drop("model_name", axis=1), split_model_name(cars["model_name"])], axis=1)
+
+    cars["km_driven"] = cars["km_driven"].str.split(" ").str.get(0)
+    cars = cars[(cars["km_driven"].str.endswith("k")) | (cars["km_driven"].str.endswith("L"))].copy()
+    cars["km_driven"] = km_driven_cleaner_vectorized(cars["km_driven"])
+
+    for column in ["fuel_type", "owner", "transmission"]:
+        cars[column] = cars[column].str.strip()
+    cars["transmission"] = cars["transmission"].str.replace("Auto", "Automatic")
+
+    cars["price"] = price_cleaner_vectorized(cars["price"].str.replace("₹", ""))
+
+    cars["engine_capacity"] = cars["engine_capacity"].str.replace("cc", "").astype(float)
+    global_mode = cars["engine_capacity"].mode()[0]
+    cars["engine_capacity"] = cars.groupby(by="brand")["engine_capacity"].transform(
+        lambda x: x.fillna(x.mode()[0] if not x.mode().empty else global_mode))
+
+    cars = cars.astype({"km_driven": np.int32, "price": np.int32, "year": np.int16, "engine_capacity": np.int16})
+    cars = cars.astype({column: "category" for column in CATEGORY_COLUMNS})
+    columns = ["km_driven", "fuel_type", "transmission", "owner", "price", "engine_capacity", "year", "brand", "model"]
+    return cars[columns].reset_index(drop=True)
+
+# Step 2 : Removing rare categories and extreme outliers (notebooks/step_2_outlier_detection.ipynb)
+def remove_outliers(cars, params=None):
+    params = {**OUTLIER_PARAMS, **(params or {})}
+    cars = cars[~cars["year"].isin(params["drop_years"])]
+
+    cars = cars[cars["owner"].isin(params["owners"])].copy()
+    cars["owner"] = cars["owner"].cat.remove_unused_categories().cat.rename_categories(params["rename_owners"])
+
+    cars = cars[~cars["fuel_type"].isin(params["drop_fuel_types"])].copy()
+    cars["fuel_type"] = cars["fuel_type"].cat.remove_unused_categories()
+
+    lower, upper = _iqr_limits(cars["km_driven"], params["km_iqr_factor"])
+    cars = cars[(cars["km_driven"] >= lower) & (cars["km_driven"] <= upper)]
+
+    # Same as the notebook, the percentiles are compared after rounding to 2 decimals
+    low_q, high_q = (float(f"{q:.2f}") for q in cars["price"].quantile(params["price_quantiles"]))
+    cars = cars[(cars["price"] >= low_q) & (cars["price"] <= high_q)]
+    lower, upper = _iqr_limits(cars["price"], params["price_iqr_factor"])
+    cars = cars[(cars["price"] >= lower) & (cars["price"] <= upper)]
+
+    engine_freq = cars["engine_capacity"].value_counts()
+    cars = cars[cars["engine_capacity"].isin(engine_freq[engine_freq >= params["min_engine_count"]].index)]
+
+    brand_freq = cars["brand"].value_counts()
+    cars = cars[cars["brand"].isin(brand_freq[brand_freq >= params["min_brand_count"]].index)].copy()
+    cars["brand"] = cars["brand"].cat.remove_unused_categories()
+
+    cars["model"] = cars["model"].cat.remove_unused_categories()
+    model_freq = cars["model"].value_counts()
+    cars = cars[cars["model"].isin(model_freq[model_freq >= params["min_model_count"]].index)].copy()
+    cars["model"] = cars["model"].cat.remove_unused_categories()
+    return cars.reset_index(drop=True)
+
+# Step 3 : Filtering decided during exploratory data analysis (notebooks/step_3_exploratory_data_analysis.ipynb)
+def eda_filter(cars, params=None):
+    params = {**EDA_PARAMS, **(params or {})}
+    cars = _remove_unused_categories(cars.copy())
+    cars = cars[~cars["fuel_type"].isin(params["drop_fuel_types"])].copy()
+    cars["fuel_type"] = cars["fuel_type"].cat.remove_unused_categories()
+    return cars.reset_index(drop=True)
+
+# n_jobs of every parallel layer as in step_4_model_building, each one asks for all cores
+NOTEBOOK_JOBS = {"search": -1, "stack": -1, "estimators": -1, "transformer": -1}
+
+# Splitting one core budget across the parallel layers of the search and the Pipeline
+# Cores go to the outermost layer with enough independent tasks (search candidates × folds, else the
+# base estimators of the stack), inner layers get what is left, so the layers never multiply beyond the budget.
+# The ColumnTransformer always runs serially, its transformers are too cheap to be worth a worker process.
+def job_budget(n_cores, n_tasks=1, n_estimators=3):
+    n_cores = max(1, n_cores)
+    if n_tasks > 1:
+        search = min(n_cores, n_tasks)
+        return {"search": search, "stack": 1, "estimators": max(1, n_cores // search), "transformer": 1}
+    stack = min(n_cores, n_estimators)
+    return {"search": 1, "stack": stack, "estimators": max(1, n_cores // stack), "transformer": 1}
+
+# Preprocessing ColumnTransformer of step_4_model_building (unfitted)
+def build_preprocessor(n_jobs=-1):
+    return ColumnTransformer(transformers=[
+        ("nominal", Pipeline(steps=[("ohe", OneHotEncoder(sparse_output=False, handle_unknown="ignore"))]), ["fuel_type", "transmission", "brand"]),
+        ("ordinal", Pipeline(steps=[("oe", OrdinalEncoder(categories=[["Others", "3rd owner", "2nd owner", "1st owner"]]))]), ["owner"]),
+        ("scaling", Pipeline(steps=[("scaler", RobustScaler())]), ["km_driven", "year", "engine_capacity"])
+    ], remainder="passthrough", n_jobs=n_jobs)
+
+# Preprocessing + StackingRegressor Pipeline of step_4_model_building (unfitted)
+# With memory set, the fitted ColumnTransformer is cached (joblib.Memory) and reused by every
+# search candidate fitted on the same fold, since only the model's hyperparameters change.
+def build_pipeline(cv, jobs=NOTEBOOK_JOBS, memory=None):
+    ctf = build_preprocessor(jobs["transformer"])
+    stack = StackingRegressor(
+        estimators=[
+            ("rf", RandomForestRegressor(random_state=42, n_jobs=jobs["estimators"])),
+            ("xgb", XGBRegressor(random_state=42, n_jobs=jobs["estimators"])),
+            ("gb", GradientBoostingRegressor(random_state=42))
+        ],
+        final_estimator=ElasticNet(max_iter=10000, random_state=42),
+        passthrough=False, cv=cv, n_jobs=jobs["stack"]
+    )
+    return Pipeline(steps=[("preprocessor", ctf), ("model", stack)], memory=memory)
+
+# Preprocessing + single XGBRegressor Pipeline of the fast tier (unfitted)
+# Predictions run on one thread, a single row is too small to be worth spreading over cores.
+def build_fast_pipeline(n_jobs=1):
+    model = XGBRegressor(random_state=42, n_jobs=n_jobs)
+    return Pipeline(steps=[("preprocessor", build_preprocessor(1)), ("model", model)])
+
+# Splitting the EDA output into features (with model_freq) and target, as in step_4_model_building
+def prepare_features(cars):
+    cars = _remove_unused_categories(cars.copy())
+    model_freq = cars["model"].value_counts(normalize=True)
+    cars["model_freq"] = cars["model"].map(model_freq).astype(float)
+    cars = cars.drop("model", axis=1)
+    return cars.drop("price", axis=1), cars["price"], model_freq.to_dict()
+
+# Models of each brand in the EDA output (exported as brand_models.json, the form's Brand → Model choices)
+def brand_models(cars):
+    pairs = cars[["brand", "model"]].astype(str).drop_duplicates()
+    return {brand: sorted(group["model"].tolist()) for brand, group in pairs.groupby("brand")}
+
+# Input distribution of the EDA output (exported as drift_baseline.json, compared with live traffic by the API)
+# Numeric fields keep the edges of their quantile bins with the share of cars in each bin, categorical fields
+# the share of each value. Bins are closed on the left, as the API's sketches count them.
+DRIFT_NUMERIC = ["km_driven", "engine_capacity", "year"]
+DRIFT_CATEGORICAL = ["brand", "model", "fuel_type", "transmission", "owner"]
+
+def drift_baseline(cars, bins=20):
+    baseline = {"rows": int(len(cars)), "numeric": {}, "categorical": {}}
+    for column in DRIFT_NUMERIC:
+        values = cars[column].astype(float).to_numpy()
+        edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1], method="lower"))
+        counts = np.bincount(np.searchsorted(edges, values, side="right"), minlength=len(edges) + 1)
+        baseline["numeric"][column] = {
+            "edges": edges.tolist(),
+            "proportions": (counts / len(values)).round(6).tolist(),
+            "quantiles": {f"p{q}": float(np.percentile(values, q)) for q in (10, 50, 90)},
+            "min": float(values.min()),
+            "max": float(values.max())
+        }
+    for column in DRIFT_CATEGORICAL:
+        shares = cars[column].astype(str).value_counts(normalize=True).round(6)
+        baseline["categorical"][column] = shares.to_dict()
+    return baseline
+
+# Hyperparameter search of step_4_model_building
+# "random" is the notebook's RandomizedSearchCV, "halving" a HalvingRandomSearchCV over the same distribution
+# that drops the worst candidates on growing subsets of the training rows (factor 3, last round on all rows).
+def make_search(pipe, mode, cv, n_iter, n_jobs, random_state):
+    if mode == "halving":
+        from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+        from sklearn.model_selection import HalvingRandomSearchCV
+        return HalvingRandomSearchCV(estimator=pipe, param_distributions=PARAM_DIST, n_candidates=n_iter, factor=3,
+                                     min_resources="exhaust", cv=cv, scoring="neg_mean_absolute_error",
+                                     n_jobs=n_jobs, random_state=random_state)
+    if mode == "random":
+        return RandomizedSearchCV(estimator=pipe, param_distributions=PARAM_DIST, cv=cv, scoring="neg_mean_absolute_error",
+                                  n_iter=n_iter, n_jobs=n_jobs, random_state=random_state)
+    raise ValueError(f"Unknown search mode '{mode}', expected 'random' or 'halving'")
+
+# Step 4 : Training the Pipeline (notebooks/step_4_model_building.ipynb)
+# With search set ("random" or "halving") the hyperparameters are searched instead of taken from params.
+# With n_cores set, the layers share that core budget (see job_budget) and fitted preprocessors are
+# cached in cache_dir (a temporary folder if not given), otherwise every layer uses n_jobs=-1 like the notebook.
+def train(cars, params=None, search=None, n_iter=30, n_cores=None, cache_dir=None):
+    params = {**TRAIN_PARAMS, **(params or {})}
+    X, y, model_freq = prepare_features(cars)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=params["test_size"], random_state=params["random_state"])
+    k = KFold(n_splits=params["cv_splits"], shuffle=True, random_state=params["random_state"])
+
+    memory, tmp_dir = None, None
+    if n_cores is None:
+        jobs = NOTEBOOK_JOBS
+    else:
+        jobs = job_budget(n_cores, n_iter * params["cv_splits"] if search else 1)
+        if cache_dir is None:
+            tmp_dir = tempfile.TemporaryDirectory()
+            cache_dir = tmp_dir.name
+        memory = joblib.Memory(location=os.path.join(cache_dir, "preprocessor"), verbose=0)
+    pipe = build_pipeline(k, jobs, memory)
+
+    start = time.perf_counter()
+    try:
+        if search:
+            searcher = make_search(pipe, search, k, n_iter, jobs["search"], params["random_state"])
+            searcher.fit(X_train, y_train)
+            best_params = searcher.best_params_
+            best_cv_mae = float(-searcher.best_score_)
+            pipe = searcher.best_estimator_
+        else:
+            best_params = {name: value for name, value in params.items() if name.startswith("model__")}
+            best_cv_mae = None
+            pipe.set_params(**best_params)
+            pipe.fit(X_train, y_train)
+    finally:
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+    fit_seconds = time.perf_counter() - start
+    pipe.set_params(memory=None)
+
+    y_pred = pipe.predict(X_test)
+    metrics = {
+        "rows": len(X),
+        "fit_seconds": fit_seconds,
+        "jobs": jobs,
+        "best_cv_mae": best_cv_mae,
+        "test_mae": float(mean_absolute_error(y_test, y_pred)),
+        "test_r2": float(r2_score(y_test, y_pred)),
+        "params": best_params
+    }
+    return pipe, model_freq, metrics
+
+# Step 4 (fast tier) : Training the compact single-model Pipeline on the same split as train()
+def train_fast(cars, params=None, fast_params=None):
+    params = {**TRAIN_PARAMS, **(params or {})}
+    fast_params = {**FAST_PARAMS, **(fast_params or {})}
+    X, y, model_freq = prepare_features(cars)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=params["test_size"], random_state=params["random_state"])
+
+    pipe = build_fast_pipeline()
+    pipe.set_params(**fast_params)
+    start = time.perf_counter()
+    pipe.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    y_pred = pipe.predict(X_test)
+    metrics = {
+        "rows": len(X),
+        "fit_seconds": fit_seconds,
+        "test_mae": float(mean_absolute_error(y_test, y_pred)),
+        "test_r2": float(r2_score(y_test, y_pred)),
+        "params": fast_params
+    }
+    return pipe, metrics
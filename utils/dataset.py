@@ -0,0 +1,189 @@
+import os
+import uuid
+import datetime
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+# Partition columns of the scraped listings dataset (Hive layout : city=<city>/scrape_date=<YYYY-MM-DD>/)
+PARTITION_SCHEMA = pa.schema([('city', pa.string()), ('scrape_date', pa.string())])
+
+# Repository root, so dataset folders resolve the same way from notebooks/, scripts and the training CLI
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CITY_PATTERN = r'-cars-([a-z-]+?)-[a-z]*\d+/?$'
+
+def resolve_path(folder_name):
+    """
+    Returns the absolute path of a dataset folder.
+
+    Parameters:
+        folder_name (str): Absolute path, or folder name relative to the repository root (like 'datasets/listings').
+
+    Returns:
+        str: Absolute path of the folder.
+    """
+    if os.path.isabs(folder_name):
+        return folder_name
+    return os.path.join(ROOT_DIR, folder_name)
+
+def city_from_link(links):
+    """
+    Extracts the city name from Cars24 car listing links.
+
+    Parameters:
+        links (pd.Series): Car listing URLs, like '.../buy-used-maruti-wagon-r-1.0-2012-cars-hyderabad-10279141744/'.
+
+    Returns:
+        pd.Series: City names (like 'hyderabad'), NaN where the link does not match.
+
+    Example:
+        >>> city_from_link(pd.Series(['https://www.cars24.com/buy-used-maruti-alto-800-2016-cars-new-delhi-10449048752/']))
+        0    new-delhi
+        dtype: object
+    """
+    return links.str.extract(CITY_PATTERN, expand=False)
+
+def write_partitioned(dataframe, folder_name, city=None, scrape_date=None, row_group_size=128_000,
+                      categorical_columns=('fuel_type', 'transmission', 'owner')):
+    """
+    Appends a DataFrame of scraped listings to a Parquet dataset partitioned by city and scrape date.
+
+    Every call writes new files under city=<city>/scrape_date=<date>/ and never rewrites existing ones,
+    so daily scrapes of each city can be added independently. Low-cardinality text columns are stored
+    dictionary-encoded (and read back as category), files are compressed with zstd and split into
+    row groups of at most row_group_size rows, so filtered reads can skip whole row groups.
+
+    Parameters:
+        dataframe (pd.DataFrame): Listings to append (like the output of get_car_details).
+        folder_name (str): Dataset folder, absolute or relative to the repository root.
+        city (str): City of the listings, used when the DataFrame has no 'city' column.
+                    If neither is given, the city is extracted from the 'link' column.
+        scrape_date (str or datetime.date): Date of the scrape (default today), used when the DataFrame has no 'scrape_date' column.
+        row_group_size (int): Maximum number of rows per Parquet row group.
+        categorical_columns (tuple): Text columns stored dictionary-encoded (object or category dtype).
+
+    Returns:
+        list: Paths of the written files, or an empty list if nothing was written.
+
+    Raises:
+        TypeError: If input is not a pandas DataFrame.
+        ValueError: If the city of some rows cannot be determined.
+
+    Example:
+        >>> write_partitioned(df, 'datasets/listings', city='hyderabad')
+        ['/path/to/datasets/listings/city=hyderabad/scrape_date=2026-10-18/part-3f2c...-0.parquet']
+    """
+    try:
+        if not isinstance(dataframe, pd.DataFrame):
+            raise TypeError("Input must be a pandas DataFrame")
+        if dataframe.empty:
+            return []
+
+        dataframe = dataframe.copy()
+        if 'city' not in dataframe.columns:
+            if city is not None:
+                dataframe['city'] = city
+            elif 'link' in dataframe.columns:
+                dataframe['city'] = city_from_link(dataframe['link'])
+            else:
+                raise ValueError("City must be given, as a 'city' column, the city argument or a 'link' column")
+        if dataframe['city'].isna().any():
+            raise ValueError(f"City could not be determined for {dataframe['city'].isna().sum()} rows")
+        if 'scrape_date' not in dataframe.columns:
+            dataframe['scrape_date'] = str(scrape_date or datetime.date.today())
+        dataframe = dataframe.astype({'city': str, 'scrape_date': str})
+        for column in categorical_columns:
+            if column in dataframe.columns:
+                dataframe[column] = dataframe[column].astype('category')
+
+        table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        dictionary_columns = [field.name for field in table.schema if pa.types.is_dictionary(field.type)]
+        file_format = ds.ParquetFileFormat()
+        file_options = file_format.make_write_options(compression='zstd', use_dictionary=dictionary_columns or False)
+
+        written = []
+        ds.write_dataset(
+            table, resolve_path(folder_name),
+            format=file_format, file_options=file_options,
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor='hive'),
+            basename_template=f'part-{uuid.uuid4().hex}-{{i}}.parquet',
+            existing_data_behavior='overwrite_or_ignore',
+            max_rows_per_group=row_group_size, min_rows_per_group=min(row_group_size, len(table)),
+            file_visitor=lambda written_file: written.append(written_file.path)
+        )
+        return written
+    except (TypeError, ValueError) as e:
+        print(e)
+        return []
+
+def open_dataset(folder_name, memory_map=False):
+    """
+    Opens a partitioned Parquet dataset without reading any data.
+
+    Parameters:
+        folder_name (str): Dataset folder, absolute or relative to the repository root.
+        memory_map (bool): Read files through memory maps instead of buffered reads.
+
+    Returns:
+        pyarrow.dataset.Dataset: Dataset with the partition columns (city, scrape_date) as fields.
+    """
+    return ds.dataset(resolve_path(folder_name), format='parquet',
+                      partitioning=ds.partitioning(PARTITION_SCHEMA, flavor='hive'),
+                      filesystem=fs.LocalFileSystem(use_mmap=memory_map))
+
+def load_dataset(folder_name, columns=None, filters=None, memory_map=False, as_arrow=False):
+    """
+    Reads a slice of a partitioned Parquet dataset.
+
+    Only the requested columns are read (column projection) and filters are pushed down, so partitions
+    (city, scrape_date) that do not match are never opened and row groups are skipped using their statistics.
+
+    Parameters:
+        folder_name (str): Dataset folder, absolute or relative to the repository root.
+        columns (list): Columns to read (default all columns, including city and scrape_date).
+        filters (list): Filters in pandas/pyarrow format, like [('city', '=', 'mumbai'), ('scrape_date', '>=', '2026-10-01')].
+                        A list of lists combines the inner lists with OR.
+        memory_map (bool): Read files through memory maps, with as_arrow the table can then reference the mapped pages.
+        as_arrow (bool): Return a pyarrow Table instead of a pandas DataFrame.
+
+    Returns:
+        pd.DataFrame or pyarrow.Table: The matching rows (an empty DataFrame if the folder does not exist).
+
+    Raises:
+        FileNotFoundError: If the dataset folder does not exist.
+
+    Example:
+        >>> load_dataset('datasets/listings', columns=['model_name', 'price'], filters=[('city', 'in', ['mumbai', 'delhi'])])
+    """
+    try:
+        if not os.path.isdir(resolve_path(folder_name)):
+            raise FileNotFoundError(f"Folder '{folder_name}' does not exists")
+        dataset = open_dataset(folder_name, memory_map=memory_map)
+        expression = pq.filters_to_expression(filters) if filters else None
+        table = dataset.to_table(columns=columns, filter=expression)
+        return table if as_arrow else table.to_pandas()
+    except FileNotFoundError as e:
+        print(e)
+        return pa.table({}) if as_arrow else pd.DataFrame()
+
+def list_partitions(folder_name):
+    """
+    Lists the partitions of a dataset with their row and file counts, from Parquet metadata only.
+
+    Parameters:
+        folder_name (str): Dataset folder, absolute or relative to the repository root.
+
+    Returns:
+        pd.DataFrame: One row per (city, scrape_date) with files and rows columns.
+    """
+    dataset = open_dataset(folder_name)
+    records = []
+    for fragment in dataset.get_fragments():
+        keys = ds.get_partition_keys(fragment.partition_expression)
+        records.append({**keys, 'files': 1, 'rows': fragment.metadata.num_rows})
+    if not records:
+        return pd.DataFrame(columns=['city', 'scrape_date', 'files', 'rows'])
+    return pd.DataFrame(records).groupby(['city', 'scrape_date'], as_index=False).sum()
@@ -1,4 +1,5 @@
 import os
+import joblib
 import pandas as pd
 
 def export_as_csv(dataframe, folder_name, file_name):
@@ -71,4 +72,38 @@ def export_as_parquet(dataframe, folder_name, file_name):
     except TypeError as e:
         print(e)
     except ValueError as e:
-        print(e)
\ No newline at end of file
+        print(e)
+
+def export_as_joblib(model, folder_name, file_name):
+    """
+    Exports a fitted model or pipeline as an uncompressed Joblib file to a specified folder.
+
+    Unlike pickle, Joblib stores the NumPy arrays inside the model as raw buffers,
+    so the file can be loaded with mmap_mode='r' and its pages shared between API workers.
+
+    Parameters:
+        model (object): The fitted model or pipeline to export.
+        folder_name (str): Name of the folder where Joblib file will be saved.
+        file_name (str): Name of the Joblib file. Must end with '.joblib' extension.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If file_name does not end with '.joblib' extension.
+    """
+    try:
+        if not file_name.lower().endswith('.joblib'):
+            raise ValueError("File name must end with '.joblib' extension")
+
+        current_dir = os.getcwd()
+        parent_dir = os.path.dirname(current_dir)
+        folder_path = os.path.join(parent_dir, folder_name)
+        if not os.path.exists(folder_path):
+            os.makedirs(folder_path)
+        file_path = os.path.join(folder_path, file_name)
+
+        joblib.dump(model, file_path, compress=0)
+        print(f"Successfully exported the model as '{file_name}'")
+    except ValueError as e:
+        print(e)
@@ -0,0 +1,180 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+
+class PageCache:
+    """
+    Persistent on-disk cache of fetched listing pages and the fields parsed from them.
+
+    Page bodies are stored content-addressed (by SHA-256) under blobs/, so identical pages are stored once.
+    An SQLite index keyed by listing URL keeps the content hash, ETag/Last-Modified validators,
+    fetch time and parsed fields, so a re-crawl can skip or revalidate pages instead of downloading them again.
+
+    Parameters:
+        folder_path (str): Folder where the cache index and page blobs are stored, created if it does not exist.
+
+    Example:
+        >>> cache = PageCache('../scrape_cache')
+        >>> cache.get('https://www.cars24.com/buy-used-maruti-wagon-r-1.0-2012-cars-hyderabad-10279141744/')
+        {'url': ..., 'content_hash': ..., 'etag': ..., 'last_modified': ..., 'fetched_at': ..., 'parsed': {'engine_capacity': '998cc'}}
+    """
+    def __init__(self, folder_path):
+        self.folder_path = folder_path
+        self.blob_path = os.path.join(folder_path, 'blobs')
+        os.makedirs(self.blob_path, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(folder_path, 'index.sqlite'), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                parsed TEXT
+            )
+        """)
+        self.conn.commit()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Resets the hit/miss counters reported by stats()."""
+        self.counters = {'fresh': 0, 'revalidated': 0, 'changed': 0, 'new': 0, 'failed': 0}
+
+    def record(self, outcome):
+        """
+        Counts the outcome of one lookup.
+
+        Parameters:
+            outcome (str): One of 'fresh', 'revalidated', 'changed', 'new' or 'failed'.
+        """
+        with self.lock:
+            self.counters[outcome] += 1
+
+    def stats(self):
+        """
+        Returns the cache counters since the last reset, with the hit rate.
+
+        Fresh pages and pages revalidated with 304 Not Modified count as hits.
+
+        Returns:
+            dict: Counts per outcome, total lookups and hit_rate (between 0 and 1).
+        """
+        with self.lock:
+            counters = dict(self.counters)
+        total = sum(counters.values())
+        hits = counters['fresh'] + counters['revalidated']
+        return {**counters, 'total': total, 'hit_rate': hits / total if total else 0.0}
+
+    def _blob_file(self, content_hash):
+        return os.path.join(self.blob_path, content_hash[:2], f'{content_hash}.html')
+
+    def get(self, url):
+        """
+        Looks up the cache entry of a listing URL.
+
+        Parameters:
+            url (str): URL of the listing page.
+
+        Returns:
+            dict: Cache entry (without the page body), or None if the URL is not cached.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT url, content_hash, etag, last_modified, fetched_at, parsed FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ['url', 'content_hash', 'etag', 'last_modified', 'fetched_at', 'parsed']
+        entry = dict(zip(keys, row))
+        entry['parsed'] = json.loads(entry['parsed']) if entry['parsed'] else {}
+        return entry
+
+    def read(self, url):
+        """
+        Reads the cached page body of a listing URL.
+
+        Parameters:
+            url (str): URL of the listing page.
+
+        Returns:
+            str: Cached HTML content, or None if the URL or its blob is not cached.
+        """
+        entry = self.get(url)
+        if entry is None:
+            return None
+        try:
+            with open(self._blob_file(entry['content_hash']), encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, url, content, parsed=None, etag=None, last_modified=None):
+        """
+        Stores a fetched page and its parsed fields.
+
+        Parameters:
+            url (str): URL of the listing page.
+            content (str): HTML content of the page.
+            parsed (dict): Fields extracted from the page (like engine_capacity).
+            etag (str): ETag response header, used for revalidation.
+            last_modified (str): Last-Modified response header, used for revalidation.
+
+        Returns:
+            str: SHA-256 content hash of the stored page.
+        """
+        content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        blob_file = self._blob_file(content_hash)
+        if not os.path.exists(blob_file):
+            os.makedirs(os.path.dirname(blob_file), exist_ok=True)
+            tmp_file = f'{blob_file}.{threading.get_ident()}.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_file, blob_file)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (url, content_hash, etag, last_modified, fetched_at, parsed) VALUES (?, ?, ?, ?, ?, ?)",
+                (url, content_hash, etag, last_modified, time.time(), json.dumps(parsed or {}))
+            )
+            self.conn.commit()
+        return content_hash
+
+    def touch(self, url):
+        """
+        Marks a cached page as freshly validated (after a 304 Not Modified response).
+
+        Parameters:
+            url (str): URL of the listing page.
+        """
+        with self.lock:
+            self.conn.execute("UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self.conn.commit()
+
+    def evict(self, max_age_seconds):
+        """
+        Removes entries not fetched or validated within max_age_seconds, and page blobs no entry refers to.
+
+        Parameters:
+            max_age_seconds (float): Maximum age of an entry (in seconds).
+
+        Returns:
+            int: Number of evicted entries.
+        """
+        cutoff = time.time() - max_age_seconds
+        with self.lock:
+            evicted = self.conn.execute("DELETE FROM pages WHERE fetched_at < ?", (cutoff,)).rowcount
+            self.conn.commit()
+            in_use = {row[0] for row in self.conn.execute("SELECT DISTINCT content_hash FROM pages")}
+        for folder in os.listdir(self.blob_path):
+            for file_name in os.listdir(os.path.join(self.blob_path, folder)):
+                if file_name.endswith('.html') and file_name[:-5] not in in_use:
+                    os.remove(os.path.join(self.blob_path, folder, file_name))
+        return evicted
+
+    def close(self):
+        """Closes the cache index."""
+        with self.lock:
+            self.conn.close()
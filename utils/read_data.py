@@ -37,13 +37,15 @@ def load_csv(folder_name, file_name):
         print(e)
         return pd.DataFrame()
     
-def load_parquet(folder_name, file_name):
+def load_parquet(folder_name, file_name, columns=None, filters=None):
     """
     Reads a Parquet file from a specified folder and returns a DataFrame.
 
     Parameters:
         folder_name (str): Name of the folder containing the Parquet file.
         file_name (str): Name of the Parquet file, must end with .parquet extension.
+        columns (list): Columns to read (default all columns), other columns are not read from disk.
+        filters (list): Row filters pushed down to the Parquet reader, like [('price', '<=', 1500000)].
 
     Returns:
         pd.DataFrame: A DataFrame containing the contents of the Parquet file.
@@ -66,7 +68,7 @@ def load_parquet(folder_name, file_name):
         if not os.path.isfile(file_path):
             raise FileNotFoundError(f"File '{file_name}' not found in folder '{folder_name}'")
 
-        df = pd.read_parquet(file_path, engine='pyarrow')
+        df = pd.read_parquet(file_path, engine='pyarrow', columns=columns, filters=filters)
         return df
     
     except (FileNotFoundError, ValueError) as e:
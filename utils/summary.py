@@ -1,9 +1,290 @@
 import io
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+# Multiplier and seed used to combine per-column value hashes into one hash per row (FNV-1a style)
+_ROW_HASH_PRIME = np.uint64(0x100000001B3)
+_ROW_HASH_SEED = np.uint64(0xCBF29CE484222325)
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+class ColumnProfile:
+    """
+    Single-pass statistics of one column, updated batch by batch.
+
+    Null count, min/max, mean/std (numeric columns), approximate distinct count (HyperLogLog
+    with 2**precision registers, about 1.04/sqrt(2**precision) relative error) and approximate
+    quantiles (from a uniform reservoir sample of sample_size values, numeric columns only).
+
+    Parameters:
+        name (str): Column name.
+        dtype (pyarrow.DataType): Arrow type of the column.
+        precision (int): HyperLogLog precision (number of index bits).
+        sample_size (int): Size of the reservoir sample used for quantiles.
+        seed (int): Seed of the reservoir sampling.
+    """
+    def __init__(self, name, dtype, precision=14, sample_size=10_000, seed=42):
+        self.name = name
+        self.dtype = dtype
+        self.count = 0
+        self.nulls = 0
+        self.min = None
+        self.max = None
+        self.numeric = pa.types.is_integer(dtype) or pa.types.is_floating(dtype)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+        self.sample_size = sample_size
+        self.sample = np.empty(sample_size, dtype=np.float64) if self.numeric else None
+        self.sampled = 0
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, array, hashes, valid):
+        """
+        Adds one batch of the column.
+
+        Parameters:
+            array (pyarrow.Array): Values of the batch (dictionary arrays already decoded).
+            hashes (np.ndarray): uint64 hash of every value of the batch.
+            valid (np.ndarray): Boolean mask of the non-null values.
+        """
+        self.count += len(array)
+        self.nulls += array.null_count
+        if array.null_count < len(array):
+            low, high = pc.min_max(array).values()
+            low, high = low.as_py(), high.as_py()
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+        self._update_registers(hashes[valid])
+        if self.numeric:
+            values = pc.drop_null(array).to_numpy(zero_copy_only=False).astype(np.float64)
+            values = values[~np.isnan(values)]
+            self.total += values.sum()
+            self.total_sq += np.square(values).sum()
+            self._update_sample(values)
+
+    def _update_registers(self, hashes):
+        if len(hashes) == 0:
+            return
+        index_bits = np.uint64(64 - self.precision)
+        index = (hashes >> index_bits).astype(np.int64)
+        # Rank = position of the lowest set bit of the remaining bits (a sentinel bit caps it)
+        rest = (hashes & np.uint64((1 << (64 - self.precision)) - 1)) | (np.uint64(1) << index_bits)
+        lowest_bit = rest & (~rest + np.uint64(1))
+        rank = (np.log2(lowest_bit.astype(np.float64)) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def _update_sample(self, values):
+        free = min(self.sample_size - min(self.sampled, self.sample_size), len(values))
+        if free > 0:
+            self.sample[self.sampled:self.sampled + free] = values[:free]
+        rest = values[free:]
+        if len(rest):
+            # Algorithm R : the i-th value seen replaces a random slot with probability sample_size / i
+            seen = self.sampled + free + np.arange(1, len(rest) + 1)
+            slots = (self.rng.random(len(rest)) * seen).astype(np.int64)
+            keep = slots < self.sample_size
+            self.sample[slots[keep]] = rest[keep]
+        self.sampled += len(values)
+
+    @property
+    def distinct(self):
+        """Approximate number of distinct non-null values (HyperLogLog estimate)."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    def quantiles(self, probs):
+        """Approximate quantiles of a numeric column from the reservoir sample (None for other columns)."""
+        if not self.numeric or self.sampled == 0:
+            return None
+        sample = self.sample[:min(self.sampled, self.sample_size)]
+        return dict(zip(probs, np.quantile(sample, probs)))
+
+    def to_dict(self, probs=(0.25, 0.5, 0.75)):
+        """Returns the column statistics as a dict."""
+        non_null = self.count - self.nulls
+        stats = {
+            'dtype': str(self.dtype),
+            'non_null': non_null,
+            'nulls': self.nulls,
+            'null_pct': round(100 * self.nulls / self.count, 2) if self.count else 0.0,
+            'distinct': self.distinct,
+            'min': self.min,
+            'max': self.max
+        }
+        if self.numeric and non_null:
+            mean = self.total / non_null
+            variance = max(self.total_sq / non_null - mean * mean, 0.0) * non_null / max(non_null - 1, 1)
+            stats.update({'mean': mean, 'std': variance ** 0.5})
+            stats.update({f'{p:.0%}': value for p, value in self.quantiles(probs).items()})
+        return stats
+
+class ProfileResult:
+    """
+    Structured result of profile_source.
+
+    Attributes:
+        source (str): Profiled file or folder (or 'DataFrame').
+        rows (int): Number of rows.
+        batches (int): Number of record batches read.
+        duplicate_rows (int): Rows identical to an earlier row (compared by 64-bit row hash).
+        nbytes (int): In-memory (Arrow) size of the data, summed over the batches.
+        columns (dict): Mapping of column name to ColumnProfile.
+        probs (tuple): Quantiles reported for numeric columns.
+    """
+    def __init__(self, source, columns, rows, batches, duplicate_rows, nbytes, probs):
+        self.source = source
+        self.columns = columns
+        self.rows = rows
+        self.batches = batches
+        self.duplicate_rows = duplicate_rows
+        self.nbytes = nbytes
+        self.probs = probs
+
+    @property
+    def shape(self):
+        return self.rows, len(self.columns)
+
+    def to_frame(self):
+        """
+        Returns the per-column statistics.
+
+        Returns:
+            pd.DataFrame: One row per column with dtype, non_null, nulls, null_pct, distinct, min, max,
+                          and mean, std and quantiles for numeric columns.
+        """
+        return pd.DataFrame({name: column.to_dict(self.probs) for name, column in self.columns.items()}).T
+
+    def __repr__(self):
+        return f'ProfileResult(source={self.source!r}, rows={self.rows}, columns={len(self.columns)}, duplicate_rows={self.duplicate_rows})'
+
+def _fill_value(dtype):
+    if pa.types.is_string(dtype) or pa.types.is_large_string(dtype):
+        return ''
+    if pa.types.is_boolean(dtype):
+        return False
+    if pa.types.is_integer(dtype) or pa.types.is_floating(dtype):
+        return 0
+    return None
+
+def _hash_values(array):
+    valid = np.asarray(array.is_valid())
+    fill = _fill_value(array.type)
+    filled = array.fill_null(fill) if fill is not None and array.null_count else array
+    hashes = pd.util.hash_array(filled.to_numpy(zero_copy_only=False))
+    hashes[~valid] = _NULL_HASH
+    return hashes, valid
+
+def _iter_batches(source, columns, batch_size):
+    if isinstance(source, pd.DataFrame):
+        table = pa.Table.from_pandas(source if columns is None else source[columns], preserve_index=False)
+        return table.to_batches(max_chunksize=batch_size)
+    source = str(source)
+    if source.lower().endswith('.csv'):
+        # Empty cells of text columns are nulls, as pandas.read_csv reads them (Arrow's default is "")
+        file_format = ds.CsvFileFormat(convert_options=pa_csv.ConvertOptions(strings_can_be_null=True))
+    else:
+        file_format = 'parquet'
+    dataset = ds.dataset(source, format=file_format, partitioning='hive')
+    return dataset.to_batches(columns=columns, batch_size=batch_size)
+
+def profile_source(source, columns=None, batch_size=65_536, probs=(0.25, 0.5, 0.75), precision=14, sample_size=10_000):
+    """
+    Profiles a Parquet/CSV source in one streaming pass over record batches, without loading it in memory.
+
+    Only one batch is held in memory at a time, plus small per-column sketches and one 8-byte hash per row
+    for duplicate detection. Distinct counts and quantiles are approximate (HyperLogLog and reservoir sampling).
+
+    Parameters:
+        source (str or pd.DataFrame): Parquet file, CSV file, folder of Parquet files (like a partitioned dataset) or a DataFrame.
+        columns (list): Columns to profile (default all columns).
+        batch_size (int): Maximum rows per record batch.
+        probs (tuple): Quantiles to estimate for numeric columns.
+        precision (int): HyperLogLog precision of the distinct counts (2**precision registers per column).
+        sample_size (int): Reservoir sample size per numeric column for the quantiles.
+
+    Returns:
+        ProfileResult: Structured profile, printable with dataframe_summary(result).
+
+    Example:
+        >>> result = profile_source('../clean_data/clean_data.parquet')
+        >>> result.to_frame()[['nulls', 'distinct', 'min', 'max']]
+        >>> dataframe_summary(result)
+    """
+    profiles = {}
+    row_hashes = []
+    rows, batches, nbytes = 0, 0, 0
+    for batch in _iter_batches(source, columns, batch_size):
+        batches += 1
+        rows += batch.num_rows
+        nbytes += batch.nbytes
+        row_hash = np.full(batch.num_rows, _ROW_HASH_SEED, dtype=np.uint64)
+        for name, array in zip(batch.schema.names, batch.columns):
+            if pa.types.is_dictionary(array.type):
+                array = array.dictionary_decode()
+            if name not in profiles:
+                profiles[name] = ColumnProfile(name, array.type, precision=precision, sample_size=sample_size)
+            hashes, valid = _hash_values(array)
+            profiles[name].update(array, hashes, valid)
+            row_hash = (row_hash ^ hashes) * _ROW_HASH_PRIME
+        row_hashes.append(row_hash)
+
+    all_hashes = np.concatenate(row_hashes) if row_hashes else np.empty(0, dtype=np.uint64)
+    duplicate_rows = int(len(all_hashes) - len(np.unique(all_hashes)))
+    source_name = 'DataFrame' if isinstance(source, pd.DataFrame) else str(source)
+    return ProfileResult(source_name, profiles, rows, batches, duplicate_rows, nbytes, probs)
+
+def _print_profile(result):
+    print('='*70)
+    print('DataFrame Summary'.center(70))
+    print('='*70)
+    print(f'Source: {result.source} ({result.batches} batches)')
+    print(f'Shape: {result.rows} rows × {len(result.columns)} columns')
+    print('='*70)
+    print(f'Duplicate Rows: {result.duplicate_rows}')
+    print('='*70)
+    memory_usage = result.nbytes/1024
+    if memory_usage > 1024:
+        print(f'Memory Usage (Arrow): {memory_usage/1024:.2f}MB')
+    else:
+        print(f'Memory Usage (Arrow): {memory_usage:.2f}KB')
+    print('='*70)
+
+    stats = result.to_frame()
+    print('Missing Values:')
+    missing = stats.loc[stats['nulls'] > 0, ['nulls', 'null_pct']].rename(columns={'nulls': 'Missing Values', 'null_pct': '%'})
+    print('No missing values' if missing.empty else missing)
+    print('='*70)
+
+    print('Column Info:')
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(stats[['dtype', 'non_null', 'distinct', 'min', 'max']].rename(columns={'distinct': 'distinct (approx)'}))
+    print('='*70)
+
+    print('DataFrame Description:')
+    numerical_cols = [name for name, column in result.columns.items() if column.numeric]
+    if len(numerical_cols) == 0:
+        print('No numerical columns in the dataframe')
+    else:
+        columns = ['non_null', 'mean', 'std', 'min'] + [f'{p:.0%}' for p in result.probs] + ['max']
+        description = stats.loc[numerical_cols, columns].rename(columns={'non_null': 'count'}).T.astype(float)
+        with pd.option_context('display.float_format', '{:.2f}'.format,
+                   'display.width', 200,
+                   'display.max_columns', None):
+            print(description.round(2))
 
 def dataframe_summary(dataframe):
     """
-    Prints a detailed summary of the given pandas DataFrame.
+    Prints a detailed summary of the given pandas DataFrame (or of a ProfileResult from profile_source).
 
     This includes:
     - Shape (rows x columns)
@@ -14,17 +295,21 @@ def dataframe_summary(dataframe):
     - Statistical summary of numerical columns
 
     Parameters:
-        dataframe (pd.DataFrame): The DataFrame to summarize.
+        dataframe (pd.DataFrame or ProfileResult): The DataFrame to summarize, or the profile of a
+                                                   larger-than-memory source (quantiles and distinct counts are approximate).
 
     Returns:
         None
 
     Raises:
-        TypeError: If input is not a pandas DataFrame.
+        TypeError: If input is not a pandas DataFrame or a ProfileResult.
     """
     try:
+        if isinstance(dataframe, ProfileResult):
+            _print_profile(dataframe)
+            return
         if not isinstance(dataframe, pd.DataFrame):
-            raise TypeError('Input must be a pandas DataFrame')
+            raise TypeError('Input must be a pandas DataFrame or a ProfileResult')
 
         print('='*70)
         print('DataFrame Summary'.center(70))
@@ -53,7 +338,7 @@ def dataframe_summary(dataframe):
         if nulls.sum() == 0:
             print('No missing values')
         else:
-            missing_df = dataframe.isnull().sum().to_frame(name='Missing Values')
+            missing_df = nulls.to_frame(name='Missing Values')
             missing_df['%'] = round(100 * (missing_df['Missing Values']/len(dataframe)),2)
             print(missing_df[missing_df['Missing Values'] > 0])
         print('='*70)
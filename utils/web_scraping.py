@@ -1,10 +1,21 @@
 import time
 import random
+import threading
 import requests
 import pandas as pd
+from queue import Queue
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
 def scrape_car_listing(link):
@@ -55,6 +66,187 @@ def scrape_car_listing(link):
         if driver:
             driver.quit()
 
+CARD_SELECTOR = "a.styles_carCardWrapper__sXLIp"
+
+def create_driver(driver_path=None, headless=True):
+    """
+    Launches a Chrome browser session for scraping.
+
+    Parameters:
+        driver_path (str): Path to an installed chromedriver, installed with ChromeDriverManager if None.
+        headless (bool): Whether to run Chrome without opening a window.
+
+    Returns:
+        webdriver.Chrome: A running Chrome driver.
+    """
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    return webdriver.Chrome(service=Service(driver_path or ChromeDriverManager().install()), options=options)
+
+class DriverPool:
+    """
+    Pool of reusable Chrome drivers, so each scrape doesn't pay for launching a new browser.
+
+    ChromeDriverManager().install() runs once for the whole pool and drivers are quit when the pool is closed.
+    A driver raising a WebDriverException (like a crashed session) is quit and replaced by a new one
+    instead of being handed out again.
+
+    Parameters:
+        size (int): Number of Chrome drivers in the pool.
+        headless (bool): Whether to run Chrome without opening a window.
+
+    Example:
+        >>> with DriverPool(size=4) as pool:
+        ...     with pool.driver() as driver:
+        ...         driver.get(link)
+    """
+    def __init__(self, size=4, headless=True):
+        self.driver_path = ChromeDriverManager().install()
+        self.headless = headless
+        self.drivers = []
+        self.available = Queue()
+        self.lock = threading.Lock()
+        try:
+            for _ in range(size):
+                driver = create_driver(self.driver_path, headless=headless)
+                self.drivers.append(driver)
+                self.available.put(driver)
+        except Exception:
+            self.close()
+            raise
+
+    @contextmanager
+    def driver(self):
+        driver = self.available.get()
+        if driver is None:
+            # Slot of a driver that could not be replaced, kept failed so callers don't wait forever
+            self.available.put(None)
+            raise RuntimeError("Chrome driver could not be replaced")
+        try:
+            yield driver
+        except WebDriverException:
+            driver = self._replace(driver)
+            raise
+        finally:
+            self.available.put(driver)
+
+    def _replace(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"[Driver Error] {e}")
+        with self.lock:
+            self.drivers.remove(driver)
+        try:
+            new_driver = create_driver(self.driver_path, headless=self.headless)
+        except Exception as e:
+            print(f"[Driver Error] Could not replace a crashed driver : {e}")
+            return None
+        with self.lock:
+            self.drivers.append(new_driver)
+        return new_driver
+
+    def close(self):
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"[Driver Error] {e}")
+        self.drivers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def scroll_until_loaded(driver, expected_cards=None, idle_timeout=5, poll_interval=0.25, max_scrolls=500):
+    """
+    Scrolls a dynamically loaded page until no new content appears, without fixed sleeps.
+
+    After each scroll to the bottom, it waits only until the page height grows (new listings loaded),
+    and stops as soon as the height stays the same for idle_timeout seconds or the expected card count is reached.
+
+    Parameters:
+        driver (webdriver.Chrome): Driver with the listing page already loaded.
+        expected_cards (int): Stop once this many car cards are on the page (None to scroll till the end).
+        idle_timeout (float): Seconds to wait for the page to grow before assuming it is fully loaded.
+        poll_interval (float): Seconds between checks of the page height.
+        max_scrolls (int): Safety limit on the number of scrolls.
+
+    Returns:
+        int: Number of scrolls that loaded new content.
+    """
+    def card_count():
+        return driver.execute_script(f"return document.querySelectorAll('{CARD_SELECTOR}').length")
+
+    loads = 0
+    last_height = driver.execute_script("return document.body.scrollHeight")
+    for _ in range(max_scrolls):
+        if expected_cards is not None and card_count() >= expected_cards:
+            break
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, idle_timeout, poll_frequency=poll_interval).until(
+                lambda d: d.execute_script("return document.body.scrollHeight") > last_height
+            )
+        except TimeoutException:
+            break
+        last_height = driver.execute_script("return document.body.scrollHeight")
+        loads += 1
+    return loads
+
+def scrape_cities(links, pool_size=4, expected_cards=None, idle_timeout=5, headless=True):
+    """
+    Scrapes the car listing pages of multiple cities in parallel with a pool of reusable Chrome drivers.
+
+    Parameters:
+        links (dict): Mapping of city name to the URL of its car listing page.
+        pool_size (int): Number of Chrome drivers (and cities scraped at the same time).
+        expected_cards (int): Stop scrolling a city once this many car cards are loaded (None to scroll till the end).
+        idle_timeout (float): Seconds to wait for new listings before assuming a page is fully loaded.
+        headless (bool): Whether to run Chrome without opening a window.
+
+    Returns:
+        tuple: (soups, stats) ↓
+            soups (dict): Mapping of city name to BeautifulSoup of the fully loaded page (None if it failed).
+            stats (pd.DataFrame): Per-city cards, loaded pages, wall time (in seconds) and pages/second.
+
+    Example:
+        >>> soups, stats = scrape_cities({'hyderabad': hyderabad_link, 'bangalore': bangalore_link})
+    """
+    if not links:
+        return {}, pd.DataFrame(columns=['city', 'cards', 'pages', 'wall_time', 'pages_per_second'])
+
+    def scrape(pool, city, link):
+        start = time.perf_counter()
+        try:
+            with pool.driver() as driver:
+                driver.get(link)
+                pages = scroll_until_loaded(driver, expected_cards=expected_cards, idle_timeout=idle_timeout) + 1
+                soup = BeautifulSoup(driver.page_source, 'lxml')
+        except Exception as e:
+            print(f"[General Error] {city} : {e}")
+            return city, None, {'city': city, 'cards': 0, 'pages': 0, 'wall_time': time.perf_counter() - start}
+        wall_time = time.perf_counter() - start
+        cards = len(soup.find_all('a', 'styles_carCardWrapper__sXLIp'))
+        return city, soup, {'city': city, 'cards': cards, 'pages': pages, 'wall_time': wall_time}
+
+    total_start = time.perf_counter()
+    with DriverPool(size=min(pool_size, len(links)), headless=headless) as pool:
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            results = list(executor.map(lambda item: scrape(pool, *item), links.items()))
+
+    soups = {city: soup for city, soup, _ in results}
+    stats = pd.DataFrame([row for _, _, row in results])
+    stats['pages_per_second'] = (stats['pages'] / stats['wall_time']).round(2)
+    stats['wall_time'] = stats['wall_time'].round(2)
+    print(stats.to_string(index=False))
+    print(f"Total Wall Time : {time.perf_counter() - total_start:.2f}s")
+    return soups, stats
+
 def get_car_details(soup):
     """
     Extract car details from a BeautifulSoup object containing HTML content of a car listing page.
@@ -120,6 +312,96 @@ def get_car_details(soup):
                        'transmission':transmission,'owner':owner,'price':price,'link':link})
     return df
 
+CARD_XPATH = '//a[contains(concat(" ", normalize-space(@class), " "), " styles_carCardWrapper__sXLIp ")]'
+
+def parse_car_cards(html):
+    """
+    Extract car details from the HTML of a car listing page, visiting each car card only once.
+
+    Unlike get_car_details, every field is read from inside its own card (styles_carCardWrapper__sXLIp),
+    so a card with a missing field yields None for that field instead of shifting the other columns.
+
+    Parameters:
+        html (str or bytes): HTML content of a car listing page.
+
+    Yields:
+        dict: One row per car card with model_name, km_driven, fuel_type, transmission, owner, price and link.
+
+    Example:
+        >>> rows = list(parse_car_cards(driver.page_source))
+        >>> rows[0]['model_name']
+        '2016 Maruti Wagon R 1.0'
+    """
+    tree = lxml_html.fromstring(html)
+    for card in tree.xpath(CARD_XPATH):
+        names = [text for text in card.xpath('.//span[@class="sc-braxZu kjFjan"]/text()') if text.startswith('2')]
+        specs = card.xpath('.//p[@class="sc-braxZu kvfdZL"]')
+        specs = [spec.text_content() for spec in specs[:4]] + [None] * (4 - min(len(specs), 4))
+        prices = card.xpath('.//p[@class="sc-braxZu cyPhJl"]')
+        yield {
+            'model_name': names[0] if names else None,
+            'km_driven': specs[0],
+            'fuel_type': specs[1],
+            'transmission': specs[2],
+            'owner': specs[3],
+            'price': prices[0].text_content() if prices else None,
+            'link': card.get('href')
+        }
+
+def stream_car_details(paths):
+    """
+    Streams car details from many saved listing pages, one card at a time.
+
+    Only one page is held in memory at once, so it can run over an archive of saved HTML files.
+
+    Parameters:
+        paths (iterable of str): Paths to saved HTML files of car listing pages.
+
+    Yields:
+        dict: One row per car card, as returned by parse_car_cards.
+
+    Example:
+        >>> df = pd.DataFrame(stream_car_details(glob.glob('pages/*.html')))
+    """
+    for path in paths:
+        with open(path, 'rb') as f:
+            yield from parse_car_cards(f.read())
+
+def benchmark_car_parsers(paths, repeat=3):
+    """
+    Benchmarks parse_car_cards against get_car_details on saved listing pages.
+
+    Parameters:
+        paths (list of str): Paths to saved HTML files of car listing pages.
+        repeat (int): Number of times each page is parsed by each parser (best time is kept).
+
+    Returns:
+        pd.DataFrame: Per-page rows parsed and best time (in ms) of each parser, with the speedup.
+
+    Example:
+        >>> benchmark_car_parsers(['tests/fixtures/listing_pages/hyderabad.html'], repeat=20)
+    """
+    results = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            html = f.read()
+        timings = {}
+        for name, parser in [('get_car_details', lambda: get_car_details(BeautifulSoup(html, 'lxml'))),
+                             ('parse_car_cards', lambda: pd.DataFrame(parse_car_cards(html)))]:
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                df = parser()
+                best = min(best, time.perf_counter() - start)
+            timings[name] = (len(df), best * 1000)
+        results.append({'page': path,
+                        'rows_get_car_details': timings['get_car_details'][0],
+                        'rows_parse_car_cards': timings['parse_car_cards'][0],
+                        'get_car_details_ms': round(timings['get_car_details'][1], 2),
+                        'parse_car_cards_ms': round(timings['parse_car_cards'][1], 2),
+                        'speedup': round(timings['get_car_details'][1] / timings['parse_car_cards'][1], 2)})
+    return pd.DataFrame(results)
+
 def get_engine_capacity(urls):
     """
     Extract engine capacity values from a list of car listing page URLs.
@@ -145,4 +427,201 @@ def get_engine_capacity(urls):
                 
         if not found:
             engine_capacity.append(None)
-    return engine_capacity
\ No newline at end of file
+    return engine_capacity
+
+def parse_engine_capacity(html):
+    """
+    Extract the engine capacity value from the HTML of a single car listing page.
+
+    Parameters:
+        html (str): HTML content of an individual car listing page.
+
+    Returns:
+        str: Engine capacity value (like '1197cc'), or None if it is not found.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    for i in soup.find_all('p', attrs={"class":"sc-braxZu jjIUAi"}):
+        if i.text.strip() == 'Engine capacity':
+            return i.find_next_sibling().text
+    return None
+
+class HostRateLimiter:
+    """
+    Thread-safe politeness limiter that spaces out requests to the same host.
+
+    Parameters:
+        requests_per_second (float): Maximum request rate allowed per host.
+    """
+    def __init__(self, requests_per_second):
+        self.interval = 1 / requests_per_second if requests_per_second > 0 else 0
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def create_session(pool_size=8, retries=3, backoff_factor=0.5):
+    """
+    Creates a requests Session with keep-alive connection pooling and retries with exponential backoff.
+
+    Parameters:
+        pool_size (int): Number of connections kept alive per host.
+        retries (int): Number of retries for connection errors and 429/5xx responses.
+        backoff_factor (float): Base delay (in seconds) of the exponential backoff between retries.
+
+    Returns:
+        requests.Session: Session ready to be shared between worker threads.
+    """
+    retry = Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=[429, 500, 502, 503, 504],
+                  allowed_methods=["GET"], respect_retry_after_header=True)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.headers.update({"User-Agent":"Mozilla/5.0"})
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def get_engine_capacity_concurrent(urls, max_workers=8, requests_per_second=4.0, retries=3, backoff_factor=0.5, timeout=8):
+    """
+    Extract engine capacity values from a list of car listing page URLs, fetching several pages at once.
+
+    Pages are downloaded by a bounded pool of threads sharing one keep-alive Session,
+    failed requests are retried with exponential backoff and requests to the same host
+    are spaced out to respect the politeness rate.
+
+    Parameters:
+        urls (list of str): List of URLs pointing to individual car listings.
+        max_workers (int): Maximum number of pages fetched concurrently.
+        requests_per_second (float): Maximum request rate per host (0 disables the limit).
+        retries (int): Number of retries for connection errors and 429/5xx responses.
+        backoff_factor (float): Base delay (in seconds) of the exponential backoff between retries.
+        timeout (float): Timeout (in seconds) of each request.
+
+    Returns:
+        list: A list containing engine capacity values (str) in the same order as urls.
+              Returns None for entries where engine capacity is not found or the page could not be fetched.
+
+    Example:
+        >>> get_engine_capacity_concurrent(df['link'].tolist(), max_workers=16, requests_per_second=8)
+        ['998cc', '796cc', None, ...]
+    """
+    session = create_session(pool_size=max_workers, retries=retries, backoff_factor=backoff_factor)
+    limiter = HostRateLimiter(requests_per_second)
+
+    def fetch(url):
+        try:
+            limiter.wait(url)
+            response = session.get(url, timeout=timeout)
+            response.raise_for_status()
+            return parse_engine_capacity(response.text)
+        except requests.RequestException as e:
+            print(f"[Request Error] {url} : {e}")
+            return None
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, urls))
+    finally:
+        session.close()
+
+def get_engine_capacity_incremental(urls, cache, fresh_for_days=1, max_age_days=30, max_workers=8,
+                                    requests_per_second=4.0, retries=3, backoff_factor=0.5, timeout=8):
+    """
+    Extract engine capacity values from car listing page URLs, downloading only new or changed listings.
+
+    Each URL is looked up in a persistent PageCache first ↓
+        - Fetched within fresh_for_days : the cached engine capacity is used without any request.
+        - Older : the page is revalidated with If-None-Match / If-Modified-Since, a 304 reuses the cached value.
+        - Not cached or changed : the page is downloaded, parsed and stored in the cache.
+    Entries not validated within max_age_days are evicted before the crawl, and the cache hit rate is printed after it.
+
+    Parameters:
+        urls (list of str): List of URLs pointing to individual car listings.
+        cache (PageCache): Persistent page cache (see page_cache module).
+        fresh_for_days (float): Age (in days) under which a cached page is used without revalidation.
+        max_age_days (float): Age (in days) after which cached pages are evicted.
+        max_workers (int): Maximum number of pages fetched concurrently.
+        requests_per_second (float): Maximum request rate per host (0 disables the limit).
+        retries (int): Number of retries for connection errors and 429/5xx responses.
+        backoff_factor (float): Base delay (in seconds) of the exponential backoff between retries.
+        timeout (float): Timeout (in seconds) of each request.
+
+    Returns:
+        list: A list containing engine capacity values (str) in the same order as urls.
+              Returns None for entries where engine capacity is not found or the page could not be fetched.
+    """
+    cache.evict(max_age_days * 86400)
+    cache.reset_stats()
+    fresh_for = fresh_for_days * 86400
+    session = create_session(pool_size=max_workers, retries=retries, backoff_factor=backoff_factor)
+    limiter = HostRateLimiter(requests_per_second)
+
+    def fetch(url):
+        entry = cache.get(url)
+        if entry is not None and time.time() - entry['fetched_at'] < fresh_for:
+            cache.record('fresh')
+            return entry['parsed'].get('engine_capacity')
+
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        try:
+            limiter.wait(url)
+            response = session.get(url, headers=headers, timeout=timeout)
+            if response.status_code == 304 and entry is not None:
+                cache.touch(url)
+                cache.record('revalidated')
+                return entry['parsed'].get('engine_capacity')
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"[Request Error] {url} : {e}")
+            cache.record('failed')
+            return entry['parsed'].get('engine_capacity') if entry is not None else None
+
+        engine_capacity = parse_engine_capacity(response.text)
+        cache.put(url, response.text, parsed={'engine_capacity': engine_capacity},
+                  etag=response.headers.get('ETag'), last_modified=response.headers.get('Last-Modified'))
+        cache.record('changed' if entry is not None else 'new')
+        return engine_capacity
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            engine_capacity = list(executor.map(fetch, urls))
+    finally:
+        session.close()
+
+    stats = cache.stats()
+    print(f"Cache Hit Rate : {stats['hit_rate']:.1%} ({stats['fresh']} fresh, {stats['revalidated']} revalidated, "
+          f"{stats['changed']} changed, {stats['new']} new, {stats['failed']} failed)")
+    return engine_capacity
+
+def merge_scraped_data(existing, scraped, cache, **kwargs):
+    """
+    Merges a new crawl into the existing dataset, fetching engine capacity only for new or changed listings.
+
+    Parameters:
+        existing (pd.DataFrame): Existing dataset (like scrape_data.csv) with a 'link' column.
+        scraped (pd.DataFrame): Freshly scraped listings (from get_car_details or parse_car_cards).
+        cache (PageCache): Persistent page cache (see page_cache module).
+        **kwargs: Extra arguments passed to get_engine_capacity_incremental.
+
+    Returns:
+        pd.DataFrame: Existing and new listings combined, one row per link (the latest crawl wins).
+
+    Example:
+        >>> df = merge_scraped_data(load_csv('scrape_data', 'scrape_data.csv'), new_listings, PageCache('../scrape_cache'))
+    """
+    scraped = scraped.copy()
+    scraped['engine_capacity'] = get_engine_capacity_incremental(scraped['link'].tolist(), cache, **kwargs)
+    merged = pd.concat([existing, scraped], ignore_index=True)
+    merged = merged.drop_duplicates(subset='link', keep='last').reset_index(drop=True)
+    return merged